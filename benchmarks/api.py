@@ -0,0 +1,273 @@
+"""
+Suite de benchmarks de las rutas más usadas de la API.
+
+Siembra datos con volúmenes realistas (benchmarks.datos) y mide latencia (media, p50,
+p99) y throughput de un cliente secuencial para: login, listado (completo y filtrado) y
+creación de proyectos, lista combinada de catálogos (en caché y sin caché) y listado de
+usuarios.
+
+Dos modos:
+
+- Sin servidor (por defecto): usa el cliente de pruebas de Django sobre un archivo
+  SQLite temporal, o sobre PostgreSQL local si se definen las variables BENCH_DB_* (ver
+  benchmarks.entorno.base_datos_benchmark).
+- --servidor URL: envía solicitudes HTTP a un servidor local (runserver, gunicorn o
+  uvicorn). Los datos se siembran en la base de datos de los settings del proyecto, la
+  misma que usa el servidor; conviene arrancarlo con LOGIN_IP_RATE alto para que el
+  límite de intentos de login no afecte la medición.
+
+Los resultados se guardan en JSON (--salida) junto con el commit, las versiones y el
+volumen de datos, y se pueden comparar con una ejecución anterior (--comparar).
+
+Uso: python -m benchmarks.api [--proyectos N] [--repeticiones N] [--salida archivo.json]
+     [--comparar anterior.json] [--servidor http://127.0.0.1:8000]
+"""
+
+import argparse
+import json
+import os
+import platform
+import subprocess
+import sys
+import tempfile
+import urllib.error
+import urllib.request
+from datetime import datetime, timezone
+from itertools import count
+
+from benchmarks.entorno import (
+    BASE_DIR,
+    base_datos_benchmark,
+    imprimir_tabla,
+    medir,
+    preparar_django,
+)
+
+
+class ClienteLocal:
+    """
+    Solicitudes en el mismo proceso con django.test.Client.
+    """
+
+    def __init__(self):
+        from django.test import Client
+
+        self.client = Client()
+
+    def solicitar(self, metodo, ruta, datos=None, token=None):
+        encabezados = {"HTTP_AUTHORIZATION": f"Bearer {token}"} if token else {}
+        if metodo == "GET":
+            response = self.client.get(ruta, **encabezados)
+        else:
+            response = self.client.post(
+                ruta, json.dumps(datos), content_type="application/json", **encabezados
+            )
+        return response.status_code, response.content
+
+
+class ClienteHTTP:
+    """
+    Solicitudes HTTP a un servidor en ejecución con urllib.
+    """
+
+    def __init__(self, url_base):
+        self.url_base = url_base.rstrip("/")
+
+    def solicitar(self, metodo, ruta, datos=None, token=None):
+        encabezados = {"Content-Type": "application/json"}
+        if token:
+            encabezados["Authorization"] = f"Bearer {token}"
+        cuerpo = json.dumps(datos).encode() if datos is not None else None
+        request = urllib.request.Request(
+            self.url_base + ruta, data=cuerpo, headers=encabezados, method=metodo
+        )
+        try:
+            with urllib.request.urlopen(request) as response:
+                return response.status, response.read()
+        except urllib.error.HTTPError as exc:
+            return exc.code, exc.read()
+
+
+def commit_actual():
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            cwd=BASE_DIR,
+            capture_output=True,
+            text=True,
+            check=True,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def casos_api(cliente, token, catalogos, local):
+    """
+    Devuelve ``{caso: (funcion, factor_repeticiones)}``. Cada función hace una solicitud
+    y falla si la respuesta no tiene el código esperado.
+    """
+    from django.core.cache import cache
+
+    from benchmarks.datos import CONTRASENA_BENCHMARK, USUARIO_BENCHMARK
+
+    nombres = count()
+
+    def solicitud(metodo, ruta, esperado, datos=None, con_token=True):
+        def ejecutar():
+            codigo, contenido = cliente.solicitar(
+                metodo,
+                ruta,
+                datos() if callable(datos) else datos,
+                token if con_token else None,
+            )
+            if codigo != esperado:
+                raise RuntimeError(f"{metodo} {ruta}: {codigo} {contenido[:200]!r}")
+
+        return ejecutar
+
+    def proyecto_nuevo():
+        return {
+            **catalogos,
+            "nombre": f"Benchmark {os.getpid()} {next(nombres)}",
+            "tarea_tw": "https://example.com/tarea",
+            "desarrollador": "Benchmark",
+        }
+
+    lista_combinada = solicitud("GET", "/api/lista-combinada/", 200)
+
+    def lista_combinada_sin_cache():
+        cache.clear()
+        lista_combinada()
+
+    casos = {
+        # El login está dominado por el hash de la contraseña: se repite menos.
+        "login": (
+            solicitud(
+                "POST",
+                "/api/login/",
+                200,
+                {"username": USUARIO_BENCHMARK, "password": CONTRASENA_BENCHMARK},
+                con_token=False,
+            ),
+            0.01,
+        ),
+        "proyectos_listar": (solicitud("GET", "/api/proyectos/", 200), 1),
+        "proyectos_filtrar_linea": (
+            solicitud("GET", f"/api/proyectos/?linea={catalogos['linea']}", 200),
+            1,
+        ),
+        "proyectos_crear": (solicitud("POST", "/api/proyectos/", 201, proyecto_nuevo), 1),
+        "lista_combinada": (lista_combinada, 1),
+        "usuarios_listar": (solicitud("GET", "/api/usuarios/", 200), 1),
+    }
+    if local:
+        # Fuera del proceso del servidor no se puede vaciar su caché.
+        casos["lista_combinada_sin_cache"] = (lista_combinada_sin_cache, 1)
+    return casos
+
+
+def comparar(resultados, anterior):
+    """
+    Imprime la variación de la media y el p99 respecto de una ejecución anterior.
+    """
+    print(f"\nComparación con {anterior.get('commit')} ({anterior.get('fecha')})")
+    print(f"{'caso':<28}  {'media':>9}  {'p99':>9}")
+    for caso, datos in resultados["casos"].items():
+        previo = anterior["casos"].get(caso)
+        if not previo:
+            continue
+        media = (datos["media_ms"] / previo["media_ms"] - 1) * 100
+        p99 = (datos["p99_ms"] / previo["p99_ms"] - 1) * 100
+        print(f"{caso:<28}  {media:>+8.1f}%  {p99:>+8.1f}%")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--proyectos", type=int, default=5000)
+    parser.add_argument("--usuarios", type=int, default=200)
+    parser.add_argument("--catalogo", type=int, default=50)
+    parser.add_argument("--repeticiones", type=int, default=500)
+    parser.add_argument("--servidor", help="URL base de un servidor local")
+    parser.add_argument("--salida", help="Archivo JSON donde guardar los resultados")
+    parser.add_argument("--comparar", help="Resultados JSON de una ejecución anterior")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as directorio:
+        import django
+
+        if args.servidor:
+            sys.path.insert(0, str(BASE_DIR))
+            os.environ.setdefault("DJANGO_SETTINGS_MODULE", "project_planner.settings")
+            django.setup()
+        else:
+            preparar_django(base_datos=base_datos_benchmark(directorio))
+
+        from django.conf import settings
+        from django.db import connection
+        from django.test import override_settings
+
+        from benchmarks.datos import sembrar
+        from configuracion.models import Cliente, Linea, Proceso, Tipo
+        from usuarios_app.autenticacion import agregar_claims_usuario
+        from rest_framework_simplejwt.tokens import RefreshToken
+
+        admin = sembrar(args.proyectos, args.usuarios, args.catalogo)
+        token = str(agregar_claims_usuario(RefreshToken.for_user(admin), admin).access_token)
+        catalogos = {
+            campo: str(modelo.objects.filter(estado=True).values_list("pk", flat=True)[0])
+            for campo, modelo in (
+                ("proceso", Proceso),
+                ("linea", Linea),
+                ("tipo", Tipo),
+                ("cliente", Cliente),
+            )
+        }
+
+        ajustes = {}
+        if args.servidor:
+            cliente = ClienteHTTP(args.servidor)
+        else:
+            cliente = ClienteLocal()
+            ajustes = {
+                "ALLOWED_HOSTS": ["testserver"],
+                "REST_FRAMEWORK": {
+                    **settings.REST_FRAMEWORK,
+                    "DEFAULT_THROTTLE_RATES": {"login_ip": "1000000/min"},
+                },
+            }
+
+        with override_settings(**ajustes):
+            casos = casos_api(cliente, token, catalogos, local=not args.servidor)
+            estadisticas = {}
+            for caso, (funcion, factor) in casos.items():
+                repeticiones = max(5, int(args.repeticiones * factor))
+                datos = medir(funcion, repeticiones, calentamiento=min(50, repeticiones))
+                datos["solicitudes_por_segundo"] = round(1000 / datos["media_ms"], 1)
+                estadisticas[caso] = datos
+
+        resultados = {
+            "commit": commit_actual(),
+            "fecha": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+            "modo": args.servidor or "cliente de pruebas",
+            "base_datos": connection.vendor,
+            "python": platform.python_version(),
+            "django": django.get_version(),
+            "volumen": {
+                "proyectos": args.proyectos,
+                "usuarios": args.usuarios,
+                "catalogo": args.catalogo,
+            },
+            "casos": estadisticas,
+        }
+
+    imprimir_tabla(estadisticas)
+    if args.salida:
+        with open(args.salida, "w", encoding="utf-8") as archivo:
+            json.dump(resultados, archivo, indent=2)
+    if args.comparar:
+        with open(args.comparar, encoding="utf-8") as archivo:
+            comparar(resultados, json.load(archivo))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,66 @@
+"""
+Tiempo de arranque en frío por perfil de settings.
+
+Para cada perfil lanza procesos nuevos de Python que importan la aplicación WSGI (carga
+de settings, apps, modelos, URLs y middleware) y reporta el tiempo de esa importación y
+el del proceso completo, incluido el arranque del intérprete.
+
+Uso: python -m benchmarks.arranque [--repeticiones N]
+"""
+
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+import time
+
+from benchmarks.entorno import BASE_DIR
+
+PERFILES = {
+    "dev": {"DJANGO_ENV": "dev"},
+    "prod": {"DJANGO_ENV": "prod"},
+    "prod sin admin": {"DJANGO_ENV": "prod", "DJANGO_ADMIN": "0"},
+    "test": {"DJANGO_ENV": "test"},
+}
+
+CODIGO = """
+import time
+inicio = time.perf_counter()
+from project_planner.wsgi import application
+from django.urls import get_resolver
+get_resolver().url_patterns
+print((time.perf_counter() - inicio) * 1000)
+"""
+
+
+def arrancar(variables):
+    entorno = {**os.environ, **variables}
+    entorno.pop("DJANGO_SETTINGS_MODULE", None)
+    inicio = time.perf_counter()
+    salida = subprocess.run(
+        [sys.executable, "-c", CODIGO],
+        cwd=BASE_DIR,
+        env=entorno,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    return float(salida.stdout.strip()), (time.perf_counter() - inicio) * 1000
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--repeticiones", type=int, default=10)
+    args = parser.parse_args()
+
+    print(f"{'perfil':<16}  {'importacion_ms':>14}  {'proceso_ms':>10}")
+    for perfil, variables in PERFILES.items():
+        tiempos = [arrancar(variables) for _ in range(args.repeticiones)]
+        importacion = statistics.median(t[0] for t in tiempos)
+        proceso = statistics.median(t[1] for t in tiempos)
+        print(f"{perfil:<16}  {importacion:>14.1f}  {proceso:>10.1f}")
+
+
+if __name__ == "__main__":
+    main()
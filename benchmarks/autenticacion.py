@@ -0,0 +1,90 @@
+"""
+Costo de autenticación por solicitud.
+
+Compara los autenticadores de DRF sobre solicitudes construidas con APIRequestFactory:
+
+- JWT con consulta del usuario (MedidaJWTAuthentication).
+- JWT con claims (ClaimsJWTAuthentication) y su respaldo en caché para tokens sin claims.
+- Solicitudes anónimas y con token inválido con la cadena anterior (JWT + Token) y con un
+  único autenticador.
+
+Uso: python -m benchmarks.autenticacion [--repeticiones N]
+"""
+
+import argparse
+
+from benchmarks.entorno import imprimir_tabla, medir, preparar_django
+
+
+def autenticar(autenticadores, request_factory):
+    """
+    Recorre los autenticadores como lo hace rest_framework.request.Request._authenticate.
+    """
+    from rest_framework.exceptions import APIException
+    from rest_framework.request import Request
+
+    request = Request(request_factory())
+    for autenticador in autenticadores:
+        try:
+            if autenticador.authenticate(request) is not None:
+                return
+        except APIException:
+            return
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--repeticiones", type=int, default=2000)
+    args = parser.parse_args()
+
+    preparar_django()
+
+    from rest_framework.authentication import TokenAuthentication
+    from rest_framework.test import APIRequestFactory
+    from rest_framework_simplejwt.tokens import RefreshToken
+    from usuarios_app.autenticacion import (
+        ClaimsJWTAuthentication,
+        MedidaJWTAuthentication,
+        agregar_claims_usuario,
+    )
+    from usuarios_app.models import Usuario
+
+    usuario = Usuario.objects.create_user(
+        email="bench@example.com", username="bench", password="x", rol="Admin"
+    )
+    token_simple = str(RefreshToken.for_user(usuario).access_token)
+    token_claims = str(
+        agregar_claims_usuario(RefreshToken.for_user(usuario), usuario).access_token
+    )
+
+    factory = APIRequestFactory()
+
+    def con_token(token):
+        return lambda: factory.get("/api/proyectos/", HTTP_AUTHORIZATION=f"Bearer {token}")
+
+    def anonima():
+        return factory.get("/api/proyectos/")
+
+    jwt = MedidaJWTAuthentication()
+    claims = ClaimsJWTAuthentication()
+    cadena_anterior = [jwt, TokenAuthentication()]
+
+    casos = {
+        "jwt_consulta_usuario": ([jwt], con_token(token_simple)),
+        "jwt_claims": ([claims], con_token(token_claims)),
+        "jwt_claims_respaldo_cache": ([claims], con_token(token_simple)),
+        "anonima_jwt+token": (cadena_anterior, anonima),
+        "anonima_un_autenticador": ([jwt], anonima),
+        "token_invalido_jwt+token": (cadena_anterior, con_token("invalido")),
+        "token_invalido_un_autenticador": ([jwt], con_token("invalido")),
+        "sin_autenticacion (referencia)": ([], anonima),
+    }
+    resultados = {
+        caso: medir(lambda: autenticar(autenticadores, fabrica), args.repeticiones)
+        for caso, (autenticadores, fabrica) in casos.items()
+    }
+    imprimir_tabla(resultados)
+
+
+if __name__ == "__main__":
+    main()
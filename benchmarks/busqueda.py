@@ -0,0 +1,85 @@
+"""
+Latencia de la búsqueda para autocompletar sobre proyectos y usuarios.
+
+Siembra --proyectos proyectos y --usuarios usuarios (sin trazabilidad) y mide las
+acciones /api/proyectos/buscar/ y /api/usuarios/buscar/ de principio a fin con el
+cliente de pruebas, para consultas selectivas (pocas coincidencias) y amplias (miles de
+coincidencias que hay que ordenar por relevancia). Como referencia se mide también un
+filtro icontains sobre las mismas columnas, que recorre la tabla completa.
+
+Usa un archivo SQLite temporal (tabla FTS5) o PostgreSQL (índices de trigramas) si se
+definen las variables BENCH_DB_* (ver benchmarks.entorno.base_datos_benchmark).
+
+Uso: python -m benchmarks.busqueda [--proyectos N] [--usuarios N] [--repeticiones N]
+"""
+
+import argparse
+import tempfile
+
+from benchmarks.entorno import (
+    base_datos_benchmark,
+    imprimir_tabla,
+    medir,
+    preparar_django,
+)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--proyectos", type=int, default=100_000)
+    parser.add_argument("--usuarios", type=int, default=100_000)
+    parser.add_argument("--repeticiones", type=int, default=200)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as directorio:
+        preparar_django(base_datos=base_datos_benchmark(directorio))
+
+        from django.db.models import Q
+        from django.test import override_settings
+
+        from benchmarks.api import ClienteLocal
+        from benchmarks.datos import sembrar
+        from proyectos.models import Proyecto
+        from usuarios_app.autenticacion import agregar_claims_usuario
+        from rest_framework_simplejwt.tokens import RefreshToken
+
+        admin = sembrar(args.proyectos, args.usuarios, catalogo=10, trazabilidad=False)
+        token = str(agregar_claims_usuario(RefreshToken.for_user(admin), admin).access_token)
+        cliente = ClienteLocal()
+
+        def buscar(ruta, texto):
+            def ejecutar():
+                codigo, contenido = cliente.solicitar(
+                    "GET", f"{ruta}?q={texto}", token=token
+                )
+                if codigo != 200:
+                    raise RuntimeError(f"{ruta} {texto}: {codigo} {contenido[:200]!r}")
+
+            return ejecutar
+
+        def icontains(texto):
+            filtro = Q(nombre__icontains=texto) | Q(desarrollador__icontains=texto)
+            return lambda: list(Proyecto.objects.filter(filtro).values("id", "nombre")[:20])
+
+        casos = {
+            # Proyecto 012345: una coincidencia.
+            "proyectos_selectiva": buscar("/api/proyectos/buscar/", "012345"),
+            # Proyecto 0123xx: cien coincidencias.
+            "proyectos_prefijo": buscar("/api/proyectos/buscar/", "Proyecto%200123"),
+            # Desarrollador 3, 30..39: once de cada cuarenta proyectos.
+            "proyectos_amplia": buscar("/api/proyectos/buscar/", "Desarrollador%203"),
+            "usuarios_email": buscar("/api/usuarios/buscar/", "usuario4321@"),
+            "usuarios_amplia": buscar("/api/usuarios/buscar/", "Apellido%209"),
+            "icontains_selectiva": icontains("012345"),
+        }
+        with override_settings(ALLOWED_HOSTS=["testserver"]):
+            resultados = {
+                caso: medir(funcion, args.repeticiones, calentamiento=10)
+                for caso, funcion in casos.items()
+            }
+
+    imprimir_tabla(resultados)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,87 @@
+"""
+Prueba de carga HTTP contra un servidor en ejecución.
+
+Envía solicitudes GET concurrentes a una o varias rutas y reporta throughput y latencias
+p50/p99. Sirve para comparar el mismo endpoint servido por WSGI (gunicorn) y por ASGI
+(uvicorn), por ejemplo:
+
+    gunicorn project_planner.wsgi:application -w 4 -b 127.0.0.1:8001
+    uvicorn project_planner.asgi:application --workers 4 --port 8002
+
+    python -m benchmarks.carga_http --token $TOKEN \\
+        http://127.0.0.1:8001/api/lista-combinada/ \\
+        http://127.0.0.1:8002/api/lista-combinada/async/
+
+Solo usa la biblioteca estándar.
+"""
+
+import argparse
+import json
+import time
+import urllib.error
+import urllib.request
+from concurrent.futures import ThreadPoolExecutor
+
+
+def percentil(valores, p):
+    return valores[min(len(valores) - 1, int(len(valores) * p))]
+
+
+def cargar(url, token, solicitudes, concurrencia):
+    """
+    Ejecuta ``solicitudes`` GET contra ``url`` con ``concurrencia`` hilos.
+    """
+    headers = {"Authorization": f"Bearer {token}"} if token else {}
+
+    def una_solicitud(_):
+        inicio = time.perf_counter()
+        try:
+            with urllib.request.urlopen(urllib.request.Request(url, headers=headers)) as r:
+                r.read()
+                codigo = r.status
+        except urllib.error.HTTPError as exc:
+            codigo = exc.code
+        return (time.perf_counter() - inicio) * 1000, codigo
+
+    inicio = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=concurrencia) as executor:
+        resultados = list(executor.map(una_solicitud, range(solicitudes)))
+    total = time.perf_counter() - inicio
+
+    tiempos = sorted(tiempo for tiempo, _ in resultados)
+    errores = sum(1 for _, codigo in resultados if codigo >= 400)
+    return {
+        "url": url,
+        "solicitudes": solicitudes,
+        "concurrencia": concurrencia,
+        "errores": errores,
+        "solicitudes_por_segundo": round(solicitudes / total, 1),
+        "p50_ms": round(percentil(tiempos, 0.50), 2),
+        "p99_ms": round(percentil(tiempos, 0.99), 2),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("urls", nargs="+")
+    parser.add_argument("--token", help="JWT de acceso (cabecera Authorization: Bearer)")
+    parser.add_argument("--solicitudes", type=int, default=2000)
+    parser.add_argument("--concurrencia", type=int, default=32)
+    parser.add_argument("--json", action="store_true", help="Imprime los resultados en JSON")
+    args = parser.parse_args()
+
+    resultados = [
+        cargar(url, args.token, args.solicitudes, args.concurrencia) for url in args.urls
+    ]
+    if args.json:
+        print(json.dumps(resultados, indent=2))
+        return
+    for r in resultados:
+        print(
+            f"{r['url']}\n  {r['solicitudes_por_segundo']} req/s  "
+            f"p50 {r['p50_ms']} ms  p99 {r['p99_ms']} ms  errores {r['errores']}"
+        )
+
+
+if __name__ == "__main__":
+    main()
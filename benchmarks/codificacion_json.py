@@ -0,0 +1,107 @@
+"""
+Codificación y decodificación JSON: JSONRenderer/JSONParser de DRF frente a
+JSONRapidoRenderer/JSONRapidoParser (orjson).
+
+Renderiza páginas de --pagina proyectos (salida de ProyectoLecturaSerializer, con UUID y
+fechas) y de usuarios (UsuarioSerializer), y una respuesta con valores Decimal como los
+de trazabilidad; decodifica un cuerpo de importación de --pagina proyectos. Comprueba que
+ambos renderers producen los mismos bytes e imprime la latencia, los MB/s y los objetos
+por segundo.
+
+Uso: python -m benchmarks.codificacion_json [--pagina N] [--repeticiones N]
+"""
+
+import argparse
+import io
+import tempfile
+from decimal import Decimal
+
+from benchmarks.entorno import (
+    base_datos_benchmark,
+    imprimir_tabla,
+    medir,
+    preparar_django,
+)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--pagina", type=int, default=500)
+    parser.add_argument("--repeticiones", type=int, default=300)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as directorio:
+        preparar_django(base_datos=base_datos_benchmark(directorio))
+
+        from rest_framework.parsers import JSONParser
+        from rest_framework.renderers import JSONRenderer
+
+        from benchmarks.datos import sembrar
+        from project_planner.parsers import JSONRapidoParser
+        from project_planner.renderers import JSONRapidoRenderer, orjson
+        from proyectos.models import Proyecto
+        from proyectos.serializers import ProyectoLecturaSerializer
+        from usuarios_app.models import Usuario
+        from usuarios_app.serializers import UsuarioSerializer
+
+        if orjson is None:
+            print("orjson no está instalado: JSONRapidoRenderer usa JSONRenderer.")
+
+        sembrar(args.pagina, usuarios=args.pagina, catalogo=10, trazabilidad=False)
+        lectura = ProyectoLecturaSerializer()
+        proyectos = lectura.serializar(
+            Proyecto.objects.values(*lectura.columnas())[: args.pagina]
+        )
+        usuarios = UsuarioSerializer(Usuario.objects.all()[: args.pagina], many=True).data
+        horas = [
+            {
+                "proyecto": fila["id"],
+                "horas_estimadas": Decimal(i) / 4,
+                "horas_reales": Decimal(i) / 3,
+                "fecha": fila["fecha_creacion"],
+            }
+            for i, fila in enumerate(proyectos)
+        ]
+        cuerpos = {"proyectos": proyectos, "usuarios": usuarios, "horas_decimal": horas}
+
+        resultados = {}
+        tamanos = {}
+        for nombre, datos in cuerpos.items():
+            drf = JSONRenderer().render(datos)
+            rapido = JSONRapidoRenderer().render(datos)
+            if drf != rapido:
+                raise RuntimeError(f"{nombre}: los renderers producen bytes distintos")
+            for renderer in (JSONRenderer(), JSONRapidoRenderer()):
+                caso = f"render_{nombre}_{type(renderer).__name__}"
+                resultados[caso] = medir(
+                    lambda: renderer.render(datos), args.repeticiones, calentamiento=10
+                )
+                tamanos[caso] = len(drf)
+
+        importacion = JSONRenderer().render(
+            [
+                {campo: fila[campo] for campo in ("proceso", "linea", "tipo", "nombre")}
+                for fila in proyectos
+            ]
+        )
+        for parser_json in (JSONParser(), JSONRapidoParser()):
+            caso = f"parse_importacion_{type(parser_json).__name__}"
+            resultados[caso] = medir(
+                lambda: parser_json.parse(io.BytesIO(importacion)),
+                args.repeticiones,
+                calentamiento=10,
+            )
+            tamanos[caso] = len(importacion)
+
+    imprimir_tabla(resultados)
+    print(f"\nThroughput (cuerpos de {args.pagina} objetos):")
+    for caso, datos in resultados.items():
+        segundos = datos["media_ms"] / 1000
+        print(
+            f"{caso:<48}  {tamanos[caso] / segundos / 1e6:>8.1f} MB/s  "
+            f"{args.pagina / segundos:>12,.0f} obj/s"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,101 @@
+"""
+Costo de CPU frente a bytes ahorrados de la compresión de respuestas.
+
+Genera cuerpos reales de la API con --proyectos proyectos: una página JSON del listado
+(500 proyectos), el listado completo en JSON y la exportación en CSV y NDJSON. Los
+comprime con gzip y brotli en varios niveles e imprime, por caso, el tiempo de
+compresión, el tamaño resultante, la proporción y los MB/s de entrada. Mide también la
+exportación CSV comprimida en streaming, fila a fila, como la comprime
+CompresionMiddleware.
+
+Uso: python -m benchmarks.compresion [--proyectos N] [--repeticiones N]
+"""
+
+import argparse
+import tempfile
+
+from benchmarks.entorno import base_datos_benchmark, medir, preparar_django
+
+NIVELES = {"gzip": (1, 3, 6, 9), "br": (1, 3, 4, 5, 6, 9, 11)}
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--proyectos", type=int, default=5000)
+    parser.add_argument("--repeticiones", type=int, default=20)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as directorio:
+        preparar_django(base_datos=base_datos_benchmark(directorio))
+
+        from benchmarks.datos import sembrar
+        from project_planner.compresion import (
+            codificaciones_disponibles,
+            comprimir,
+            comprimir_secuencia,
+        )
+        from project_planner.renderers import JSONRapidoRenderer
+        from proyectos.exportacion import exportar_csv, exportar_ndjson
+        from proyectos.models import Proyecto
+        from proyectos.serializers import ProyectoLecturaSerializer
+
+        sembrar(args.proyectos, usuarios=10, catalogo=20)
+        lectura = ProyectoLecturaSerializer()
+        filas = lectura.serializar(
+            Proyecto.objects.order_by("-fecha_creacion").values(*lectura.columnas())
+        )
+        filas_csv = [fila.encode() for fila in exportar_csv(1000)]
+        cuerpos = {
+            "json_pagina_500": JSONRapidoRenderer().render({"results": filas[:500]}),
+            "json_completo": JSONRapidoRenderer().render(filas),
+            "csv_exportacion": b"".join(filas_csv),
+            "ndjson_exportacion": "".join(exportar_ndjson(1000)).encode(),
+        }
+
+        resultados = []
+        for nombre, cuerpo in cuerpos.items():
+            for codificacion in codificaciones_disponibles():
+                for nivel in NIVELES[codificacion]:
+                    tamano = len(comprimir(codificacion, nivel, cuerpo))
+                    datos = medir(
+                        lambda: comprimir(codificacion, nivel, cuerpo),
+                        args.repeticiones,
+                        calentamiento=2,
+                    )
+                    resultados.append(
+                        (nombre, len(cuerpo), f"{codificacion} {nivel}", tamano, datos)
+                    )
+            for codificacion, nivel in (("gzip", 6), ("br", 4)):
+                if codificacion not in codificaciones_disponibles():
+                    continue
+
+                def streaming():
+                    return b"".join(comprimir_secuencia(codificacion, nivel, filas_csv))
+
+                tamano = len(streaming()) if nombre == "csv_exportacion" else None
+                if tamano:
+                    datos = medir(streaming, args.repeticiones, calentamiento=2)
+                    resultados.append(
+                        (
+                            nombre,
+                            len(cuerpo),
+                            f"{codificacion} {nivel} streaming",
+                            tamano,
+                            datos,
+                        )
+                    )
+
+    print(
+        f"{'cuerpo':<20} {'original':>10}  {'codificación':<20} {'comprimido':>10} "
+        f"{'proporción':>10} {'media_ms':>9} {'MB/s':>8}"
+    )
+    for nombre, original, codificacion, tamano, datos in resultados:
+        print(
+            f"{nombre:<20} {original:>10,}  {codificacion:<20} {tamano:>10,} "
+            f"{tamano / original:>10.3f} {datos['media_ms']:>9.2f} "
+            f"{original / datos['media_ms'] / 1000:>8.1f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,64 @@
+"""
+Costo de abrir conexiones a la base de datos por solicitud.
+
+Simula el ciclo de una solicitud (request_started, una consulta, request_finished) con:
+
+- CONN_MAX_AGE=0: una conexión nueva por solicitud (comportamiento anterior).
+- CONN_MAX_AGE=60: conexión persistente.
+- CONN_MAX_AGE=60 con CONN_HEALTH_CHECKS: persistente, verificada antes de reutilizarse.
+
+Por defecto usa un archivo SQLite temporal, donde conectar es barato. Para medir el costo
+real (TCP + TLS + autenticación) se puede apuntar a PostgreSQL con las variables
+BENCH_DB_HOST, BENCH_DB_PORT, BENCH_DB_NAME, BENCH_DB_USER, BENCH_DB_PASSWORD y
+BENCH_DB_SSLMODE.
+
+Uso: python -m benchmarks.conexion_bd [--repeticiones N]
+"""
+
+import argparse
+import tempfile
+
+from benchmarks.entorno import (
+    base_datos_benchmark,
+    imprimir_tabla,
+    medir,
+    preparar_django,
+)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--repeticiones", type=int, default=500)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as directorio:
+        preparar_django(base_datos=base_datos_benchmark(directorio), migrar=False)
+
+        from django.core.signals import request_finished, request_started
+        from django.db import connection
+
+        def solicitud():
+            request_started.send(sender=None)
+            with connection.cursor() as cursor:
+                cursor.execute("SELECT 1")
+                cursor.fetchone()
+            request_finished.send(sender=None)
+
+        casos = {
+            "conexion_por_solicitud": (0, False),
+            "persistente": (60, False),
+            "persistente_con_health_check": (60, True),
+        }
+        resultados = {}
+        for caso, (conn_max_age, health_checks) in casos.items():
+            connection.close()
+            connection.settings_dict["CONN_MAX_AGE"] = conn_max_age
+            connection.settings_dict["CONN_HEALTH_CHECKS"] = health_checks
+            resultados[caso] = medir(solicitud, args.repeticiones)
+        connection.close()
+
+    imprimir_tabla(resultados)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,155 @@
+"""
+Datos de prueba con volúmenes realistas para los benchmarks.
+
+Se insertan con bulk_create (sin señales), por lo que al final se reconstruyen la tabla
+ResumenHorasProyecto y las tablas de búsqueda. Requiere Django inicializado (ver benchmarks.entorno).
+"""
+
+import random
+from datetime import date, timedelta
+from decimal import Decimal
+
+USUARIO_BENCHMARK = "bench"
+CONTRASENA_BENCHMARK = "Clave@123"
+
+
+def sembrar(proyectos=5000, usuarios=200, catalogo=50, semilla=0, trazabilidad=True):
+    """
+    Crea catálogos, usuarios, proyectos y sus registros de trazabilidad.
+
+    Parámetros:
+    - proyectos: Cantidad de proyectos; cada uno recibe una planeación, una estimación,
+      un diseño de casos de prueba y dos ejecuciones.
+    - usuarios: Cantidad de usuarios además del usuario del benchmark.
+    - catalogo: Registros por catálogo (procesos, líneas, clientes y tipos); uno de cada
+      diez queda inactivo.
+    - semilla: Semilla del generador aleatorio, para que los datos sean reproducibles.
+    - trazabilidad: Si es False no se crean los registros de trazabilidad (p. ej. para
+      benchmarks que solo leen proyectos).
+
+    Devuelve el usuario del benchmark (administrador, con la contraseña
+    CONTRASENA_BENCHMARK). Si ya existe no se crea nada.
+    """
+    from django.contrib.auth.hashers import make_password
+    from django.db import transaction
+
+    from configuracion.models import Cliente, Linea, Proceso, Tipo
+    from project_planner.busqueda import INDICES
+    from proyectos.models import Proyecto
+    from trazabilidad.consultas import crear_resumenes_vacios, reconstruir_resumen_horas
+    from trazabilidad.models import DisenoCP, Ejecucion, Estimacion, Planeacion
+    from usuarios_app.models import Usuario
+
+    existente = Usuario.objects.filter(username=USUARIO_BENCHMARK).first()
+    if existente:
+        return existente
+
+    aleatorio = random.Random(semilla)
+    with transaction.atomic():
+        admin = Usuario.objects.create_user(
+            email=f"{USUARIO_BENCHMARK}@example.com",
+            username=USUARIO_BENCHMARK,
+            password=CONTRASENA_BENCHMARK,
+            rol="Administrador",
+            is_staff=True,
+        )
+        contrasena = make_password(CONTRASENA_BENCHMARK)
+        Usuario.objects.bulk_create(
+            Usuario(
+                email=f"usuario{i}@example.com",
+                username=f"usuario{i}",
+                password=contrasena,
+                nombre=f"Nombre {i}",
+                apellido=f"Apellido {i}",
+                rol="Analista",
+                cargo="QA",
+            )
+            for i in range(usuarios)
+        )
+
+        catalogos = {}
+        for modelo in (Proceso, Linea, Cliente, Tipo):
+            catalogos[modelo] = modelo.objects.bulk_create(
+                modelo(nombre=f"{modelo.__name__} {i:03d}", estado=i % 10 != 0)
+                for i in range(catalogo)
+            )
+
+        inicio = date(2023, 1, 1)
+        lista = Proyecto.objects.bulk_create(
+            (
+                Proyecto(
+                    proceso=aleatorio.choice(catalogos[Proceso]),
+                    linea=aleatorio.choice(catalogos[Linea]),
+                    tipo=aleatorio.choice(catalogos[Tipo]),
+                    cliente=aleatorio.choice(catalogos[Cliente]),
+                    nombre=f"Proyecto {i:06d}",
+                    tarea_tw=f"https://example.com/tareas/{i}",
+                    desarrollador=f"Desarrollador {i % 40}",
+                    creador=admin,
+                )
+                for i in range(proyectos)
+            ),
+            batch_size=1000,
+        )
+        for indice in INDICES.values():
+            indice.reconstruir()
+        if not trazabilidad:
+            crear_resumenes_vacios(lista)
+            return admin
+
+        def horas():
+            return Decimal(aleatorio.randint(1, 800)) / 4
+
+        def fecha():
+            return inicio + timedelta(days=aleatorio.randint(0, 700))
+
+        Planeacion.objects.bulk_create(
+            (Planeacion(proyecto=p, tipo_actividad="estimacion", fecha=fecha()) for p in lista),
+            batch_size=1000,
+        )
+        Estimacion.objects.bulk_create(
+            (
+                Estimacion(
+                    proyecto=p,
+                    fecha_registro_real=fecha(),
+                    horas_est_dcp=horas(),
+                    horas_est_eje=horas(),
+                    fecha_entrega_hu=fecha(),
+                    registrado_por=admin,
+                )
+                for p in lista
+            ),
+            batch_size=1000,
+        )
+        DisenoCP.objects.bulk_create(
+            (
+                DisenoCP(
+                    proyecto=p,
+                    fecha_registro_real=fecha(),
+                    horas_real_dcp=horas(),
+                    fecha_inicio=fecha(),
+                    fecha_fin=fecha(),
+                    registrado_por=admin,
+                )
+                for p in lista
+            ),
+            batch_size=1000,
+        )
+        Ejecucion.objects.bulk_create(
+            (
+                Ejecucion(
+                    proyecto=p,
+                    fecha_registro_real=fecha(),
+                    iteracion=iteracion,
+                    horas_real_eje=horas(),
+                    fecha_inicio=fecha(),
+                    fecha_fin=fecha(),
+                    registrado_por=admin,
+                )
+                for p in lista
+                for iteracion in ("iteracion_1", "iteracion_2")
+            ),
+            batch_size=1000,
+        )
+        reconstruir_resumen_horas()
+    return admin
@@ -0,0 +1,98 @@
+"""
+Configuración común de los benchmarks.
+
+Los benchmarks se ejecutan sin servidor ni base de datos externa: se cargan los settings
+del proyecto, se reemplaza la base de datos por SQLite (en memoria por defecto) y se
+aplican las migraciones.
+"""
+
+import os
+import statistics
+import sys
+import time
+from pathlib import Path
+
+BASE_DIR = Path(__file__).resolve().parent.parent
+
+
+def base_datos_benchmark(directorio):
+    """
+    Base de datos de los benchmarks: un archivo SQLite en ``directorio`` o, si está
+    definida BENCH_DB_HOST, un servidor PostgreSQL local (BENCH_DB_PORT, BENCH_DB_NAME,
+    BENCH_DB_USER, BENCH_DB_PASSWORD y BENCH_DB_SSLMODE).
+    """
+    if "BENCH_DB_HOST" not in os.environ:
+        return {
+            "ENGINE": "django.db.backends.sqlite3",
+            "NAME": os.path.join(directorio, "benchmark.sqlite3"),
+        }
+    return {
+        "ENGINE": "django.db.backends.postgresql",
+        "HOST": os.environ["BENCH_DB_HOST"],
+        "PORT": os.environ.get("BENCH_DB_PORT", "5432"),
+        "NAME": os.environ.get("BENCH_DB_NAME", "postgres"),
+        "USER": os.environ.get("BENCH_DB_USER", "postgres"),
+        "PASSWORD": os.environ.get("BENCH_DB_PASSWORD", ""),
+        "OPTIONS": {"sslmode": os.environ.get("BENCH_DB_SSLMODE", "prefer")},
+    }
+
+
+def preparar_django(nombre_db=":memory:", base_datos=None, migrar=True):
+    """
+    Inicializa Django con los settings del proyecto sobre una base de datos SQLite.
+
+    Parámetros:
+    - nombre_db: Ruta del archivo SQLite, o ":memory:".
+    - base_datos: Configuración completa de DATABASES["default"]; reemplaza a nombre_db.
+    - migrar: Si es False no se aplican las migraciones.
+    """
+    sys.path.insert(0, str(BASE_DIR))
+    os.environ.setdefault("DJANGO_SETTINGS_MODULE", "project_planner.settings")
+
+    import django
+    from django.conf import settings
+
+    settings.DATABASES = {
+        "default": base_datos
+        or {"ENGINE": "django.db.backends.sqlite3", "NAME": nombre_db}
+    }
+    settings.DEBUG = False
+    django.setup()
+
+    if migrar:
+        from django.core.management import call_command
+
+        call_command("migrate", verbosity=0)
+
+
+def medir(funcion, repeticiones=1000, calentamiento=50):
+    """
+    Ejecuta ``funcion`` varias veces y devuelve estadísticas de latencia en milisegundos.
+    """
+    for _ in range(calentamiento):
+        funcion()
+    tiempos = []
+    for _ in range(repeticiones):
+        inicio = time.perf_counter()
+        funcion()
+        tiempos.append((time.perf_counter() - inicio) * 1000)
+    tiempos.sort()
+    return {
+        "repeticiones": repeticiones,
+        "media_ms": round(statistics.fmean(tiempos), 4),
+        "p50_ms": round(tiempos[len(tiempos) // 2], 4),
+        "p99_ms": round(tiempos[min(len(tiempos) - 1, int(len(tiempos) * 0.99))], 4),
+    }
+
+
+def imprimir_tabla(resultados):
+    """
+    Imprime un diccionario ``{caso: estadisticas}`` como tabla.
+    """
+    ancho = max(len(caso) for caso in resultados)
+    print(f"{'caso':<{ancho}}  {'media_ms':>10}  {'p50_ms':>10}  {'p99_ms':>10}")
+    for caso, datos in resultados.items():
+        print(
+            f"{caso:<{ancho}}  {datos['media_ms']:>10.4f}  "
+            f"{datos['p50_ms']:>10.4f}  {datos['p99_ms']:>10.4f}"
+        )
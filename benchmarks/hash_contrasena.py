@@ -0,0 +1,72 @@
+"""
+Latencia y CPU del login según la política de hash de contraseñas.
+
+Para cada hasher mide authenticate() (el trabajo que hace LoginView) con una contraseña
+correcta, reportando el tiempo de reloj y el tiempo de CPU por login.
+
+Uso: python -m benchmarks.hash_contrasena [--repeticiones N]
+"""
+
+import argparse
+import time
+
+from benchmarks.entorno import preparar_django
+
+POLITICAS = {
+    "pbkdf2 (720000 iteraciones)": (
+        "usuarios_app.hashers.ConfigurablePBKDF2PasswordHasher",
+        {},
+    ),
+    "pbkdf2 (260000 iteraciones)": (
+        "usuarios_app.hashers.ConfigurablePBKDF2PasswordHasher",
+        {"PBKDF2_ITERATIONS": 260000},
+    ),
+    "scrypt (n=2^14, r=8)": (
+        "usuarios_app.hashers.ConfigurableScryptPasswordHasher",
+        {},
+    ),
+    "scrypt (n=2^13, r=8)": (
+        "usuarios_app.hashers.ConfigurableScryptPasswordHasher",
+        {"SCRYPT_WORK_FACTOR": 2**13},
+    ),
+    "argon2id (por defecto)": (
+        "usuarios_app.hashers.ConfigurableArgon2PasswordHasher",
+        {},
+    ),
+    "md5 (solo pruebas)": ("django.contrib.auth.hashers.MD5PasswordHasher", {}),
+}
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--repeticiones", type=int, default=10)
+    args = parser.parse_args()
+
+    preparar_django()
+
+    from django.contrib.auth import authenticate
+    from django.test import override_settings
+    from usuarios_app.models import Usuario
+
+    print(f"{'politica':<30}  {'login_ms':>10}  {'cpu_ms':>10}")
+    for indice, (nombre, (hasher, parametros)) in enumerate(POLITICAS.items()):
+        with override_settings(PASSWORD_HASHERS=[hasher], **parametros):
+            username = f"bench{indice}"
+            try:
+                Usuario.objects.create_user(
+                    email=f"{username}@example.com", username=username, password="Clave@123"
+                )
+            except ValueError as exc:
+                print(f"{nombre:<30}  no disponible ({exc})")
+                continue
+            reloj = time.perf_counter()
+            cpu = time.process_time()
+            for _ in range(args.repeticiones):
+                authenticate(username=username, password="Clave@123")
+            reloj = (time.perf_counter() - reloj) * 1000 / args.repeticiones
+            cpu = (time.process_time() - cpu) * 1000 / args.repeticiones
+        print(f"{nombre:<30}  {reloj:>10.2f}  {cpu:>10.2f}")
+
+
+if __name__ == "__main__":
+    main()
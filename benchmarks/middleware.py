@@ -0,0 +1,83 @@
+"""
+Costo de la pila de middleware en solicitudes a la API.
+
+Compara una solicitud autenticada a /api/lista-combinada/ (respuesta en caché) con:
+
+- La pila anterior: sesiones, CSRF, autenticación, mensajes y clickjacking en todas las
+  rutas.
+- La pila actual: esos middleware solo fuera de /api/ (FueraDeAPIMiddleware).
+
+Después desglosa el tiempo medio de cada middleware de ambas pilas con
+MedicionMiddleware.
+
+Uso: python -m benchmarks.middleware [--repeticiones N]
+"""
+
+import argparse
+import re
+import statistics
+from collections import defaultdict
+
+from benchmarks.entorno import imprimir_tabla, medir, preparar_django
+
+PILA_ANTERIOR = [
+    "django.middleware.security.SecurityMiddleware",
+    "django.contrib.sessions.middleware.SessionMiddleware",
+    "django.middleware.common.CommonMiddleware",
+    "django.middleware.csrf.CsrfViewMiddleware",
+    "django.contrib.auth.middleware.AuthenticationMiddleware",
+    "django.contrib.messages.middleware.MessageMiddleware",
+    "django.middleware.clickjacking.XFrameOptionsMiddleware",
+    "corsheaders.middleware.CorsMiddleware",
+    "project_planner.middleware.AutenticacionTimingMiddleware",
+]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--repeticiones", type=int, default=2000)
+    args = parser.parse_args()
+
+    preparar_django()
+
+    from django.conf import settings
+    from django.test import Client, override_settings
+    from rest_framework_simplejwt.tokens import RefreshToken
+    from project_planner.middleware import intercalar_medicion
+    from usuarios_app.autenticacion import agregar_claims_usuario
+    from usuarios_app.models import Usuario
+
+    usuario = Usuario.objects.create_user(
+        email="bench@example.com", username="bench", password="x", rol="Admin"
+    )
+    token = agregar_claims_usuario(RefreshToken.for_user(usuario), usuario).access_token
+    encabezados = {"HTTP_AUTHORIZATION": f"Bearer {token}"}
+    url = "/api/lista-combinada/"
+    settings.ALLOWED_HOSTS = ["testserver"]
+
+    pilas = {"pila_anterior": PILA_ANTERIOR, "pila_api": settings.MIDDLEWARE}
+    resultados = {}
+    for caso, pila in pilas.items():
+        with override_settings(MIDDLEWARE=pila):
+            client = Client()
+            assert client.get(url, **encabezados).status_code == 200
+            resultados[caso] = medir(lambda: client.get(url, **encabezados), args.repeticiones)
+    imprimir_tabla(resultados)
+
+    for caso, pila in pilas.items():
+        tiempos = defaultdict(list)
+        with override_settings(MIDDLEWARE=intercalar_medicion(pila)):
+            client = Client()
+            for _ in range(args.repeticiones):
+                server_timing = client.get(url, **encabezados)["Server-Timing"]
+                for nombre, duracion in re.findall(
+                    r'mw;desc="([^"]+)";dur=([\d.]+)', server_timing
+                ):
+                    tiempos[nombre].append(float(duracion))
+        ancho = max(len(nombre) for nombre in tiempos)
+        print(f"\n{caso}\n{'middleware':<{ancho}}  {'media_ms':>10}")
+        for nombre, valores in tiempos.items():
+            print(f"{nombre:<{ancho}}  {statistics.fmean(valores):>10.4f}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,77 @@
+"""
+Latencia del dashboard de portafolio frente a su presupuesto de 200 ms.
+
+Siembra --proyectos proyectos con su trazabilidad y mide /api/trazabilidad/portafolio/ de
+principio a fin con el cliente de pruebas: las cuatro dimensiones juntas (una consulta
+UNION ALL) y cada dimensión por separado con ``?dimension=``. Al final indica qué casos
+superan el presupuesto en p99.
+
+Usa un archivo SQLite temporal o PostgreSQL si se definen las variables BENCH_DB_* (ver
+benchmarks.entorno.base_datos_benchmark).
+
+Uso: python -m benchmarks.portafolio [--proyectos N] [--repeticiones N] [--presupuesto-ms N]
+"""
+
+import argparse
+import tempfile
+
+from benchmarks.entorno import (
+    base_datos_benchmark,
+    imprimir_tabla,
+    medir,
+    preparar_django,
+)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--proyectos", type=int, default=50_000)
+    parser.add_argument("--repeticiones", type=int, default=50)
+    parser.add_argument("--presupuesto-ms", type=float, default=200)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as directorio:
+        preparar_django(base_datos=base_datos_benchmark(directorio))
+
+        from django.test import override_settings
+        from django.urls import reverse
+
+        from benchmarks.api import ClienteLocal
+        from benchmarks.datos import sembrar
+        from usuarios_app.autenticacion import agregar_claims_usuario
+        from rest_framework_simplejwt.tokens import RefreshToken
+
+        admin = sembrar(args.proyectos, usuarios=200)
+        token = str(agregar_claims_usuario(RefreshToken.for_user(admin), admin).access_token)
+        cliente = ClienteLocal()
+        ruta = reverse("trazabilidad-portafolio")
+
+        def portafolio(consulta=""):
+            def ejecutar():
+                codigo, contenido = cliente.solicitar("GET", ruta + consulta, token=token)
+                if codigo != 200:
+                    raise RuntimeError(f"{ruta}{consulta}: {codigo} {contenido[:200]!r}")
+
+            return ejecutar
+
+        casos = {"todas": portafolio()}
+        for dimension in ("lineas", "procesos", "clientes", "tipos"):
+            casos[dimension] = portafolio(f"?dimension={dimension}")
+        with override_settings(ALLOWED_HOSTS=["testserver"]):
+            resultados = {
+                caso: medir(funcion, args.repeticiones, calentamiento=5)
+                for caso, funcion in casos.items()
+            }
+
+    imprimir_tabla(resultados)
+    excedidos = [
+        caso for caso, datos in resultados.items() if datos["p99_ms"] > args.presupuesto_ms
+    ]
+    if excedidos:
+        print(f"Superan el presupuesto de {args.presupuesto_ms:g} ms: {', '.join(excedidos)}")
+    else:
+        print(f"Todos los casos cumplen el presupuesto de {args.presupuesto_ms:g} ms (p99).")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,84 @@
+"""
+Serialización del listado de proyectos: ProyectoSerializer frente a
+ProyectoLecturaSerializer.
+
+Para una página de --pagina proyectos mide, con y sin la consulta:
+
+- model_serializer: objetos con select_related y ProyectoSerializer(many=True), el
+  camino anterior del listado.
+- lectura: filas de values() y ProyectoLecturaSerializer con todos los campos.
+- lectura_id_nombre: lo mismo con ``?fields=id,nombre``.
+
+Además de la latencia imprime los objetos serializados por segundo.
+
+Uso: python -m benchmarks.serializacion [--pagina N] [--repeticiones N]
+"""
+
+import argparse
+import tempfile
+
+from benchmarks.entorno import (
+    base_datos_benchmark,
+    imprimir_tabla,
+    medir,
+    preparar_django,
+)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--proyectos", type=int, default=5000)
+    parser.add_argument("--pagina", type=int, default=500)
+    parser.add_argument("--repeticiones", type=int, default=200)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as directorio:
+        preparar_django(base_datos=base_datos_benchmark(directorio))
+
+        from benchmarks.datos import sembrar
+        from proyectos.models import Proyecto
+        from proyectos.serializers import ProyectoLecturaSerializer, ProyectoSerializer
+
+        sembrar(args.proyectos, usuarios=10, catalogo=10, trazabilidad=False)
+        orden = ("-fecha_creacion", "-pk")
+        objetos = Proyecto.objects.select_related("proceso", "linea", "tipo", "cliente")
+
+        def consulta_objetos():
+            return list(objetos.order_by(*orden)[: args.pagina])
+
+        def consulta_filas(lectura):
+            return list(
+                Proyecto.objects.order_by(*orden).values(*lectura.columnas())[: args.pagina]
+            )
+
+        completo = ProyectoLecturaSerializer()
+        id_nombre = ProyectoLecturaSerializer(["id", "nombre"])
+        instancias = consulta_objetos()
+        filas_completas = consulta_filas(completo)
+        filas_id_nombre = consulta_filas(id_nombre)
+
+        casos = {
+            "model_serializer": lambda: ProyectoSerializer(instancias, many=True).data,
+            "lectura": lambda: completo.serializar(filas_completas),
+            "lectura_id_nombre": lambda: id_nombre.serializar(filas_id_nombre),
+            "consulta+model_serializer": lambda: ProyectoSerializer(
+                consulta_objetos(), many=True
+            ).data,
+            "consulta+lectura": lambda: completo.serializar(consulta_filas(completo)),
+            "consulta+lectura_id_nombre": lambda: id_nombre.serializar(
+                consulta_filas(id_nombre)
+            ),
+        }
+        resultados = {
+            caso: medir(funcion, args.repeticiones, calentamiento=10)
+            for caso, funcion in casos.items()
+        }
+
+    imprimir_tabla(resultados)
+    print(f"\nObjetos por segundo (páginas de {args.pagina}):")
+    for caso, datos in resultados.items():
+        print(f"{caso:<28}  {args.pagina * 1000 / datos['media_ms']:>12,.0f}")
+
+
+if __name__ == "__main__":
+    main()
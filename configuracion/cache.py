@@ -0,0 +1,121 @@
+import hashlib
+import time
+
+from asgiref.sync import sync_to_async
+from django.conf import settings
+from django.core.cache import cache
+from django.db import transaction
+from django.utils.http import quote_etag
+
+from project_planner.renderers import JSONRapidoRenderer
+
+from .models import Proceso, Linea, Cliente, Tipo
+from .serializers import (
+    ProcesoSerializer,
+    LineaSerializer,
+    ClienteSerializer,
+    TipoSerializer,
+)
+
+LISTA_COMBINADA_CACHE_KEY = "configuracion:lista-combinada:{}"
+
+
+def lista_combinada_cache_key(solo_activos):
+    return LISTA_COMBINADA_CACHE_KEY.format("activos" if solo_activos else "todos")
+
+
+def consultar_catalogo(modelo, solo_activos):
+    """
+    Devuelve el queryset (id, nombre) de un catálogo ordenado por nombre. Con
+    solo_activos se filtra por estado=True, consulta que cubre el índice parcial
+    del modelo.
+    """
+    queryset = modelo.objects.only("id", "nombre").order_by("nombre")
+    if solo_activos:
+        queryset = queryset.filter(estado=True)
+    return queryset
+
+
+def construir_lista_combinada(solo_activos=False):
+    """
+    Consulta los cuatro catálogos y devuelve la respuesta combinada ya renderizada a JSON.
+
+    Parámetros:
+    - solo_activos: Si es True solo se incluyen los registros con estado=True.
+
+    Retorna un diccionario con:
+    - contenido: El cuerpo JSON en bytes.
+    - etag: ETag calculado a partir del contenido.
+    - ultima_modificacion: Marca de tiempo (segundos) en que se generó el contenido.
+    """
+    data = {
+        "procesos": ProcesoSerializer(
+            consultar_catalogo(Proceso, solo_activos), many=True
+        ).data,
+        "lineas": LineaSerializer(consultar_catalogo(Linea, solo_activos), many=True).data,
+        "clientes": ClienteSerializer(
+            consultar_catalogo(Cliente, solo_activos), many=True
+        ).data,
+        "tipos": TipoSerializer(consultar_catalogo(Tipo, solo_activos), many=True).data,
+    }
+    return empaquetar_lista_combinada(data)
+
+
+def empaquetar_lista_combinada(data):
+    """
+    Renderiza la lista combinada a JSON y calcula su ETag y fecha de modificación.
+    """
+    contenido = JSONRapidoRenderer().render(data)
+    return {
+        "contenido": contenido,
+        "etag": quote_etag(hashlib.md5(contenido).hexdigest()),
+        "ultima_modificacion": int(time.time()),
+    }
+
+
+def obtener_lista_combinada(solo_activos=False):
+    """
+    Devuelve la lista combinada desde la caché, construyéndola solo si no existe.
+    """
+    cache_key = lista_combinada_cache_key(solo_activos)
+    lista = cache.get(cache_key)
+    if lista is None:
+        lista = construir_lista_combinada(solo_activos)
+        cache.set(cache_key, lista, settings.LISTA_COMBINADA_CACHE_TIMEOUT)
+    return lista
+
+
+async def aobtener_lista_combinada(solo_activos=False):
+    """
+    Versión async de obtener_lista_combinada; comparte las entradas de caché.
+
+    Si la lista no está en caché, las cuatro consultas se hacen con la versión síncrona en
+    un solo paso por el hilo del ORM (sync_to_async), una tras otra: no hay concurrencia
+    entre ellas, pero el event loop no se bloquea.
+    """
+    cache_key = lista_combinada_cache_key(solo_activos)
+    lista = await cache.aget(cache_key)
+    if lista is None:
+        lista = await sync_to_async(construir_lista_combinada)(solo_activos)
+        await cache.aset(cache_key, lista, settings.LISTA_COMBINADA_CACHE_TIMEOUT)
+    return lista
+
+
+def invalidar_lista_combinada(**kwargs):
+    """
+    Elimina la lista combinada de la caché.
+    """
+    cache.delete_many(
+        [lista_combinada_cache_key(False), lista_combinada_cache_key(True)]
+    )
+
+
+def programar_invalidacion(**kwargs):
+    """
+    Invalida la lista combinada cuando la transacción actual se confirme. Se conecta a
+    las señales de guardado y borrado de los catálogos.
+
+    Borrar antes del commit permitiría que otra solicitud volviera a guardar en caché la
+    lista anterior mientras la transacción sigue abierta.
+    """
+    transaction.on_commit(invalidar_lista_combinada)
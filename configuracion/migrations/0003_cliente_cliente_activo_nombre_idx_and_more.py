@@ -0,0 +1,29 @@
+# Generated by Django 5.0.3 on 2026-10-18 18:24
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('configuracion', '0002_rename_guid_cliente_id_rename_guid_linea_id_and_more'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='cliente',
+            index=models.Index(condition=models.Q(('estado', True)), fields=['nombre'], include=('id',), name='cliente_activo_nombre_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='linea',
+            index=models.Index(condition=models.Q(('estado', True)), fields=['nombre'], include=('id',), name='linea_activo_nombre_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='proceso',
+            index=models.Index(condition=models.Q(('estado', True)), fields=['nombre'], include=('id',), name='proceso_activo_nombre_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='tipo',
+            index=models.Index(condition=models.Q(('estado', True)), fields=['nombre'], include=('id',), name='tipo_activo_nombre_idx'),
+        ),
+    ]
@@ -2,11 +2,30 @@ from django.db import models
 import uuid
 
 
+def indice_activos_por_nombre(prefijo):
+    """
+    Índice parcial sobre los registros activos (estado=True) ordenados por nombre.
+
+    Incluye el id para que la consulta de catálogos activos (id, nombre) pueda resolverse
+    solo con el índice. La condición y el INCLUDE se aplican en PostgreSQL; en otros
+    motores Django crea el índice que cada uno soporte.
+    """
+    return models.Index(
+        fields=["nombre"],
+        include=["id"],
+        condition=models.Q(estado=True),
+        name=f"{prefijo}_activo_nombre_idx",
+    )
+
+
 class Proceso(models.Model):
     id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
     nombre = models.CharField(max_length=100)
     estado = models.BooleanField(default=True)
 
+    class Meta:
+        indexes = [indice_activos_por_nombre("proceso")]
+
     def __str__(self):
         # Devuelve el campo que quieres mostrar
         return self.nombre
@@ -17,6 +36,9 @@ class Linea(models.Model):
     nombre = models.CharField(max_length=100)
     estado = models.BooleanField(default=True)
 
+    class Meta:
+        indexes = [indice_activos_por_nombre("linea")]
+
     def __str__(self):
         # Devuelve el campo que quieres mostrar
         return self.nombre
@@ -27,6 +49,9 @@ class Cliente(models.Model):
     nombre = models.CharField(max_length=100)
     estado = models.BooleanField(default=True)
 
+    class Meta:
+        indexes = [indice_activos_por_nombre("cliente")]
+
     def __str__(self):
         # Devuelve el campo que quieres mostrar
         return self.nombre
@@ -37,6 +62,9 @@ class Tipo(models.Model):
     nombre = models.CharField(max_length=100)
     estado = models.BooleanField(default=True)
 
+    class Meta:
+        indexes = [indice_activos_por_nombre("tipo")]
+
     def __str__(self):
         # Devuelve el campo que quieres mostrar
         return self.nombre
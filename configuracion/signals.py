@@ -0,0 +1,17 @@
+from django.db.models.signals import post_save, post_delete
+
+from .cache import programar_invalidacion
+from .models import Proceso, Linea, Cliente, Tipo
+
+# Cualquier cambio en un catálogo invalida la lista combinada en caché.
+for modelo in (Proceso, Linea, Cliente, Tipo):
+    post_save.connect(
+        programar_invalidacion,
+        sender=modelo,
+        dispatch_uid=f"invalidar_lista_combinada_save_{modelo.__name__}",
+    )
+    post_delete.connect(
+        programar_invalidacion,
+        sender=modelo,
+        dispatch_uid=f"invalidar_lista_combinada_delete_{modelo.__name__}",
+    )
@@ -0,0 +1,180 @@
+from django.core.cache import cache
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.test import APITestCase
+from rest_framework_simplejwt.tokens import RefreshToken
+from django.contrib.auth import get_user_model
+from configuracion.cache import lista_combinada_cache_key
+from configuracion.models import Proceso, Linea, Cliente, Tipo
+from usuarios_app.autenticacion import agregar_claims_usuario
+
+
+User = get_user_model()
+
+
+class ListaCombinadaAPITests(APITestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.test_user = User.objects.create_user(
+            username="testuser", email="test@example.com", password="testpassword"
+        )
+        cls.url = reverse("lista-combinada")
+        Proceso.objects.create(nombre="Proceso")
+        Linea.objects.create(nombre="Linea")
+        Cliente.objects.create(nombre="Cliente")
+        Tipo.objects.create(nombre="Tipo")
+        Tipo.objects.create(nombre="A tipo inactivo", estado=False)
+
+    def setUp(self):
+        cache.clear()
+        self.client.force_authenticate(user=self.test_user)
+
+    def test_returns_catalogs_with_validators(self):
+        """
+        Asegurar que la lista combinada incluye los catálogos y las cabeceras ETag y Last-Modified.
+        """
+        response = self.client.get(self.url)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertIn("ETag", response)
+        self.assertIn("Last-Modified", response)
+        data = response.json()
+        self.assertEqual(data["procesos"][0]["nombre"], "Proceso")
+        self.assertEqual(data["lineas"][0]["nombre"], "Linea")
+        self.assertEqual(data["clientes"][0]["nombre"], "Cliente")
+        self.assertEqual(
+            [tipo["nombre"] for tipo in data["tipos"]], ["A tipo inactivo", "Tipo"]
+        )
+
+    def test_cached_response_skips_database(self):
+        """
+        Asegurar que, con la lista en caché, las solicitudes siguientes no consultan la base de datos.
+        """
+        self.client.get(self.url)
+        with CaptureQueriesContext(connection) as contexto:
+            response = self.client.get(self.url)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(len(contexto.captured_queries), 0)
+
+    def test_if_none_match_returns_304(self):
+        """
+        Asegurar que un If-None-Match con el ETag vigente responde 304 sin cuerpo.
+        """
+        etag = self.client.get(self.url)["ETag"]
+        response = self.client.get(self.url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, status.HTTP_304_NOT_MODIFIED)
+        self.assertEqual(response.content, b"")
+
+    def test_catalog_change_invalidates_cache(self):
+        """
+        Asegurar que guardar o borrar un catálogo invalida la caché y cambia el ETag.
+        """
+        etag = self.client.get(self.url)["ETag"]
+
+        with self.captureOnCommitCallbacks(execute=True):
+            Linea.objects.create(nombre="Otra linea")
+        response = self.client.get(self.url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(len(response.json()["lineas"]), 2)
+
+        etag = response["ETag"]
+        with self.captureOnCommitCallbacks(execute=True):
+            Linea.objects.get(nombre="Otra linea").delete()
+        response = self.client.get(self.url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(len(response.json()["lineas"]), 1)
+
+    def test_activos_excludes_inactive_rows(self):
+        """
+        Asegurar que con ?activos=true solo se devuelven los registros activos, ordenados por nombre.
+        """
+        Tipo.objects.create(nombre="B tipo")
+        response = self.client.get(self.url, {"activos": "true"})
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(
+            [tipo["nombre"] for tipo in response.json()["tipos"]], ["B tipo", "Tipo"]
+        )
+
+    def test_activos_cache_is_invalidated(self):
+        """
+        Asegurar que desactivar un registro invalida también la lista de activos en caché.
+        """
+        self.client.get(self.url, {"activos": "true"})
+        proceso = Proceso.objects.get(nombre="Proceso")
+        proceso.estado = False
+        with self.captureOnCommitCallbacks(execute=True):
+            proceso.save()
+        response = self.client.get(self.url, {"activos": "true"})
+        self.assertEqual(response.json()["procesos"], [])
+
+    def test_invalidation_waits_for_commit(self):
+        """
+        Asegurar que la caché se invalida al confirmar la transacción y no al guardar.
+        """
+        self.client.get(self.url)
+        with self.captureOnCommitCallbacks() as callbacks:
+            Cliente.objects.create(nombre="Otro cliente")
+            self.assertIsNotNone(cache.get(lista_combinada_cache_key(False)))
+        self.assertEqual(len(callbacks), 1)
+        self.assertIsNotNone(cache.get(lista_combinada_cache_key(False)))
+
+        callbacks[0]()
+        self.assertIsNone(cache.get(lista_combinada_cache_key(False)))
+        self.assertEqual(len(self.client.get(self.url).json()["clientes"]), 2)
+
+
+class ListaCombinadaAsyncTests(APITestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.test_user = User.objects.create_user(
+            username="testuser", email="test@example.com", password="testpassword"
+        )
+        cls.url = reverse("lista-combinada-async")
+        Proceso.objects.create(nombre="Proceso")
+        Linea.objects.create(nombre="Linea")
+        Cliente.objects.create(nombre="Cliente")
+        Tipo.objects.create(nombre="Tipo", estado=False)
+
+    def setUp(self):
+        cache.clear()
+        token = agregar_claims_usuario(
+            RefreshToken.for_user(self.test_user), self.test_user
+        ).access_token
+        self.client.credentials(HTTP_AUTHORIZATION=f"Bearer {token}")
+
+    def test_matches_sync_view(self):
+        """
+        Asegurar que la vista async devuelve el mismo cuerpo y ETag que la vista síncrona.
+        """
+        for params in ({}, {"activos": "true"}):
+            asincrona = self.client.get(self.url, params)
+            cache.clear()
+            sincrona = self.client.get(reverse("lista-combinada"), params)
+            self.assertEqual(asincrona.status_code, status.HTTP_200_OK)
+            self.assertEqual(asincrona.content, sincrona.content)
+            self.assertEqual(asincrona["ETag"], sincrona["ETag"])
+
+    def test_if_none_match_returns_304(self):
+        """
+        Asegurar que la vista async responde 304 con un ETag vigente.
+        """
+        etag = self.client.get(self.url)["ETag"]
+        response = self.client.get(self.url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, status.HTTP_304_NOT_MODIFIED)
+
+    def test_requires_authentication(self):
+        """
+        Asegurar que la vista async rechaza solicitudes sin token o con token inválido.
+        """
+        self.client.credentials()
+        self.assertEqual(self.client.get(self.url).status_code, status.HTTP_401_UNAUTHORIZED)
+        self.client.credentials(HTTP_AUTHORIZATION="Bearer invalido")
+        self.assertEqual(self.client.get(self.url).status_code, status.HTTP_401_UNAUTHORIZED)
+
+    def test_only_get_allowed(self):
+        """
+        Asegurar que la vista async solo acepta GET.
+        """
+        response = self.client.post(self.url)
+        self.assertEqual(response.status_code, status.HTTP_405_METHOD_NOT_ALLOWED)
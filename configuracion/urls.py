@@ -1,6 +1,11 @@
 from django.urls import path
-from .views import ListaCombinadaAPIView
+from .views import ListaCombinadaAPIView, lista_combinada_async
 
 urlpatterns = [
     path("lista-combinada/", ListaCombinadaAPIView.as_view(), name="lista-combinada"),
+    path(
+        "lista-combinada/async/",
+        lista_combinada_async,
+        name="lista-combinada-async",
+    ),
 ]
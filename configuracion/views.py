@@ -1,30 +1,64 @@
-from django.shortcuts import render
-from .models import Proceso, Linea, Cliente, Tipo
-from .serializers import (
-    ProcesoSerializer,
-    LineaSerializer,
-    ClienteSerializer,
-    TipoSerializer,
-)
+from django.http import HttpResponse
+from django.utils.cache import get_conditional_response
+from django.utils.http import http_date
+from django.views.decorators.http import require_GET
+from .cache import aobtener_lista_combinada, obtener_lista_combinada
 
 
 # Create your views here.
 from rest_framework.views import APIView
-from rest_framework.response import Response
+from usuarios_app.autenticacion import ClaimsJWTAuthentication, autenticacion_async
 
 
 class ListaCombinadaAPIView(APIView):
+    """
+    Devuelve los catálogos Proceso, Linea, Cliente y Tipo en una sola respuesta.
+
+    El JSON se genera una vez y se guarda en caché hasta que algún catálogo cambia. La
+    respuesta incluye las cabeceras ETag y Last-Modified; si el cliente envía un
+    If-None-Match (o If-Modified-Since) vigente se responde 304 sin cuerpo. La autenticación
+    usa los claims del token, así que una respuesta en caché no consulta la base de datos.
+
+    Con el parámetro ?activos=true solo se devuelven los registros activos (estado=True).
+    """
+
+    authentication_classes = [ClaimsJWTAuthentication]
+
     def get(self, request, *args, **kwargs):
-        procesos = Proceso.objects.all()
-        lineas = Linea.objects.all()
-        clientes = Cliente.objects.all()
-        tipos = Tipo.objects.all()
-
-        response = {
-            "procesos": ProcesoSerializer(procesos, many=True).data,
-            "lineas": LineaSerializer(lineas, many=True).data,
-            "clientes": ClienteSerializer(clientes, many=True).data,
-            "tipos": TipoSerializer(tipos, many=True).data,
-        }
-
-        return Response(response)
+        lista = obtener_lista_combinada(solo_activos(request))
+        return respuesta_lista_combinada(request, lista)
+
+
+def solo_activos(request):
+    return request.GET.get("activos", "").lower() in ("1", "true")
+
+
+def respuesta_lista_combinada(request, lista):
+    """
+    Construye la respuesta (200 o 304) con las cabeceras ETag y Last-Modified.
+    """
+    response = get_conditional_response(
+        request,
+        etag=lista["etag"],
+        last_modified=lista["ultima_modificacion"],
+    )
+    if response is None:
+        response = HttpResponse(lista["contenido"], content_type="application/json")
+
+    response["ETag"] = lista["etag"]
+    response["Last-Modified"] = http_date(lista["ultima_modificacion"])
+    return response
+
+
+@require_GET
+@autenticacion_async
+async def lista_combinada_async(request):
+    """
+    Versión async de ListaCombinadaAPIView para servir bajo ASGI (uvicorn).
+
+    Mismos parámetros, cabeceras y caché que la vista síncrona. Si la lista no está en
+    caché, las cuatro consultas de catálogos se ejecutan una tras otra en el hilo del ORM
+    (ver aobtener_lista_combinada); la vista no bloquea el event loop mientras tanto.
+    """
+    lista = await aobtener_lista_combinada(solo_activos(request))
+    return respuesta_lista_combinada(request, lista)
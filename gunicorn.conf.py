@@ -0,0 +1,24 @@
+"""
+Configuración de gunicorn (se carga automáticamente desde el directorio de trabajo).
+
+El número de workers y de hilos se sigue definiendo con WEB_CONCURRENCY / -w y
+--threads; este archivo solo agrega un reporte de las conexiones a la base de datos que
+abrirá cada worker, para dimensionar max_connections del servidor PostgreSQL.
+"""
+
+
+def post_worker_init(worker):
+    from django.conf import settings
+
+    from project_planner.basedatos import describir_conexiones
+
+    if "default" in settings.DATABASES:
+        worker.log.info(
+            "Worker %s, base de datos: %s",
+            worker.pid,
+            describir_conexiones(
+                settings.DATABASES["default"],
+                workers=worker.cfg.workers,
+                hilos=worker.cfg.threads,
+            ),
+        )
@@ -0,0 +1,32 @@
+from django.apps import AppConfig
+from django.contrib.admin.apps import AdminConfig
+from django.contrib.admin.checks import check_admin_app
+from django.core import checks
+
+from .checks import comprobar_dependencias_admin, reemplazar_checks_seguridad
+
+
+class ProjectPlannerConfig(AppConfig):
+    """
+    Checks de despliegue de CSRF y X-Frame-Options evaluados sobre MIDDLEWARE_FUERA_DE_API
+    (ver project_planner.checks.comprobar_middleware_seguridad).
+    """
+
+    name = "project_planner"
+
+    def ready(self):
+        reemplazar_checks_seguridad()
+
+
+class AdminFueraDeAPIConfig(AdminConfig):
+    """
+    Configuración del admin cuyo check de dependencias busca los middleware de sesiones,
+    mensajes y autenticación en MIDDLEWARE_FUERA_DE_API (ver FueraDeAPIMiddleware).
+    """
+
+    def ready(self):
+        # Igual que AdminConfig.ready, con comprobar_dependencias_admin en lugar de
+        # check_dependencies.
+        checks.register(comprobar_dependencias_admin, checks.Tags.admin)
+        checks.register(check_admin_app, checks.Tags.admin)
+        self.module.autodiscover()
@@ -12,5 +12,7 @@ import os
 from django.core.asgi import get_asgi_application
 
 os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'project_planner.settings')
+# Desactiva las conexiones persistentes a la base de datos (ver project_planner.basedatos).
+os.environ['DJANGO_ASGI'] = '1'
 
 application = get_asgi_application()
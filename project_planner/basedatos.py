@@ -0,0 +1,150 @@
+"""
+Opciones de conexión a la base de datos controladas por variables de entorno.
+
+Se usa desde los perfiles de settings (sin depender de django.conf) y desde gunicorn.conf.py para
+reportar al arrancar cuántas conexiones abrirá cada worker.
+
+Variables:
+- DB_HOST, DB_PORT, DB_NAME, DB_USER, DB_PASSWORD: Servidor PostgreSQL. En desarrollo,
+  definir DB_HOST cambia SQLite por PostgreSQL.
+- DB_CONN_MAX_AGE: Segundos que se reutiliza una conexión persistente (60 por defecto;
+  0 cierra la conexión al final de cada solicitud). Bajo ASGI siempre es 0.
+- DB_CONN_HEALTH_CHECKS: "0" desactiva la verificación de conexiones persistentes antes
+  de reutilizarlas (activa por defecto).
+- DB_CONNECT_TIMEOUT: Segundos de espera al abrir una conexión (10 por defecto).
+- DB_POOL_MIN_SIZE / DB_POOL_MAX_SIZE / DB_POOL_TIMEOUT: Activan el pool de psycopg 3.
+  Requiere Django 5.1+ y psycopg[pool]; en otro caso se ignoran y se mantienen las
+  conexiones persistentes.
+- DJANGO_ASGI: La define project_planner.asgi antes de cargar los settings; no hace falta
+  definirla a mano.
+"""
+
+import importlib.util
+import os
+
+import django
+
+
+def _entero(nombre, defecto=None):
+    valor = os.environ.get(nombre)
+    return int(valor) if valor else defecto
+
+
+def pool_disponible():
+    """
+    Indica si el backend de PostgreSQL admite la opción "pool" en este entorno.
+    """
+    return (
+        django.VERSION >= (5, 1)
+        and importlib.util.find_spec("psycopg") is not None
+        and importlib.util.find_spec("psycopg_pool") is not None
+    )
+
+
+def servidor_asgi():
+    """
+    Indica si los settings se cargan desde el punto de entrada ASGI (uvicorn).
+    """
+    return os.environ.get("DJANGO_ASGI") == "1"
+
+
+def opciones_pool():
+    """
+    Devuelve las opciones del pool de psycopg definidas en el entorno, o None si no se
+    pidió un pool.
+    """
+    max_size = _entero("DB_POOL_MAX_SIZE")
+    if not max_size:
+        return None
+    return {
+        "min_size": _entero("DB_POOL_MIN_SIZE", 1),
+        "max_size": max_size,
+        "timeout": _entero("DB_POOL_TIMEOUT", 10),
+    }
+
+
+def base_datos_entorno(defecto):
+    """
+    Devuelve la configuración de DATABASES["default"] tomando del entorno los datos del
+    servidor PostgreSQL y las opciones de conexión.
+
+    Parámetros:
+    - defecto: Configuración a usar cuando el entorno no define DB_HOST. Si es
+      PostgreSQL, sus valores sirven de respaldo para las variables DB_*.
+    """
+    postgres = "django.db.backends.postgresql"
+    if "DB_HOST" not in os.environ and defecto["ENGINE"] != postgres:
+        return dict(defecto)
+    respaldo = defecto if defecto["ENGINE"] == postgres else {}
+    return configurar_conexiones(
+        {
+            "ENGINE": postgres,
+            "NAME": os.environ.get("DB_NAME", respaldo.get("NAME")),
+            "USER": os.environ.get("DB_USER", respaldo.get("USER")),
+            "PASSWORD": os.environ.get("DB_PASSWORD", respaldo.get("PASSWORD")),
+            "HOST": os.environ.get("DB_HOST", respaldo.get("HOST")),
+            "PORT": os.environ.get("DB_PORT", respaldo.get("PORT", "5432")),
+        }
+    )
+
+
+def configurar_conexiones(base_datos):
+    """
+    Aplica a la configuración de una base de datos PostgreSQL las opciones de conexión
+    persistente y, si está disponible y se pidió, del pool de psycopg. Bajo ASGI, sin
+    pool, cada solicitud abre y cierra su conexión (CONN_MAX_AGE=0).
+
+    Parámetros:
+    - base_datos: Diccionario de DATABASES["default"]; se modifica y se devuelve.
+    """
+    opciones = base_datos.setdefault("OPTIONS", {})
+    opciones.setdefault("connect_timeout", _entero("DB_CONNECT_TIMEOUT", 10))
+
+    pool = opciones_pool()
+    if pool and pool_disponible():
+        # Django no permite combinar el pool con conexiones persistentes: el pool ya
+        # conserva las conexiones abiertas entre solicitudes.
+        opciones["pool"] = pool
+        base_datos["CONN_MAX_AGE"] = 0
+        base_datos["CONN_HEALTH_CHECKS"] = False
+    elif servidor_asgi():
+        # Bajo ASGI las consultas corren en hilos de sync_to_async que Django no limpia al
+        # terminar la solicitud: una conexión persistente quedaría abierta en cada hilo.
+        base_datos["CONN_MAX_AGE"] = 0
+        base_datos["CONN_HEALTH_CHECKS"] = False
+    else:
+        base_datos["CONN_MAX_AGE"] = _entero("DB_CONN_MAX_AGE", 60)
+        base_datos["CONN_HEALTH_CHECKS"] = os.environ.get("DB_CONN_HEALTH_CHECKS", "1") != "0"
+    return base_datos
+
+
+def describir_conexiones(base_datos, workers=1, hilos=1):
+    """
+    Resume cuántas conexiones mantiene cada worker y el total del servidor.
+
+    Parámetros:
+    - base_datos: Diccionario de DATABASES["default"] ya configurado.
+    - workers: Procesos del servidor (gunicorn -w).
+    - hilos: Hilos por proceso (gunicorn --threads); Django abre una conexión por hilo.
+    """
+    pool = base_datos.get("OPTIONS", {}).get("pool")
+    if pool:
+        por_worker = pool["max_size"]
+        modo = f"pool psycopg (min {pool['min_size']}, max {pool['max_size']})"
+    else:
+        por_worker = hilos
+        edad = base_datos.get("CONN_MAX_AGE", 0)
+        if edad is None:
+            modo = "conexiones persistentes sin límite de edad"
+        elif edad:
+            modo = f"conexiones persistentes (CONN_MAX_AGE={edad}s)"
+        else:
+            modo = "una conexión nueva por solicitud (CONN_MAX_AGE=0)"
+        if base_datos.get("CONN_HEALTH_CHECKS"):
+            modo += " con verificación de salud"
+        if opciones_pool() and not pool_disponible():
+            modo += "; DB_POOL_* ignorado (requiere Django 5.1+ y psycopg[pool])"
+    return (
+        f"{modo}: hasta {por_worker} conexiones por worker, "
+        f"{por_worker * workers} en total con {workers} workers"
+    )
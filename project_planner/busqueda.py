@@ -0,0 +1,312 @@
+"""
+Búsqueda de texto con relevancia sobre modelos con clave primaria UUID.
+
+- PostgreSQL: índices GIN de trigramas (pg_trgm) sobre las columnas buscadas. Se filtra
+  con ILIKE '%texto%' (lookup ``contiene_ilike``) o similitud de palabra (operador %>,
+  que tolera errores de escritura) y se ordena por TrigramWordSimilarity. Los índices son sobre las columnas de
+  la tabla, por lo que no hay nada que sincronizar.
+- SQLite: una tabla virtual FTS5 con el tokenizador trigram por modelo
+  (``<tabla>_busqueda``), que encuentra subcadenas (sin tolerar errores de escritura) y
+  ordena por la fracción del campo que cubre la búsqueda. Se mantiene al día
+  con las señales post_save/post_delete de cada app y, tras un bulk_create,
+  llamando a ``actualizar``. ``manage.py reconstruir_busqueda`` la vuelve a generar
+  (p. ej. después de un ``QuerySet.update()``).
+
+En ambos motores la consulta debe tener al menos LONGITUD_MINIMA caracteres, el tamaño de
+un trigrama, y solo se ordenan las primeras CANDIDATOS_MAXIMOS coincidencias: ordenarlas
+todas cuesta cientos de milisegundos cuando coinciden decenas de miles de filas (p. ej.
+un apellido común), y para autocompletar basta con que el usuario siga escribiendo.
+"""
+
+import uuid
+from functools import reduce
+from operator import or_
+
+from django.db import connection
+from django.db.models import CharField, Lookup, Q
+from django.db.models.functions import Greatest
+
+LONGITUD_MINIMA = 3
+LIMITE_POR_DEFECTO = 20
+LIMITE_MAXIMO = 100
+CANDIDATOS_MAXIMOS = 500
+
+# Índices registrados por etiqueta de modelo ("proyectos.Proyecto").
+INDICES = {}
+
+
+@CharField.register_lookup
+class ContieneILike(Lookup):
+    """
+    ``campo__contiene_ilike=texto``: ``campo ILIKE '%texto%'`` sobre la columna sin
+    transformar, que el índice GIN de trigramas puede usar. ``icontains`` compila en
+    PostgreSQL a ``UPPER(campo::text) LIKE UPPER(...)``, que no coincide con el índice y
+    recorre la tabla. Solo PostgreSQL.
+    """
+
+    lookup_name = "contiene_ilike"
+
+    def get_db_prep_lookup(self, value, connection):
+        return "%s", [f"%{connection.ops.prep_for_like_query(value)}%"]
+
+    def as_postgresql(self, compiler, connection):
+        lhs, lhs_params = self.process_lhs(compiler, connection)
+        rhs, rhs_params = self.process_rhs(compiler, connection)
+        return f"{lhs} ILIKE {rhs}", [*lhs_params, *rhs_params]
+
+
+def rowid_busqueda(pk):
+    """
+    rowid de la tabla FTS para una clave primaria UUID: permite reemplazar o borrar la
+    fila de un registro sin recorrer la tabla.
+    """
+    return uuid.UUID(str(pk)).int & 0x7FFF_FFFF_FFFF_FFFF
+
+
+def nombre_tabla_busqueda(tabla):
+    return f"{tabla}_busqueda"
+
+
+def crear_indices_busqueda(schema_editor, tabla, campos, filas=()):
+    """
+    Crea la infraestructura de búsqueda de una tabla (para usar desde migraciones).
+
+    Parámetros:
+    - schema_editor: El schema editor de la migración.
+    - tabla: Nombre de la tabla del modelo.
+    - campos: Columnas de texto a indexar.
+    - filas: Tuplas ``(pk, *campos)`` con los datos existentes (solo SQLite; en
+      PostgreSQL el índice se construye sobre la tabla).
+    """
+    vendor = schema_editor.connection.vendor
+    if vendor == "postgresql":
+        schema_editor.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+        for campo in campos:
+            schema_editor.execute(
+                f'CREATE INDEX IF NOT EXISTS "{tabla}_{campo}_trgm" '
+                f'ON "{tabla}" USING gin ("{campo}" gin_trgm_ops)'
+            )
+    elif vendor == "sqlite":
+        tabla_fts = nombre_tabla_busqueda(tabla)
+        columnas = ", ".join(f'"{campo}"' for campo in campos)
+        schema_editor.execute(
+            f'CREATE VIRTUAL TABLE IF NOT EXISTS "{tabla_fts}" '
+            f"USING fts5(pk UNINDEXED, {columnas}, tokenize='trigram')"
+        )
+        insertar_filas(schema_editor.connection, tabla_fts, campos, filas)
+
+
+def eliminar_indices_busqueda(schema_editor, tabla, campos):
+    vendor = schema_editor.connection.vendor
+    if vendor == "postgresql":
+        for campo in campos:
+            schema_editor.execute(f'DROP INDEX IF EXISTS "{tabla}_{campo}_trgm"')
+    elif vendor == "sqlite":
+        schema_editor.execute(f'DROP TABLE IF EXISTS "{nombre_tabla_busqueda(tabla)}"')
+
+
+def relevancia_subcadena(texto, campos):
+    """
+    Fracción del campo más corto que contiene ``texto`` (1.0 si coincide completo).
+    """
+    texto = texto.casefold()
+    fracciones = [
+        len(texto) / len(valor) for valor in campos if valor and texto in valor.casefold()
+    ]
+    return round(max(fracciones, default=0.0), 4)
+
+
+def insertar_filas(conexion, tabla_fts, campos, filas):
+    """
+    Inserta o reemplaza en la tabla FTS las filas ``(pk, *campos)``.
+    """
+    filas = list(filas)
+    if not filas:
+        return
+    columnas = ", ".join(f'"{campo}"' for campo in campos)
+    marcadores = ", ".join(["%s"] * (len(campos) + 2))
+    sql = (
+        f'INSERT OR REPLACE INTO "{tabla_fts}" (rowid, pk, {columnas}) '
+        f"VALUES ({marcadores})"
+    )
+    with conexion.cursor() as cursor:
+        cursor.executemany(
+            sql,
+            [
+                (rowid_busqueda(pk), uuid.UUID(str(pk)).hex, *valores)
+                for pk, *valores in filas
+            ],
+        )
+
+
+class IndiceBusqueda:
+    """
+    Búsqueda sobre ``campos`` de ``modelo`` con el motor de la base de datos en uso.
+
+    Parámetros:
+    - modelo: Modelo con clave primaria UUID.
+    - campos: Columnas de texto donde buscar.
+    """
+
+    def __init__(self, modelo, campos):
+        self.modelo = modelo
+        self.campos = tuple(campos)
+        INDICES[modelo._meta.label] = self
+
+    @property
+    def tabla_fts(self):
+        return nombre_tabla_busqueda(self.modelo._meta.db_table)
+
+    @staticmethod
+    def usa_fts():
+        return connection.vendor == "sqlite"
+
+    def buscar(self, texto, valores, limite=LIMITE_POR_DEFECTO):
+        """
+        Devuelve hasta ``limite`` diccionarios con ``valores`` y ``relevancia``, del más al
+        menos relevante.
+
+        Lanza ValueError si ``texto`` tiene menos de LONGITUD_MINIMA caracteres.
+        """
+        texto = texto.strip()
+        if len(texto) < LONGITUD_MINIMA:
+            raise ValueError(
+                f"La búsqueda requiere al menos {LONGITUD_MINIMA} caracteres."
+            )
+        if self.usa_fts():
+            return self.buscar_fts(texto, valores, limite)
+        return self.buscar_trigramas(texto, valores, limite)
+
+    def buscar_trigramas(self, texto, valores, limite):
+        from django.contrib.postgres.search import TrigramWordSimilarity
+
+        filtro = reduce(
+            or_,
+            (
+                Q(**{f"{campo}__contiene_ilike": texto})
+                | Q(**{f"{campo}__trigram_word_similar": texto})
+                for campo in self.campos
+            ),
+        )
+        similitudes = [TrigramWordSimilarity(texto, campo) for campo in self.campos]
+        relevancia = Greatest(*similitudes) if len(similitudes) > 1 else similitudes[0]
+        candidatos = self.modelo.objects.filter(filtro).values("pk")[:CANDIDATOS_MAXIMOS]
+        return list(
+            self.modelo.objects.filter(pk__in=candidatos)
+            .annotate(relevancia=relevancia)
+            .order_by("-relevancia", "pk")
+            .values(*valores, "relevancia")[:limite]
+        )
+
+    def buscar_fts(self, texto, valores, limite):
+        # Una frase entre comillas: FTS5 no interpreta operadores dentro de ella. No se
+        # usa bm25: su IDF obliga a contar todas las coincidencias de la frase y, con una
+        # sola frase, es igual para todas las filas.
+        frase = '"{}"'.format(texto.replace('"', '""'))
+        columnas = ", ".join(f'"{campo}"' for campo in self.campos)
+        with connection.cursor() as cursor:
+            cursor.execute(
+                f'SELECT pk, {columnas} FROM "{self.tabla_fts}" '
+                f'WHERE "{self.tabla_fts}" MATCH %s LIMIT %s',
+                [frase, CANDIDATOS_MAXIMOS],
+            )
+            relevancias = {
+                uuid.UUID(pk): relevancia_subcadena(texto, campos)
+                for pk, *campos in cursor.fetchall()
+            }
+        mejores = sorted(relevancias, key=lambda pk: (-relevancias[pk], pk))[:limite]
+        filas = self.modelo.objects.filter(pk__in=mejores).values("pk", *valores)
+        resultados = [
+            {
+                **{campo: fila[campo] for campo in valores},
+                "relevancia": relevancias[fila["pk"]],
+            }
+            for fila in filas
+        ]
+        return sorted(resultados, key=lambda fila: fila["relevancia"], reverse=True)
+
+    def actualizar(self, instancias):
+        """
+        Inserta o reemplaza las instancias en la tabla FTS (sin efecto en PostgreSQL).
+        """
+        if self.usa_fts():
+            filas = [
+                (instancia.pk, *(getattr(instancia, campo) for campo in self.campos))
+                for instancia in instancias
+            ]
+            insertar_filas(connection, self.tabla_fts, self.campos, filas)
+
+    def al_guardar(self, sender, instance, update_fields=None, **kwargs):
+        """
+        Receptor de post_save: actualiza la fila salvo que se guardaran solo otros campos
+        (p. ej. last_login al iniciar sesión).
+        """
+        if update_fields and not set(update_fields) & set(self.campos):
+            return
+        self.actualizar([instance])
+
+    def al_eliminar(self, sender, instance, **kwargs):
+        """
+        Receptor de post_delete.
+        """
+        self.eliminar([instance.pk])
+
+    def eliminar(self, pks):
+        if self.usa_fts():
+            with connection.cursor() as cursor:
+                cursor.executemany(
+                    f'DELETE FROM "{self.tabla_fts}" WHERE rowid = %s',
+                    [(rowid_busqueda(pk),) for pk in pks],
+                )
+
+    def reconstruir(self, batch_size=2000):
+        """
+        Vuelve a generar la tabla FTS a partir del modelo. Retorna el número de filas.
+        """
+        if not self.usa_fts():
+            return 0
+        with connection.cursor() as cursor:
+            cursor.execute(f'DELETE FROM "{self.tabla_fts}"')
+        total = 0
+        lote = []
+        for fila in self.modelo.objects.values_list("pk", *self.campos).iterator(
+            chunk_size=batch_size
+        ):
+            lote.append(fila)
+            if len(lote) >= batch_size:
+                insertar_filas(connection, self.tabla_fts, self.campos, lote)
+                total += len(lote)
+                lote = []
+        insertar_filas(connection, self.tabla_fts, self.campos, lote)
+        with connection.cursor() as cursor:
+            # Une los segmentos que dejan las inserciones por lotes.
+            cursor.execute(
+                f'INSERT INTO "{self.tabla_fts}"("{self.tabla_fts}") VALUES (%s)',
+                ["optimize"],
+            )
+        return total + len(lote)
+
+
+def buscar_desde_parametros(indice, params, valores):
+    """
+    Ejecuta la búsqueda de una acción ``buscar`` de la API.
+
+    Parámetros:
+    - indice: IndiceBusqueda del modelo.
+    - params: query_params con ``q`` (texto) y ``limite`` (opcional, hasta LIMITE_MAXIMO).
+    - valores: Campos de cada resultado.
+
+    Lanza ValidationError (400) si el texto es demasiado corto o el límite no es válido.
+    """
+    from rest_framework.exceptions import ValidationError
+
+    try:
+        limite = int(params.get("limite", LIMITE_POR_DEFECTO))
+    except ValueError:
+        raise ValidationError({"limite": "Debe ser un número entero."})
+    if limite < 1:
+        raise ValidationError({"limite": "Debe ser mayor que cero."})
+    try:
+        return indice.buscar(params.get("q", ""), valores, min(limite, LIMITE_MAXIMO))
+    except ValueError as error:
+        raise ValidationError({"q": str(error)})
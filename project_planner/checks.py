@@ -0,0 +1,137 @@
+"""
+Checks del sistema propios del proyecto.
+"""
+
+from django.conf import settings
+from django.contrib.admin.checks import check_dependencies
+from django.core import checks
+from django.core.checks.registry import registry
+from django.core.checks.security.base import (
+    check_xframe_deny,
+    check_xframe_options_middleware,
+)
+from django.core.checks.security.csrf import check_csrf_cookie_secure, check_csrf_middleware
+from django.utils.module_loading import import_string
+
+# Middleware que el admin necesita, con el id del check de Django que los exige.
+MIDDLEWARE_ADMIN = {
+    "admin.E408": "django.contrib.auth.middleware.AuthenticationMiddleware",
+    "admin.E409": "django.contrib.messages.middleware.MessageMiddleware",
+    "admin.E410": "django.contrib.sessions.middleware.SessionMiddleware",
+}
+
+# Middleware que exigen los checks de despliegue de Django, con el id del check.
+MIDDLEWARE_SEGURIDAD = {
+    "security.W002": "django.middleware.clickjacking.XFrameOptionsMiddleware",
+    "security.W003": "django.middleware.csrf.CsrfViewMiddleware",
+}
+
+
+def contiene_subclase(ruta, rutas):
+    clase = import_string(ruta)
+    return any(issubclass(import_string(otra), clase) for otra in rutas)
+
+
+def middleware_fuera_de_api():
+    """
+    Devuelve los middleware por los que pasan las rutas fuera de la API: MIDDLEWARE y, si
+    FueraDeAPIMiddleware está en MIDDLEWARE, MIDDLEWARE_FUERA_DE_API.
+    """
+    middleware = list(settings.MIDDLEWARE)
+    if contiene_subclase("project_planner.middleware.FueraDeAPIMiddleware", middleware):
+        middleware += getattr(settings, "MIDDLEWARE_FUERA_DE_API", [])
+    return middleware
+
+
+def comprobar_dependencias_admin(app_configs=None, **kwargs):
+    """
+    check_dependencies del admin con admin.E408, admin.E409 y admin.E410 evaluados sobre
+    los middleware de las rutas fuera de la API (ver middleware_fuera_de_api), donde están
+    las sesiones, los mensajes y la autenticación que usa el admin.
+    """
+    errores = [
+        error
+        for error in check_dependencies(app_configs=app_configs, **kwargs)
+        if error.id not in MIDDLEWARE_ADMIN
+    ]
+    middleware = middleware_fuera_de_api()
+    for id_check, ruta in MIDDLEWARE_ADMIN.items():
+        if not contiene_subclase(ruta, middleware):
+            errores.append(
+                checks.Error(
+                    f"'{ruta}' debe estar en MIDDLEWARE_FUERA_DE_API (o en MIDDLEWARE) "
+                    "para usar el admin.",
+                    hint=(
+                        "MIDDLEWARE_FUERA_DE_API solo se aplica si "
+                        "'project_planner.middleware.FueraDeAPIMiddleware' está en "
+                        "MIDDLEWARE."
+                    ),
+                    id=id_check,
+                )
+            )
+    return errores
+
+
+def comprobar_middleware_seguridad(app_configs=None, **kwargs):
+    """
+    Checks de despliegue de Django sobre CSRF y X-Frame-Options evaluados sobre los
+    middleware de las rutas fuera de la API (ver middleware_fuera_de_api), donde están
+    CsrfViewMiddleware y XFrameOptionsMiddleware; la API autentica con JWT y no los usa.
+
+    Reemplaza a security.W002 y security.W003 (falta el middleware) y a security.W016 y
+    security.W019 (su configuración), que Django solo evalúa si el middleware está en
+    MIDDLEWARE.
+    """
+    middleware = middleware_fuera_de_api()
+    advertencias = [
+        checks.Warning(
+            f"'{ruta}' no está en MIDDLEWARE_FUERA_DE_API (ni en MIDDLEWARE): las rutas "
+            "fuera de la API quedan sin esa protección.",
+            hint=(
+                "MIDDLEWARE_FUERA_DE_API solo se aplica si "
+                "'project_planner.middleware.FueraDeAPIMiddleware' está en MIDDLEWARE."
+            ),
+            id=id_check,
+        )
+        for id_check, ruta in MIDDLEWARE_SEGURIDAD.items()
+        if not contiene_subclase(ruta, middleware)
+    ]
+    if (
+        contiene_subclase(MIDDLEWARE_SEGURIDAD["security.W002"], middleware)
+        and settings.X_FRAME_OPTIONS != "DENY"
+    ):
+        advertencias.append(
+            checks.Warning(
+                "X_FRAME_OPTIONS no es 'DENY': las páginas fuera de la API se pueden "
+                "mostrar dentro de un frame.",
+                id="security.W019",
+            )
+        )
+    if (
+        contiene_subclase(MIDDLEWARE_SEGURIDAD["security.W003"], middleware)
+        and not settings.CSRF_USE_SESSIONS
+        and settings.CSRF_COOKIE_SECURE is not True
+    ):
+        advertencias.append(
+            checks.Warning(
+                "CSRF_COOKIE_SECURE no es True: la cookie CSRF de las rutas fuera de la "
+                "API también se envía sin HTTPS.",
+                id="security.W016",
+            )
+        )
+    return advertencias
+
+
+def reemplazar_checks_seguridad():
+    """
+    Registra comprobar_middleware_seguridad en lugar de los checks de despliegue de Django
+    que solo buscan CsrfViewMiddleware y XFrameOptionsMiddleware en MIDDLEWARE.
+    """
+    for check in (
+        check_xframe_options_middleware,
+        check_xframe_deny,
+        check_csrf_middleware,
+        check_csrf_cookie_secure,
+    ):
+        registry.deployment_checks.discard(check)
+    checks.register(comprobar_middleware_seguridad, checks.Tags.security, deploy=True)
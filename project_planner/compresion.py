@@ -0,0 +1,125 @@
+"""
+Compresión gzip y brotli de respuestas (ver project_planner.middleware.CompresionMiddleware).
+
+brotli es opcional: si el paquete no está instalado solo se ofrece gzip.
+"""
+
+import zlib
+
+try:
+    import brotli
+except ImportError:  # pragma: no cover - brotli es opcional.
+    brotli = None
+
+# En una respuesta en streaming, se vacía el compresor cada vez que recibe esta cantidad
+# de bytes sin comprimir, para que el cliente reciba datos aunque la vista genere
+# lentamente (p. ej. entre lotes de la base de datos).
+VACIADO_STREAMING = 64 * 1024
+
+
+class CompresorGzip:
+    def __init__(self, nivel):
+        # wbits=31: formato gzip (cabecera y CRC), como GzipFile.
+        self.compresor = zlib.compressobj(nivel, zlib.DEFLATED, 31)
+
+    def comprimir(self, datos):
+        return self.compresor.compress(datos)
+
+    def vaciar(self):
+        return self.compresor.flush(zlib.Z_SYNC_FLUSH)
+
+    def terminar(self):
+        return self.compresor.flush()
+
+
+class CompresorBrotli:
+    def __init__(self, nivel):
+        self.compresor = brotli.Compressor(quality=nivel)
+
+    def comprimir(self, datos):
+        return self.compresor.process(datos)
+
+    def vaciar(self):
+        return self.compresor.flush()
+
+    def terminar(self):
+        return self.compresor.finish()
+
+
+# Codificaciones en orden de preferencia del servidor a igual calidad.
+COMPRESORES = {"br": CompresorBrotli, "gzip": CompresorGzip}
+
+
+def codificaciones_disponibles():
+    return [codificacion for codificacion in COMPRESORES if codificacion != "br" or brotli]
+
+
+def elegir_codificacion(accept_encoding, disponibles):
+    """
+    Elige la codificación de ``disponibles`` con mayor calidad (``q``) en la cabecera
+    Accept-Encoding; a igual calidad, la primera de ``disponibles``. ``*`` se aplica a
+    las codificaciones no mencionadas y ``q=0`` las excluye. Retorna None si ninguna es
+    aceptable.
+    """
+    calidades = {}
+    for parte in accept_encoding.split(","):
+        nombre, _, parametros = parte.partition(";")
+        nombre = nombre.strip().lower()
+        if not nombre:
+            continue
+        calidad = 1.0
+        parametro, _, valor = parametros.strip().partition("=")
+        if parametro.strip().lower() == "q":
+            try:
+                calidad = float(valor)
+            except ValueError:
+                calidad = 0.0
+        calidades[nombre] = calidad
+
+    comodin = calidades.get("*", 0.0)
+    mejor, mejor_calidad = None, 0.0
+    for codificacion in disponibles:
+        calidad = calidades.get(codificacion, comodin)
+        if calidad > mejor_calidad:
+            mejor, mejor_calidad = codificacion, calidad
+    return mejor
+
+
+def comprimir(codificacion, nivel, contenido):
+    compresor = COMPRESORES[codificacion](nivel)
+    return compresor.comprimir(contenido) + compresor.terminar()
+
+
+def comprimir_secuencia(codificacion, nivel, bloques):
+    """
+    Comprime un iterable de bloques a medida que se consume. Devuelve la salida del
+    compresor en cuanto la hay y lo vacía cada VACIADO_STREAMING bytes de entrada.
+    """
+    compresor = COMPRESORES[codificacion](nivel)
+    pendientes = 0
+    for bloque in bloques:
+        salida = compresor.comprimir(bloque)
+        pendientes += len(bloque)
+        if pendientes >= VACIADO_STREAMING:
+            salida += compresor.vaciar()
+            pendientes = 0
+        if salida:
+            yield salida
+    yield compresor.terminar()
+
+
+async def acomprimir_secuencia(codificacion, nivel, bloques):
+    """
+    Versión asíncrona de comprimir_secuencia para respuestas en streaming bajo ASGI.
+    """
+    compresor = COMPRESORES[codificacion](nivel)
+    pendientes = 0
+    async for bloque in bloques:
+        salida = compresor.comprimir(bloque)
+        pendientes += len(bloque)
+        if pendientes >= VACIADO_STREAMING:
+            salida += compresor.vaciar()
+            pendientes = 0
+        if salida:
+            yield salida
+    yield compresor.terminar()
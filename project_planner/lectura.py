@@ -0,0 +1,149 @@
+from django.conf import settings
+from django.utils import timezone
+from rest_framework import ISO_8601, serializers
+from rest_framework.exceptions import ValidationError
+from rest_framework.response import Response
+from rest_framework.settings import api_settings
+
+# Valor que indica que un campo no se incluye en la representación.
+OMITIR = object()
+
+
+class CampoLectura:
+    """
+    Campo de un SerializadorLectura: una columna de QuerySet.values() y, opcionalmente,
+    la función que convierte su valor.
+
+    Parámetros:
+    - columna: Lookup de values() (p. ej. "proceso_id" o "proceso__nombre").
+    - convertir: Función aplicada al valor si no es None.
+    - omitir_nulo: Si es True el campo no se incluye cuando el valor es None. Reproduce
+      los ReadOnlyField con ``source`` a través de una relación opcional, que DRF omite
+      cuando la relación está vacía.
+    """
+
+    def __init__(self, columna, convertir=None, omitir_nulo=False):
+        self.columna = columna
+        self.convertir = convertir
+        self.omitir_nulo = omitir_nulo
+
+    def preparar(self):
+        """
+        Devuelve la función que representa los valores de una serialización.
+        """
+        return self.representar
+
+    def representar(self, valor):
+        if valor is None:
+            return OMITIR if self.omitir_nulo else None
+        return self.convertir(valor) if self.convertir else valor
+
+
+class CampoFechaHora(CampoLectura):
+    """
+    Fecha y hora con la misma salida que serializers.DateTimeField.
+
+    DateTimeField consulta la zona horaria activa en cada valor; aquí se consulta una vez
+    por serialización. Si DATETIME_FORMAT no es ISO 8601 o la zona no aplica, se delega en
+    DateTimeField.
+    """
+
+    def __init__(self, columna):
+        super().__init__(columna, serializers.DateTimeField().to_representation)
+
+    def preparar(self):
+        zona = timezone.get_current_timezone() if settings.USE_TZ else None
+        if zona is None or api_settings.DATETIME_FORMAT.lower() != ISO_8601:
+            return self.representar
+
+        def representar(valor):
+            if valor is None or timezone.is_naive(valor):
+                return self.representar(valor)
+            texto = valor.astimezone(zona).isoformat()
+            return texto[:-6] + "Z" if texto.endswith("+00:00") else texto
+
+        return representar
+
+
+class SerializadorLectura:
+    """
+    Serialización de solo lectura para listados.
+
+    Convierte filas de ``QuerySet.values()`` en diccionarios con la misma salida JSON que
+    el ModelSerializer equivalente, sin instanciar modelos ni recorrer los campos de DRF
+    por cada objeto. Las subclases declaran ``campos`` como ``{nombre: CampoLectura}`` en
+    el orden de la salida.
+
+    Parámetros:
+    - seleccion: Nombres de los campos a incluir (sparse fieldsets); por defecto todos.
+    """
+
+    campos = {}
+
+    def __init__(self, seleccion=None):
+        self.seleccion = [
+            (nombre, self.campos[nombre]) for nombre in (seleccion or self.campos)
+        ]
+
+    def columnas(self):
+        return [campo.columna for _, campo in self.seleccion]
+
+    def serializar(self, filas):
+        campos = [
+            (nombre, campo.columna, campo.preparar()) for nombre, campo in self.seleccion
+        ]
+        resultado = []
+        for fila in filas:
+            datos = {}
+            for nombre, columna, representar in campos:
+                valor = representar(fila[columna])
+                if valor is not OMITIR:
+                    datos[nombre] = valor
+            resultado.append(datos)
+        return resultado
+
+
+class ListadoLigeroMixin:
+    """
+    Listado de un ModelViewSet con un SerializadorLectura y ``?fields=``.
+
+    La acción list lee solo las columnas de los campos pedidos con ``QuerySet.values()``
+    (más los campos del orden, que la paginación por cursor necesita para la
+    posición) y las serializa con ``lectura_class``. ``?fields=id,nombre`` limita la
+    salida y el SQL a esos campos; un campo desconocido devuelve 400. Las demás acciones
+    siguen usando serializer_class.
+    """
+
+    lectura_class = None
+
+    def campos_solicitados(self):
+        valor = self.request.query_params.get("fields")
+        if not valor:
+            return None
+        campos = list(dict.fromkeys(c.strip() for c in valor.split(",") if c.strip()))
+        desconocidos = [c for c in campos if c not in self.lectura_class.campos]
+        if desconocidos or not campos:
+            raise ValidationError(
+                {
+                    "fields": "Campos no válidos: {}. Disponibles: {}.".format(
+                        ", ".join(desconocidos) or "ninguno",
+                        ", ".join(self.lectura_class.campos),
+                    )
+                }
+            )
+        return campos
+
+    def list(self, request, *args, **kwargs):
+        serializador = self.lectura_class(self.campos_solicitados())
+        queryset = self.filter_queryset(self.get_queryset())
+        columnas = serializador.columnas()
+        if hasattr(self.paginator, "get_ordering"):
+            # La paginación por cursor lee la posición de los campos del orden.
+            orden = self.paginator.get_ordering(request, queryset, self)
+            columnas.extend(campo.lstrip("-") for campo in orden)
+        filas = queryset.values(*dict.fromkeys(columnas))
+
+        pagina = self.paginate_queryset(filas)
+        if pagina is not None:
+            return self.get_paginated_response(serializador.serializar(pagina))
+        return Response(serializador.serializar(filas))
@@ -0,0 +1,503 @@
+import functools
+import json
+import logging
+import time
+from collections import defaultdict
+from contextlib import ExitStack
+from contextvars import ContextVar
+
+from asgiref.sync import iscoroutinefunction, markcoroutinefunction
+from django.conf import settings
+from django.db import connections
+from django.utils.cache import patch_vary_headers
+from django.utils.module_loading import import_string
+
+from .compresion import (
+    acomprimir_secuencia,
+    codificaciones_disponibles,
+    comprimir,
+    comprimir_secuencia,
+    elegir_codificacion,
+)
+
+logger = logging.getLogger(__name__)
+logger_perfilado = logging.getLogger("project_planner.perfilado")
+
+MEDICION_MIDDLEWARE = "project_planner.middleware.MedicionMiddleware"
+
+
+def agregar_server_timing(response, metrica):
+    """
+    Agrega una métrica a la cabecera Server-Timing conservando las existentes.
+    """
+    existente = response.get("Server-Timing")
+    response["Server-Timing"] = f"{existente}, {metrica}" if existente else metrica
+
+
+class AutenticacionTimingMiddleware:
+    """
+    Publica en la cabecera Server-Timing el autenticador que se ejecutó y su duración.
+
+    Los datos los registra usuarios_app.autenticacion.registrar_autenticacion; si la vista
+    no ejecutó ningún autenticador medido la respuesta no se modifica. Admite solicitudes
+    síncronas y asíncronas, para no forzar cambios de hilo bajo ASGI.
+    """
+
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+        if iscoroutinefunction(get_response):
+            markcoroutinefunction(self)
+
+    def __call__(self, request):
+        if iscoroutinefunction(self):
+            return self.__acall__(request)
+        return self.agregar_metrica(request, self.get_response(request))
+
+    async def __acall__(self, request):
+        return self.agregar_metrica(request, await self.get_response(request))
+
+    def agregar_metrica(self, request, response):
+        autenticacion = getattr(request, "autenticacion", None)
+        if autenticacion:
+            agregar_server_timing(
+                response,
+                'auth;desc="{} ({})";dur={:.3f}'.format(
+                    autenticacion["autenticador"],
+                    autenticacion["resultado"],
+                    autenticacion["duracion"] * 1000,
+                ),
+            )
+        return response
+
+
+class FueraDeAPIMiddleware:
+    """
+    Ejecuta los middleware de MIDDLEWARE_FUERA_DE_API solo para las rutas que no empiezan
+    con API_PREFIJO.
+
+    La API es JWT y sin estado: no necesita cargar la sesión, validar CSRF (DRF ya exime
+    sus vistas), guardar mensajes ni la cabecera X-Frame-Options. El admin y las demás
+    rutas pasan por la pila completa, incluidos los process_view y process_exception de
+    esos middleware (p. ej. la validación de CsrfViewMiddleware).
+    """
+
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+        self.prefijo = settings.API_PREFIJO
+        self.process_view_hooks = []
+        self.process_exception_hooks = []
+
+        # Igual que BaseHandler.load_middleware: se construye de adentro hacia afuera.
+        cadena = get_response
+        for ruta in reversed(settings.MIDDLEWARE_FUERA_DE_API):
+            middleware = import_string(ruta)(cadena)
+            if hasattr(middleware, "process_view"):
+                self.process_view_hooks.insert(0, middleware.process_view)
+            if hasattr(middleware, "process_exception"):
+                self.process_exception_hooks.append(middleware.process_exception)
+            cadena = middleware
+        self.cadena = cadena
+
+        if iscoroutinefunction(get_response):
+            markcoroutinefunction(self)
+
+    def es_api(self, request):
+        return request.path_info.startswith(self.prefijo)
+
+    def __call__(self, request):
+        if iscoroutinefunction(self):
+            return self.__acall__(request)
+        if self.es_api(request):
+            return self.get_response(request)
+        return self.cadena(request)
+
+    async def __acall__(self, request):
+        if self.es_api(request):
+            return await self.get_response(request)
+        return await self.cadena(request)
+
+    def process_view(self, request, view_func, view_args, view_kwargs):
+        if self.es_api(request):
+            return None
+        for hook in self.process_view_hooks:
+            response = hook(request, view_func, view_args, view_kwargs)
+            if response is not None:
+                return response
+        return None
+
+    def process_exception(self, request, exception):
+        if self.es_api(request):
+            return None
+        for hook in self.process_exception_hooks:
+            response = hook(request, exception)
+            if response is not None:
+                return response
+        return None
+
+
+class CompresionMiddleware:
+    """
+    Comprime con brotli o gzip, según el Accept-Encoding del cliente, las respuestas
+    cuyo tipo de contenido está en COMPRESION_NIVELES, con el nivel configurado para ese
+    tipo y codificación.
+
+    - Las respuestas normales menores que COMPRESION_TAMANO_MINIMO bytes, o que no se
+      reducen al comprimirlas, se envían sin comprimir. El tiempo de compresión se
+      publica en Server-Timing.
+    - Las respuestas en streaming (p. ej. la exportación de proyectos), síncronas o
+      asíncronas, se comprimen a medida que se generan, sin acumular el cuerpo.
+    - No se modifican las respuestas que ya tienen Content-Encoding. Un ETag fuerte pasa
+      a ser débil (``W/``), como en GZipMiddleware de Django; get_conditional_response
+      compara los ETag de forma débil, por lo que el 304 sigue funcionando.
+    """
+
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+        self.niveles = settings.COMPRESION_NIVELES
+        self.minimo = settings.COMPRESION_TAMANO_MINIMO
+        self.disponibles = codificaciones_disponibles()
+        if iscoroutinefunction(get_response):
+            markcoroutinefunction(self)
+
+    def __call__(self, request):
+        if iscoroutinefunction(self):
+            return self.__acall__(request)
+        return self.comprimir(request, self.get_response(request))
+
+    async def __acall__(self, request):
+        return self.comprimir(request, await self.get_response(request))
+
+    def comprimir(self, request, response):
+        if response.has_header("Content-Encoding"):
+            return response
+        tipo = response.get("Content-Type", "").split(";", 1)[0].strip().lower()
+        niveles = self.niveles.get(tipo)
+        if not niveles:
+            return response
+        if not response.streaming and len(response.content) < self.minimo:
+            return response
+
+        patch_vary_headers(response, ("Accept-Encoding",))
+        codificacion = elegir_codificacion(
+            request.META.get("HTTP_ACCEPT_ENCODING", ""),
+            [c for c in self.disponibles if c in niveles],
+        )
+        if codificacion is None:
+            return response
+        nivel = niveles[codificacion]
+
+        if response.streaming:
+            if response.is_async:
+                response.streaming_content = acomprimir_secuencia(
+                    codificacion, nivel, response.streaming_content
+                )
+            else:
+                response.streaming_content = comprimir_secuencia(
+                    codificacion, nivel, response.streaming_content
+                )
+            # El tamaño comprimido no se conoce hasta terminar.
+            del response.headers["Content-Length"]
+        else:
+            inicio = time.perf_counter()
+            contenido = comprimir(codificacion, nivel, response.content)
+            duracion = time.perf_counter() - inicio
+            if len(contenido) >= len(response.content):
+                return response
+            agregar_server_timing(
+                response,
+                f'compresion;desc="{codificacion} {nivel}: '
+                f'{len(response.content)} -> {len(contenido)} B";dur={duracion * 1000:.3f}',
+            )
+            response.content = contenido
+            response.headers["Content-Length"] = str(len(contenido))
+
+        etag = response.get("ETag")
+        if etag and etag.startswith('"'):
+            response.headers["ETag"] = "W/" + etag
+        response.headers["Content-Encoding"] = codificacion
+        return response
+
+
+def intercalar_medicion(middleware):
+    """
+    Devuelve la lista de middleware con MedicionMiddleware antes y después de cada uno,
+    para medir cuánto tarda cada middleware por solicitud.
+    """
+    resultado = [MEDICION_MIDDLEWARE]
+    for ruta in middleware:
+        resultado += [ruta, MEDICION_MIDDLEWARE]
+    return resultado
+
+
+class MedicionMiddleware:
+    """
+    Marca de tiempo entre middleware (ver intercalar_medicion).
+
+    Cada marca anota el instante en que la solicitud la atraviesa hacia adentro y hacia
+    afuera. La marca más externa calcula el tiempo propio de cada middleware (su parte
+    antes y después del siguiente) y de la vista, y lo publica en Server-Timing
+    (``mw;desc="<Clase>";dur=...``) y en el logger project_planner.middleware.
+    """
+
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+        if iscoroutinefunction(get_response):
+            markcoroutinefunction(self)
+
+    def __call__(self, request):
+        if iscoroutinefunction(self):
+            return self.__acall__(request)
+        indice = self.entrar(request)
+        response = self.get_response(request)
+        return self.salir(request, response, indice)
+
+    async def __acall__(self, request):
+        indice = self.entrar(request)
+        response = await self.get_response(request)
+        return self.salir(request, response, indice)
+
+    def entrar(self, request):
+        if not hasattr(request, "_medicion_entradas"):
+            request._medicion_entradas = []
+            request._medicion_salidas = []
+        request._medicion_entradas.append(time.perf_counter())
+        return len(request._medicion_entradas) - 1
+
+    def salir(self, request, response, indice):
+        request._medicion_salidas.append(time.perf_counter())
+        if indice == 0:
+            self.publicar(request, response)
+        return response
+
+    def publicar(self, request, response):
+        entradas = request._medicion_entradas
+        # Las salidas se registran de adentro hacia afuera.
+        salidas = request._medicion_salidas[::-1]
+        # Los middleware medidos son los que siguen a la primera marca; los anteriores
+        # (si se agregaron después de intercalar_medicion) no tienen marcas propias.
+        middleware = list(settings.MIDDLEWARE)
+        nombres = [
+            ruta.rsplit(".", 1)[-1]
+            for ruta in middleware[middleware.index(MEDICION_MIDDLEWARE) + 1 :]
+            if ruta != MEDICION_MIDDLEWARE
+        ]
+        # Un middleware que responde sin llamar al siguiente deja marcas sin recorrer.
+        recorridos = len(entradas) - 1
+        tiempos = {}
+        for i, nombre in enumerate(nombres[:recorridos]):
+            tiempos[nombre] = (entradas[i + 1] - entradas[i]) + (salidas[i] - salidas[i + 1])
+        ultimo = nombres[recorridos] if recorridos < len(nombres) else "vista"
+        tiempos[ultimo] = salidas[recorridos] - entradas[recorridos]
+
+        for nombre, duracion in tiempos.items():
+            agregar_server_timing(response, f'mw;desc="{nombre}";dur={duracion * 1000:.3f}')
+        logger.debug(
+            "middleware %s %s",
+            request.path,
+            {nombre: round(duracion * 1000, 3) for nombre, duracion in tiempos.items()},
+        )
+
+
+class RegistroConsultas:
+    """
+    execute_wrapper que anota el SQL (con sus marcadores, sin parámetros), los
+    parámetros y la duración de cada consulta.
+    """
+
+    def __init__(self):
+        self.consultas = []
+
+    def __call__(self, execute, sql, params, many, context):
+        inicio = time.perf_counter()
+        try:
+            return execute(sql, params, many, context)
+        finally:
+            self.consultas.append((sql, repr(params), time.perf_counter() - inicio))
+
+    @property
+    def duracion(self):
+        return sum(duracion for _, _, duracion in self.consultas)
+
+    def repetidas(self, umbral):
+        """
+        Devuelve las consultas que se ejecutaron al menos ``umbral`` veces con
+        parámetros distintos (patrón N+1), de la más a la menos repetida.
+        """
+        parametros = defaultdict(list)
+        for sql, params, _ in self.consultas:
+            parametros[sql].append(params)
+        repetidas = [
+            {"sql": sql, "repeticiones": len(valores)}
+            for sql, valores in parametros.items()
+            if len(valores) >= umbral and len(set(valores)) > 1
+        ]
+        return sorted(repetidas, key=lambda r: r["repeticiones"], reverse=True)
+
+
+class RegistroSerializacion:
+    """
+    Tiempo acumulado en serializers durante una solicitud perfilada.
+
+    Solo se mide la llamada más externa: los serializers anidados (o un ``.data`` llamado
+    dentro de otro serializer) quedan dentro de su tiempo y no se suman dos veces.
+    """
+
+    def __init__(self):
+        self.duracion = 0.0
+        self.activa = False
+
+
+# Registro de la solicitud perfilada en curso; None fuera de PerfiladoMiddleware. Es una
+# variable de contexto para que dos solicitudes en hilos distintos no se mezclen.
+_serializacion_actual = ContextVar("perfilado_serializacion", default=None)
+
+
+def medir_serializacion(funcion):
+    """
+    Envuelve ``funcion`` para sumar su duración al RegistroSerializacion en curso.
+    """
+
+    @functools.wraps(funcion)
+    def envoltura(*args, **kwargs):
+        registro = _serializacion_actual.get()
+        if registro is None or registro.activa:
+            return funcion(*args, **kwargs)
+        registro.activa = True
+        inicio = time.perf_counter()
+        try:
+            return funcion(*args, **kwargs)
+        finally:
+            registro.duracion += time.perf_counter() - inicio
+            registro.activa = False
+
+    envoltura.perfilado = True
+    return envoltura
+
+
+def instalar_medicion_serializacion():
+    """
+    Envuelve los puntos de entrada de la serialización con medir_serializacion:
+    BaseSerializer.data, que usan Serializer y ListSerializer para llamar a
+    to_representation, y SerializadorLectura.serializar (listados ligeros). Se hace una
+    sola vez, al crear PerfiladoMiddleware; sin solicitud perfilada en curso la envoltura
+    solo consulta la variable de contexto.
+    """
+    # Importados aquí: este módulo se importa desde los settings.
+    from rest_framework.serializers import BaseSerializer
+
+    from .lectura import SerializadorLectura
+
+    if not getattr(BaseSerializer.data.fget, "perfilado", False):
+        BaseSerializer.data = property(medir_serializacion(BaseSerializer.data.fget))
+    if not getattr(SerializadorLectura.serializar, "perfilado", False):
+        SerializadorLectura.serializar = medir_serializacion(SerializadorLectura.serializar)
+
+
+def nombre_vista(view_func, metodo):
+    """
+    Nombre legible de la vista: ``ProyectoViewSet.list``, ``ListaCombinadaAPIView`` o el
+    nombre de la función.
+    """
+    clase = getattr(view_func, "cls", None)
+    if clase is None:
+        return getattr(view_func, "__name__", type(view_func).__name__)
+    accion = (getattr(view_func, "actions", None) or {}).get(metodo.lower())
+    return f"{clase.__name__}.{accion}" if accion else clase.__name__
+
+
+class PerfiladoMiddleware:
+    """
+    Perfilado por solicitud, activado con DJANGO_PERFILADO=1 (ver settings).
+
+    Registra la vista DRF, el número de consultas SQL y su tiempo total, el tiempo de
+    serialización (to_representation de los serializers y SerializadorLectura, ver
+    instalar_medicion_serializacion; incluye las consultas que hagan los serializers), el
+    tiempo de renderizado de la respuesta (codificación a JSON del renderer) y el tiempo
+    total. Marca como
+    N+1 el mismo SQL repetido PERFILADO_UMBRAL_N_MAS_1 veces o más con parámetros
+    distintos. Publica el resultado en Server-Timing y como un registro JSON en el logger
+    project_planner.perfilado (WARNING si hay N+1, INFO en otro caso).
+
+    Solo es síncrono: las conexiones son por hilo y bajo ASGI Django lo ejecuta en el
+    mismo hilo que las consultas de la vista. Si no está en MIDDLEWARE no tiene costo.
+    """
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+        self.umbral = settings.PERFILADO_UMBRAL_N_MAS_1
+        instalar_medicion_serializacion()
+
+    def __call__(self, request):
+        registro = RegistroConsultas()
+        request._perfilado_render = [None, None]
+        request._perfilado_serializacion = RegistroSerializacion()
+        marca = _serializacion_actual.set(request._perfilado_serializacion)
+        inicio = time.perf_counter()
+        try:
+            with ExitStack() as pila:
+                for conexion in connections.all():
+                    pila.enter_context(conexion.execute_wrapper(registro))
+                response = self.get_response(request)
+        finally:
+            _serializacion_actual.reset(marca)
+        total = time.perf_counter() - inicio
+        self.publicar(request, response, registro, total)
+        return response
+
+    def process_view(self, request, view_func, view_args, view_kwargs):
+        request._perfilado_vista = nombre_vista(view_func, request.method)
+
+    def process_template_response(self, request, response):
+        # Se llama justo antes de response.render(); el callback marca su final.
+        marcas = request._perfilado_render
+        marcas[0] = time.perf_counter()
+        response.add_post_render_callback(
+            lambda _: marcas.__setitem__(1, time.perf_counter())
+        )
+        return response
+
+    def publicar(self, request, response, registro, total):
+        inicio_render, fin_render = request._perfilado_render
+        render = fin_render - inicio_render if fin_render else 0.0
+        repetidas = registro.repetidas(self.umbral)
+        datos = {
+            "metodo": request.method,
+            "ruta": request.path,
+            "vista": getattr(request, "_perfilado_vista", None),
+            "estado": response.status_code,
+            "consultas": len(registro.consultas),
+            "sql_ms": round(registro.duracion * 1000, 3),
+            "serializacion_ms": round(request._perfilado_serializacion.duracion * 1000, 3),
+            "render_ms": round(render * 1000, 3),
+            "total_ms": round(total * 1000, 3),
+            "n_mas_1": repetidas,
+        }
+
+        metricas = [
+            f'db;desc="{datos["consultas"]} consultas";dur={datos["sql_ms"]:.3f}',
+            f"serializacion;dur={datos['serializacion_ms']:.3f}",
+            f"render;dur={datos['render_ms']:.3f}",
+            f'total;desc="{datos["vista"]}";dur={datos["total_ms"]:.3f}',
+        ]
+        if repetidas:
+            metricas.append(
+                f'nmas1;desc="{len(repetidas)} consultas repetidas '
+                f'(max {repetidas[0]["repeticiones"]})"'
+            )
+        for metrica in metricas:
+            agregar_server_timing(response, metrica)
+
+        nivel = logging.WARNING if repetidas else logging.INFO
+        logger_perfilado.log(nivel, json.dumps(datos), extra={"perfilado": datos})
@@ -0,0 +1,153 @@
+import json
+
+from django.core.exceptions import ValidationError
+from django.db.models import Q
+from rest_framework.exceptions import NotFound
+from rest_framework.filters import OrderingFilter
+from rest_framework.pagination import CursorPagination
+
+
+class FechaCreacionCursorPagination(CursorPagination):
+    """
+    Paginación por cursor (keyset) ordenada por fecha de creación y clave primaria.
+
+    A diferencia de la paginación por número de página, cada página se obtiene con un
+    filtro ``WHERE fecha_creacion < cursor`` sobre un índice, por lo que la página N cuesta
+    lo mismo que la primera y los registros insertados mientras el cliente pagina no
+    desplazan ni duplican resultados.
+
+    La posición del cursor guarda todos los campos del orden, no solo el primero como
+    CursorPagination: con un orden total (ver OrdenCursorFilter) cada posición es única y
+    el cursor nunca necesita desplazamiento, por lo que muchas filas con el mismo valor
+    (p. ej. el mismo desarrollador) no repiten páginas ni chocan con ``offset_cutoff``.
+
+    El tamaño de página por defecto se toma de ``REST_FRAMEWORK["PAGE_SIZE"]`` y el cliente
+    puede ajustarlo con ``?page_size=`` hasta ``max_page_size``.
+    """
+
+    ordering = ("-fecha_creacion", "-pk")
+    page_size_query_param = "page_size"
+    max_page_size = 500
+
+    def paginate_queryset(self, queryset, request, view=None):
+        # Igual que CursorPagination.paginate_queryset, salvo el filtro de la posición
+        # (filtro_posicion) que compara todos los campos del orden.
+        self.page_size = self.get_page_size(request)
+        if not self.page_size:
+            return None
+
+        self.base_url = request.build_absolute_uri()
+        self.ordering = self.get_ordering(request, queryset, view)
+
+        self.cursor = self.decode_cursor(request)
+        if self.cursor is None:
+            (offset, reverse, current_position) = (0, False, None)
+        else:
+            (offset, reverse, current_position) = self.cursor
+
+        if reverse:
+            queryset = queryset.order_by(*invertir_orden(self.ordering))
+        else:
+            queryset = queryset.order_by(*self.ordering)
+
+        if current_position is not None:
+            try:
+                queryset = queryset.filter(self.filtro_posicion(current_position, reverse))
+            except (ValidationError, ValueError):
+                # Valores de la posición que no corresponden al tipo del campo.
+                raise NotFound(self.invalid_cursor_message)
+
+        results = list(queryset[offset : offset + self.page_size + 1])
+        self.page = list(results[: self.page_size])
+
+        if len(results) > len(self.page):
+            has_following_position = True
+            following_position = self._get_position_from_instance(results[-1], self.ordering)
+        else:
+            has_following_position = False
+            following_position = None
+
+        if reverse:
+            self.page = list(reversed(self.page))
+            self.has_next = (current_position is not None) or (offset > 0)
+            self.has_previous = has_following_position
+            if self.has_next:
+                self.next_position = current_position
+            if self.has_previous:
+                self.previous_position = following_position
+        else:
+            self.has_next = has_following_position
+            self.has_previous = (current_position is not None) or (offset > 0)
+            if self.has_next:
+                self.next_position = following_position
+            if self.has_previous:
+                self.previous_position = current_position
+
+        if (self.has_previous or self.has_next) and self.template is not None:
+            self.display_page_controls = True
+
+        return self.page
+
+    def filtro_posicion(self, posicion, reverse):
+        """
+        Condición de las filas que siguen a ``posicion`` en el orden (o la preceden si el
+        cursor va hacia atrás): ``(a, b, c) > (x, y, z)`` desarrollado como
+        ``a > x OR (a = x AND b > y) OR (a = x AND b = y AND c > z)``.
+
+        Se agrega ``a >= x`` para que la base de datos recorra el índice desde la posición
+        en lugar de filtrar desde el inicio.
+        """
+        try:
+            valores = json.loads(posicion)
+        except ValueError:
+            raise NotFound(self.invalid_cursor_message)
+        if not isinstance(valores, list) or len(valores) != len(self.ordering):
+            raise NotFound(self.invalid_cursor_message)
+
+        siguientes = Q()
+        iguales = Q()
+        for orden, valor in zip(self.ordering, valores):
+            campo = orden.lstrip("-")
+            lookup = "lt" if orden.startswith("-") != reverse else "gt"
+            siguientes |= iguales & Q(**{f"{campo}__{lookup}": valor})
+            iguales &= Q(**{campo: valor})
+
+        primero = self.ordering[0]
+        rango = "lte" if primero.startswith("-") != reverse else "gte"
+        return Q(**{f"{primero.lstrip('-')}__{rango}": valores[0]}) & siguientes
+
+    def _get_position_from_instance(self, instance, ordering):
+        valores = []
+        for orden in ordering:
+            campo = orden.lstrip("-")
+            valor = instance[campo] if isinstance(instance, dict) else getattr(instance, campo)
+            valores.append(str(valor))
+        return json.dumps(valores)
+
+
+def invertir_orden(ordering):
+    return tuple(campo[1:] if campo.startswith("-") else f"-{campo}" for campo in ordering)
+
+
+class OrdenCursorFilter(OrderingFilter):
+    """
+    OrderingFilter para vistas con FechaCreacionCursorPagination.
+
+    Completa el orden pedido con ``fecha_creacion`` y ``pk`` en la misma dirección que el
+    primer campo, de modo que el orden sea total (cada posición del cursor es única, así
+    que no salta ni repite registros con valores iguales) y coincida con los índices
+    compuestos ``(campo, fecha_creacion, id)`` del modelo. Sin ``?ordering=`` se usa el
+    ``ordering`` de la vista.
+    """
+
+    desempate = ("fecha_creacion", "pk")
+
+    def get_ordering(self, request, queryset, view):
+        ordering = list(super().get_ordering(request, queryset, view) or [])
+        if not ordering:
+            return ordering
+        prefijo = "-" if ordering[0].startswith("-") else ""
+        presentes = {campo.lstrip("-") for campo in ordering}
+        return ordering + [
+            f"{prefijo}{campo}" for campo in self.desempate if campo not in presentes
+        ]
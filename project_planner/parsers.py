@@ -0,0 +1,34 @@
+import codecs
+import io
+
+from django.conf import settings
+from rest_framework.parsers import JSONParser
+
+from .renderers import JSONRapidoRenderer, orjson
+
+
+class JSONRapidoParser(JSONParser):
+    """
+    JSONParser que decodifica con orjson cuando está instalado.
+
+    Como JSONParser con STRICT_JSON, rechaza NaN e Infinity. Se usa JSONParser cuando
+    orjson no está instalado, cuando el cuerpo no está en UTF-8 y cuando orjson no puede
+    decodificarlo, de modo que los errores son los mismos que con JSONParser. La única
+    diferencia: orjson convierte en float los enteros que no caben en 64 bits (ningún
+    campo de la API los admite; DRF los rechaza como entero inválido).
+    """
+
+    renderer_class = JSONRapidoRenderer
+
+    def parse(self, stream, media_type=None, parser_context=None):
+        parser_context = parser_context or {}
+        encoding = parser_context.get("encoding", settings.DEFAULT_CHARSET)
+        if orjson is None or not self.strict or codecs.lookup(encoding).name != "utf-8":
+            return super().parse(stream, media_type, parser_context)
+
+        contenido = stream.read()
+        try:
+            return orjson.loads(contenido)
+        except orjson.JSONDecodeError:
+            # JSONParser decide si es un error y con qué mensaje.
+            return super().parse(io.BytesIO(contenido), media_type, parser_context)
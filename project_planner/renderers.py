@@ -0,0 +1,51 @@
+from rest_framework.renderers import JSONRenderer
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - orjson es opcional.
+    orjson = None
+
+# Separadores de línea Unicode que JSONRenderer escapa para que el JSON sea JavaScript
+# válido.
+_SEPARADORES_JS = ((b"\xe2\x80\xa8", b"\\u2028"), (b"\xe2\x80\xa9", b"\\u2029"))
+
+
+class JSONRapidoRenderer(JSONRenderer):
+    """
+    JSONRenderer que codifica con orjson cuando está instalado.
+
+    orjson serializa en C los tipos que DRF convierte en Python uno por uno (UUID, fechas
+    y horas, diccionarios y listas anidados). Produce los mismos bytes que JSONRenderer
+    con la configuración por defecto (COMPACT_JSON, UNICODE_JSON): UUID como texto,
+    datetime en ISO 8601 con ``Z`` para UTC y el resto de tipos (Decimal, lazy strings,
+    QuerySet...) a través del mismo JSONEncoder de DRF.
+
+    Se usa JSONRenderer cuando orjson no está instalado, cuando se pide indentación
+    (``; indent=`` o la API navegable), si la configuración de DRF no es la compacta
+    y en Unicode, y cuando orjson no puede codificar los datos (p. ej. enteros de más de
+    64 bits), de modo que los errores son los mismos que con JSONRenderer. La única
+    diferencia: un float NaN o infinito se escribe como ``null`` en lugar de provocar un
+    ValueError (STRICT_JSON).
+    """
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        if (
+            orjson is None
+            or data is None
+            or self.ensure_ascii
+            or not self.compact
+            or self.get_indent(accepted_media_type, renderer_context or {}) is not None
+        ):
+            return super().render(data, accepted_media_type, renderer_context)
+        try:
+            contenido = orjson.dumps(
+                data,
+                default=self.encoder_class().default,
+                option=orjson.OPT_UTC_Z | orjson.OPT_NON_STR_KEYS,
+            )
+        except orjson.JSONEncodeError:
+            return super().render(data, accepted_media_type, renderer_context)
+        for separador, escapado in _SEPARADORES_JS:
+            if separador in contenido:
+                contenido = contenido.replace(separador, escapado)
+        return contenido
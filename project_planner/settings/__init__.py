@@ -0,0 +1,31 @@
+"""
+Selección del perfil de settings.
+
+DJANGO_ENV elige el perfil: dev, prod o test. Si no está definido se usa prod cuando la
+aplicación corre en Render (variable RENDER), test al ejecutar ``manage.py test`` y dev
+en cualquier otro caso. También se puede apuntar DJANGO_SETTINGS_MODULE directamente a
+project_planner.settings.<perfil>.
+"""
+
+import os
+import sys
+
+from django.core.exceptions import ImproperlyConfigured
+
+if "DJANGO_ENV" in os.environ:
+    PERFIL = os.environ["DJANGO_ENV"]
+elif "RENDER" in os.environ:
+    PERFIL = "prod"
+elif "test" in sys.argv:
+    PERFIL = "test"
+else:
+    PERFIL = "dev"
+
+if PERFIL == "prod":
+    from .prod import *  # noqa: F401,F403
+elif PERFIL == "test":
+    from .test import *  # noqa: F401,F403
+elif PERFIL == "dev":
+    from .dev import *  # noqa: F401,F403
+else:
+    raise ImproperlyConfigured(f"DJANGO_ENV desconocido: {PERFIL!r} (dev, prod o test).")
@@ -0,0 +1,369 @@
+"""
+Django settings for project_planner project: configuración común a todos los perfiles.
+
+Los perfiles (dev, prod, test) importan este módulo y ajustan lo que les corresponde;
+project_planner/settings/__init__.py elige el perfil con DJANGO_ENV.
+
+Generated by 'django-admin startproject' using Django 5.0.3.
+
+For more information on this file, see
+https://docs.djangoproject.com/en/5.0/topics/settings/
+
+For the full list of settings and their values, see
+https://docs.djangoproject.com/en/5.0/ref/settings/
+"""
+
+from pathlib import Path
+from datetime import timedelta
+import os
+import importlib.util
+
+from project_planner.middleware import intercalar_medicion
+
+
+# Build paths inside the project like this: BASE_DIR / 'subdir'.
+BASE_DIR = Path(__file__).resolve().parent.parent.parent
+
+
+# Quick-start development settings - unsuitable for production
+# See https://docs.djangoproject.com/en/5.0/howto/deployment/checklist/
+
+# SECRET_KEY se define en cada perfil: prod la exige en DJANGO_SECRET_KEY y solo dev y
+# test tienen un valor por defecto.
+
+# SECURITY WARNING: don't run with debug turned on in production!
+DEBUG = os.environ.get("DJANGO_DEBUG", "0") == "1"
+
+# ALLOWED_HOSTS = ["127.0.0.1", "localhost"]
+
+ALLOWED_HOSTS = [".onrender.com", "localhost", "127.0.0.1"]
+
+
+# Application definition
+
+# El admin (y las sesiones, mensajes y CSRF que necesita) se puede desactivar con
+# DJANGO_ADMIN=0; la API solo usa JWT y no depende de ellos.
+ADMIN_HABILITADO = os.environ.get("DJANGO_ADMIN", "1") == "1"
+
+_APPS_ADMIN = [
+    # Admin con los checks de middleware adaptados a MIDDLEWARE_FUERA_DE_API.
+    "project_planner.apps.AdminFueraDeAPIConfig",
+    "django.contrib.sessions",
+    "django.contrib.messages",
+]
+_MIDDLEWARE_ADMIN = [
+    "django.contrib.sessions.middleware.SessionMiddleware",
+    "django.middleware.csrf.CsrfViewMiddleware",
+    "django.contrib.auth.middleware.AuthenticationMiddleware",
+    "django.contrib.messages.middleware.MessageMiddleware",
+]
+
+INSTALLED_APPS = [
+    app
+    for app in [
+        "project_planner.apps.AdminFueraDeAPIConfig",
+        "django.contrib.auth",
+        "django.contrib.contenttypes",
+        "django.contrib.sessions",
+        "django.contrib.messages",
+        "django.contrib.staticfiles",
+        # Lookups de trigramas para la búsqueda en PostgreSQL (project_planner.busqueda).
+        "django.contrib.postgres",
+        "corsheaders",
+        "configuracion",
+        "usuarios_app",
+        "rest_framework",
+        "proyectos",
+        "trazabilidad",
+        # Checks del sistema del proyecto (project_planner.checks).
+        "project_planner.apps.ProjectPlannerConfig",
+    ]
+    if ADMIN_HABILITADO or app not in _APPS_ADMIN
+]
+
+
+# Las rutas de la API (API_PREFIJO) solo pasan por MIDDLEWARE; las demás (admin y raíz)
+# también por MIDDLEWARE_FUERA_DE_API, que FueraDeAPIMiddleware ejecuta en su lugar.
+API_PREFIJO = "/api/"
+
+MIDDLEWARE = [
+    "django.middleware.security.SecurityMiddleware",
+    "project_planner.middleware.CompresionMiddleware",
+    "corsheaders.middleware.CorsMiddleware",
+    "django.middleware.common.CommonMiddleware",
+    "project_planner.middleware.FueraDeAPIMiddleware",
+    "project_planner.middleware.AutenticacionTimingMiddleware",
+]
+
+MIDDLEWARE_FUERA_DE_API = [
+    middleware
+    for middleware in [
+        "django.contrib.sessions.middleware.SessionMiddleware",
+        "django.middleware.csrf.CsrfViewMiddleware",
+        "django.contrib.auth.middleware.AuthenticationMiddleware",
+        "django.contrib.messages.middleware.MessageMiddleware",
+        "django.middleware.clickjacking.XFrameOptionsMiddleware",
+    ]
+    if ADMIN_HABILITADO or middleware not in _MIDDLEWARE_ADMIN
+]
+
+# DJANGO_PERFILADO=1 registra por solicitud la vista, las consultas SQL (y posibles N+1)
+# y los tiempos (PerfiladoMiddleware). Va primero para medir la pila completa; se
+# agrega antes de intercalar la medición para que también se mida.
+PERFILADO_UMBRAL_N_MAS_1 = int(os.environ.get("PERFILADO_UMBRAL_N_MAS_1", 5))
+if os.environ.get("DJANGO_PERFILADO") == "1":
+    MIDDLEWARE = ["project_planner.middleware.PerfiladoMiddleware"] + MIDDLEWARE
+
+# DJANGO_MEDIR_MIDDLEWARE=1 publica en Server-Timing el tiempo de cada middleware.
+if os.environ.get("DJANGO_MEDIR_MIDDLEWARE") == "1":
+    MIDDLEWARE = intercalar_medicion(MIDDLEWARE)
+
+# Compresión de respuestas (CompresionMiddleware): nivel por tipo de contenido y
+# codificación (br: 0-11, gzip: 1-9). Los tipos que no aparecen no se comprimen, igual
+# que las respuestas de menos de COMPRESION_TAMANO_MINIMO bytes. Niveles elegidos con
+# benchmarks/compresion.py.
+COMPRESION_TAMANO_MINIMO = int(os.environ.get("COMPRESION_TAMANO_MINIMO", 1024))
+COMPRESION_NIVELES = {
+    "application/json": {"br": 4, "gzip": 6},
+    "application/x-ndjson": {"br": 4, "gzip": 6},
+    "text/csv": {"br": 4, "gzip": 6},
+}
+
+ROOT_URLCONF = "project_planner.urls"
+
+TEMPLATES = [
+    {
+        "BACKEND": "django.template.backends.django.DjangoTemplates",
+        "DIRS": [],
+        "APP_DIRS": True,
+        "OPTIONS": {
+            "context_processors": [
+                "django.template.context_processors.debug",
+                "django.template.context_processors.request",
+                "django.contrib.auth.context_processors.auth",
+                "django.contrib.messages.context_processors.messages",
+            ],
+        },
+    },
+]
+
+WSGI_APPLICATION = "project_planner.wsgi.application"
+
+
+# Database
+# https://docs.djangoproject.com/en/5.0/ref/settings/#databases
+# Cada perfil define DATABASES (dev.py, prod.py, test.py).
+
+
+# Caché
+# Por defecto se usa memoria local (una caché por proceso). Con REDIS_URL todos los
+# workers comparten la caché y sus invalidaciones; prod.py la exige.
+if "REDIS_URL" in os.environ:
+    CACHES = {
+        "default": {
+            "BACKEND": "django.core.cache.backends.redis.RedisCache",
+            "LOCATION": os.environ["REDIS_URL"],
+        }
+    }
+else:
+    CACHES = {
+        "default": {
+            "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
+        }
+    }
+
+# Segundos que la lista combinada de catálogos permanece en caché. Las señales de los
+# catálogos la invalidan antes; el tiempo límite cubre cambios hechos con update().
+LISTA_COMBINADA_CACHE_TIMEOUT = int(os.environ.get("LISTA_COMBINADA_CACHE_TIMEOUT", 300))
+
+# Filas por INSERT en la importación masiva de proyectos (ProyectoViewSet.importar).
+PROYECTOS_IMPORT_BATCH_SIZE = int(os.environ.get("PROYECTOS_IMPORT_BATCH_SIZE", 500))
+
+# Máximo de filas por importación. Todas las filas se validan en memoria antes de
+# insertar, así que este límite acota la memoria de una solicitud (JSON o CSV).
+PROYECTOS_IMPORT_MAX_FILAS = int(os.environ.get("PROYECTOS_IMPORT_MAX_FILAS", 10000))
+
+# Filas leídas por lote del cursor en la exportación de proyectos (ProyectoViewSet.exportar).
+PROYECTOS_EXPORT_CHUNK_SIZE = int(os.environ.get("PROYECTOS_EXPORT_CHUNK_SIZE", 2000))
+
+# Segundos que ClaimsJWTAuthentication guarda en caché el usuario de tokens sin claims.
+USUARIO_AUTH_CACHE_TTL = int(os.environ.get("USUARIO_AUTH_CACHE_TTL", 60))
+
+
+AUTH_USER_MODEL = "usuarios_app.Usuario"
+
+
+AUTHENTICATION_BACKENDS = [
+    "django.contrib.auth.backends.ModelBackend",
+]
+
+
+REST_FRAMEWORK = {
+    # Un solo autenticador por defecto; las vistas que lo necesiten eligen el suyo con
+    # authentication_classes (p. ej. ClaimsJWTAuthentication o ninguno en el login).
+    "DEFAULT_AUTHENTICATION_CLASSES": [
+        "usuarios_app.autenticacion.MedidaJWTAuthentication",
+    ],
+    "DEFAULT_PERMISSION_CLASSES": [
+        "rest_framework.permissions.IsAuthenticated",
+    ],
+    # Tamaño de página por defecto para las vistas que usan paginación por cursor.
+    "PAGE_SIZE": int(os.environ.get("API_PAGE_SIZE", 50)),
+    # JSON con orjson si está instalado (mismos bytes que JSONRenderer/JSONParser).
+    "DEFAULT_RENDERER_CLASSES": [
+        "project_planner.renderers.JSONRapidoRenderer",
+        "rest_framework.renderers.BrowsableAPIRenderer",
+    ],
+    "DEFAULT_PARSER_CLASSES": [
+        "project_planner.parsers.JSONRapidoParser",
+        "rest_framework.parsers.FormParser",
+        "rest_framework.parsers.MultiPartParser",
+    ],
+    "DEFAULT_THROTTLE_RATES": {
+        # Intentos de login por IP (usuarios_app.throttling.LoginIPThrottle).
+        "login_ip": os.environ.get("LOGIN_IP_RATE", "30/min"),
+    },
+    # Proxies de confianza delante de la aplicación. Con 0 la IP del cliente es
+    # REMOTE_ADDR; con N se toma la N-ésima dirección desde el final de X-Forwarded-For,
+    # la que agregó el proxy más externo, y se ignora lo que el cliente haya enviado.
+    "NUM_PROXIES": int(os.environ.get("NUM_PROXIES", 0)),
+}
+
+# Protección del login (usuarios_app.throttling). LOGIN_THROTTLE_CACHE es el alias de
+# CACHES donde se guardan intentos, fallos y contadores de rechazos.
+# LOGIN_MAX_FALLOS_USUARIO cuenta los fallos de un usuario desde una misma IP.
+LOGIN_THROTTLE_CACHE = os.environ.get("LOGIN_THROTTLE_CACHE", "default")
+LOGIN_MAX_FALLOS_USUARIO = int(os.environ.get("LOGIN_MAX_FALLOS_USUARIO", 5))
+LOGIN_MAX_FALLOS_IP = int(os.environ.get("LOGIN_MAX_FALLOS_IP", 20))
+LOGIN_BLOQUEO_SEGUNDOS = int(os.environ.get("LOGIN_BLOQUEO_SEGUNDOS", 300))
+
+# - La paginación se asigna por vista (pagination_class), no de forma global.
+# - Los índices con INCLUDE de configuracion solo son de cobertura en PostgreSQL; en
+#   SQLite (desarrollo y pruebas) se crean sin las columnas incluidas.
+SILENCED_SYSTEM_CHECKS = [
+    "rest_framework.W001",
+    "models.W040",
+]
+
+CORS_ALLOW_ALL_ORIGINS = True
+
+# O si prefieres ser específico en cuanto a qué orígenes permitir
+CORS_ALLOWED_ORIGINS = [
+    "http://localhost:3000",  # El puerto donde se ejecuta tu front-end de React
+    "http://localhost:5173",  # Asegúrate de agregar cualquier otro origen que necesites
+    # ... cualquier otro origen que desees permitir
+]
+
+
+# Token
+
+SIMPLE_JWT = {
+    "ACCESS_TOKEN_LIFETIME": timedelta(hours=1),
+    "ROTATE_REFRESH_TOKENS": False,
+    "ALGORITHM": "HS256",
+    # Sin SIGNING_KEY, simplejwt firma con SECRET_KEY.
+    "VERIFYING_KEY": None,
+    "AUTH_HEADER_TYPES": ("Bearer",),
+    "USER_ID_FIELD": "uuid",
+    "USER_ID_CLAIM": "user_id",
+    "AUTH_TOKEN_CLASSES": ("rest_framework_simplejwt.tokens.AccessToken",),
+    "TOKEN_TYPE_CLAIM": "token_type",
+}
+
+# Password hashing
+# PASSWORD_HASHER elige el algoritmo para contraseñas nuevas: pbkdf2 (por defecto), scrypt
+# o argon2 (requiere argon2-cffi; si no está instalado se usa scrypt). Los demás hashers,
+# y los de Django por defecto que no tienen versión configurable, se mantienen para
+# verificar contraseñas existentes, que se vuelven a calcular con el algoritmo y costo
+# preferidos en el siguiente login exitoso.
+_HASHERS = {
+    "pbkdf2": "usuarios_app.hashers.ConfigurablePBKDF2PasswordHasher",
+    "scrypt": "usuarios_app.hashers.ConfigurableScryptPasswordHasher",
+    "argon2": "usuarios_app.hashers.ConfigurableArgon2PasswordHasher",
+}
+PASSWORD_HASHER = os.environ.get("PASSWORD_HASHER", "pbkdf2")
+if PASSWORD_HASHER == "argon2" and importlib.util.find_spec("argon2") is None:
+    PASSWORD_HASHER = "scrypt"
+_HASHERS_ANTERIORES = [
+    "django.contrib.auth.hashers.PBKDF2SHA1PasswordHasher",
+    "django.contrib.auth.hashers.BCryptSHA256PasswordHasher",
+]
+PASSWORD_HASHERS = (
+    [_HASHERS[PASSWORD_HASHER]]
+    + [hasher for nombre, hasher in _HASHERS.items() if nombre != PASSWORD_HASHER]
+    + _HASHERS_ANTERIORES
+)
+
+# Parámetros de costo; None conserva el valor por defecto de Django.
+def _entero_env(nombre):
+    valor = os.environ.get(nombre)
+    return int(valor) if valor else None
+
+
+PBKDF2_ITERATIONS = _entero_env("PBKDF2_ITERATIONS")
+SCRYPT_WORK_FACTOR = _entero_env("SCRYPT_WORK_FACTOR")
+SCRYPT_BLOCK_SIZE = _entero_env("SCRYPT_BLOCK_SIZE")
+SCRYPT_PARALLELISM = _entero_env("SCRYPT_PARALLELISM")
+ARGON2_TIME_COST = _entero_env("ARGON2_TIME_COST")
+ARGON2_MEMORY_COST = _entero_env("ARGON2_MEMORY_COST")
+ARGON2_PARALLELISM = _entero_env("ARGON2_PARALLELISM")
+
+# Password validation
+# https://docs.djangoproject.com/en/5.0/ref/settings/#auth-password-validators
+
+AUTH_PASSWORD_VALIDATORS = [
+    {
+        "NAME": "django.contrib.auth.password_validation.UserAttributeSimilarityValidator",
+    },
+    {
+        "NAME": "django.contrib.auth.password_validation.MinimumLengthValidator",
+    },
+    {
+        "NAME": "django.contrib.auth.password_validation.CommonPasswordValidator",
+    },
+    {
+        "NAME": "django.contrib.auth.password_validation.NumericPasswordValidator",
+    },
+]
+
+
+# Logging
+# Los registros de project_planner (p. ej. el perfilado) se escriben en consola.
+LOGGING = {
+    "version": 1,
+    "disable_existing_loggers": False,
+    "handlers": {
+        "console": {"class": "logging.StreamHandler"},
+    },
+    "loggers": {
+        "project_planner": {
+            "handlers": ["console"],
+            "level": os.environ.get("PROJECT_PLANNER_LOG_LEVEL", "INFO"),
+        },
+    },
+}
+
+
+# Internationalization
+# https://docs.djangoproject.com/en/5.0/topics/i18n/
+
+LANGUAGE_CODE = "en-us"
+
+TIME_ZONE = "UTC"
+
+USE_I18N = True
+
+USE_TZ = True
+
+
+# Static files (CSS, JavaScript, Images)
+# https://docs.djangoproject.com/en/5.0/howto/static-files/
+
+STATIC_URL = "/static/"
+STATIC_ROOT = os.path.join(BASE_DIR, "staticfiles")
+
+
+# Default primary key field type
+# https://docs.djangoproject.com/en/5.0/ref/settings/#default-auto-field
+
+DEFAULT_AUTO_FIELD = "django.db.models.BigAutoField"
@@ -0,0 +1,24 @@
+"""
+Perfil de desarrollo: DEBUG activo y SQLite local, salvo que se definan DB_HOST y demás
+variables de la base de datos.
+"""
+
+import os
+
+from project_planner.basedatos import base_datos_entorno
+
+from .base import *  # noqa: F401,F403
+from .base import BASE_DIR
+
+DEBUG = os.environ.get("DJANGO_DEBUG", "1") == "1"
+
+SECRET_KEY = os.environ.get(
+    "DJANGO_SECRET_KEY",
+    "django-insecure-1$d7wrejjyf^29z=!)+dy#=qn*wee!ikq*rpv_be_f7kihck(8",
+)
+
+DATABASES = {
+    "default": base_datos_entorno(
+        {"ENGINE": "django.db.backends.sqlite3", "NAME": BASE_DIR / "db.sqlite3"}
+    )
+}
@@ -0,0 +1,89 @@
+"""
+Perfil de producción: DEBUG desactivado (Django no guarda las consultas SQL de cada
+conexión), PostgreSQL con conexiones persistentes, caché en Redis y plantillas en caché.
+
+Variables obligatorias: DJANGO_SECRET_KEY, DB_PASSWORD y REDIS_URL.
+"""
+
+import os
+
+from django.core.exceptions import ImproperlyConfigured
+
+from project_planner.basedatos import base_datos_entorno
+
+from .base import *  # noqa: F401,F403
+from .base import REST_FRAMEWORK
+
+
+def _variable_requerida(nombre):
+    """
+    Devuelve una variable de entorno obligatoria en producción.
+    """
+    if not os.environ.get(nombre):
+        raise ImproperlyConfigured(
+            f"La variable de entorno {nombre} es obligatoria en producción."
+        )
+    return os.environ[nombre]
+
+
+DEBUG = False
+
+SECRET_KEY = _variable_requerida("DJANGO_SECRET_KEY")
+
+# Los valores por defecto corresponden a la instancia de RDS usada en Render; se
+# reemplazan con DB_NAME, DB_USER, DB_HOST y DB_PORT. La contraseña no tiene valor por
+# defecto: se lee de DB_PASSWORD.
+DATABASES = {
+    "default": base_datos_entorno(
+        {
+            "ENGINE": "django.db.backends.postgresql",
+            "NAME": "track_suite_db",
+            "USER": "track__db_user",
+            "PASSWORD": _variable_requerida("DB_PASSWORD"),
+            "HOST": "tracksuite-instance.cd0c862aupcl.us-east-2.rds.amazonaws.com",
+            "PORT": "5432",
+        }
+    )
+}
+
+# Caché compartida por todos los workers. Con LocMemCache cada proceso tendría su copia:
+# invalidar la lista combinada solo limpiaría la del worker que guardó el catálogo, y los
+# contadores del login y la caché de autenticación quedarían repartidos entre workers.
+CACHES = {
+    "default": {
+        "BACKEND": "django.core.cache.backends.redis.RedisCache",
+        "LOCATION": _variable_requerida("REDIS_URL"),
+    }
+}
+
+# Las plantillas (admin) se compilan una sola vez por proceso.
+TEMPLATES = [
+    {
+        "BACKEND": "django.template.backends.django.DjangoTemplates",
+        "DIRS": [],
+        "OPTIONS": {
+            "context_processors": [
+                "django.template.context_processors.request",
+                "django.contrib.auth.context_processors.auth",
+                "django.contrib.messages.context_processors.messages",
+            ],
+            "loaders": [
+                (
+                    "django.template.loaders.cached.Loader",
+                    [
+                        "django.template.loaders.filesystem.Loader",
+                        "django.template.loaders.app_directories.Loader",
+                    ],
+                ),
+            ],
+        },
+    },
+]
+
+# Sin la API navegable: solo JSON. En Render las solicitudes llegan a través de un proxy
+# que agrega la IP del cliente a X-Forwarded-For.
+REST_FRAMEWORK = {
+    **REST_FRAMEWORK,
+    "DEFAULT_RENDERER_CLASSES": ["project_planner.renderers.JSONRapidoRenderer"],
+    "NUM_PROXIES": int(os.environ.get("NUM_PROXIES", 1)),
+}
@@ -0,0 +1,23 @@
+"""
+Perfil de pruebas: SQLite en memoria, caché local y un hasher de contraseñas rápido.
+"""
+
+from .base import *  # noqa: F401,F403
+from .base import PASSWORD_HASHERS
+
+DEBUG = False
+
+SECRET_KEY = "django-insecure-pruebas"
+
+DATABASES = {
+    "default": {"ENGINE": "django.db.backends.sqlite3", "NAME": ":memory:"}
+}
+
+CACHES = {
+    "default": {
+        "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
+    }
+}
+
+# El costo real de cada algoritmo se mide en benchmarks/hash_contrasena.py.
+PASSWORD_HASHERS = ["django.contrib.auth.hashers.MD5PasswordHasher"] + PASSWORD_HASHERS
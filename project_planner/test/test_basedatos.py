@@ -0,0 +1,134 @@
+import os
+from unittest import mock
+
+from django.test import SimpleTestCase
+
+from project_planner import basedatos
+from project_planner.basedatos import (
+    base_datos_entorno,
+    configurar_conexiones,
+    describir_conexiones,
+)
+
+POSTGRES = "django.db.backends.postgresql"
+POOL = {"DB_POOL_MIN_SIZE": "2", "DB_POOL_MAX_SIZE": "5", "DB_POOL_TIMEOUT": "3"}
+
+
+def configurar(entorno, pool_disponible=False):
+    """
+    Ejecuta configurar_conexiones sobre una base de datos PostgreSQL con solo las
+    variables de entorno indicadas.
+    """
+    with mock.patch.dict(os.environ, entorno, clear=True), mock.patch.object(
+        basedatos, "pool_disponible", return_value=pool_disponible
+    ):
+        return configurar_conexiones({"ENGINE": POSTGRES})
+
+
+class ConfigurarConexionesTests(SimpleTestCase):
+    def test_defaults_to_persistent_connections(self):
+        """
+        Asegurar que por defecto las conexiones son persistentes por 60 segundos.
+        """
+        base_datos = configurar({})
+        self.assertEqual(base_datos["CONN_MAX_AGE"], 60)
+        self.assertTrue(base_datos["CONN_HEALTH_CHECKS"])
+        self.assertEqual(base_datos["OPTIONS"], {"connect_timeout": 10})
+
+    def test_environment_overrides(self):
+        """
+        Asegurar que DB_CONN_MAX_AGE, DB_CONN_HEALTH_CHECKS y DB_CONNECT_TIMEOUT se respetan.
+        """
+        base_datos = configurar(
+            {
+                "DB_CONN_MAX_AGE": "300",
+                "DB_CONN_HEALTH_CHECKS": "0",
+                "DB_CONNECT_TIMEOUT": "5",
+            }
+        )
+        self.assertEqual(base_datos["CONN_MAX_AGE"], 300)
+        self.assertFalse(base_datos["CONN_HEALTH_CHECKS"])
+        self.assertEqual(base_datos["OPTIONS"]["connect_timeout"], 5)
+
+    def test_asgi_disables_persistent_connections(self):
+        """
+        Asegurar que bajo ASGI CONN_MAX_AGE es 0 aunque el entorno pida otro valor.
+        """
+        base_datos = configurar({"DJANGO_ASGI": "1", "DB_CONN_MAX_AGE": "300"})
+        self.assertEqual(base_datos["CONN_MAX_AGE"], 0)
+        self.assertFalse(base_datos["CONN_HEALTH_CHECKS"])
+
+    def test_pool_replaces_persistent_connections(self):
+        """
+        Asegurar que con el pool disponible se configura y se desactivan las conexiones
+        persistentes.
+        """
+        base_datos = configurar(POOL, pool_disponible=True)
+        self.assertEqual(
+            base_datos["OPTIONS"]["pool"], {"min_size": 2, "max_size": 5, "timeout": 3}
+        )
+        self.assertEqual(base_datos["CONN_MAX_AGE"], 0)
+
+    def test_pool_ignored_when_unavailable(self):
+        """
+        Asegurar que DB_POOL_* se ignora si el pool no está disponible.
+        """
+        base_datos = configurar(POOL)
+        self.assertNotIn("pool", base_datos["OPTIONS"])
+        self.assertEqual(base_datos["CONN_MAX_AGE"], 60)
+
+    def test_sqlite_default_is_unchanged(self):
+        """
+        Asegurar que sin DB_HOST se usa tal cual la base de datos por defecto SQLite.
+        """
+        defecto = {"ENGINE": "django.db.backends.sqlite3", "NAME": "db.sqlite3"}
+        with mock.patch.dict(os.environ, {"DB_CONN_MAX_AGE": "300"}, clear=True):
+            self.assertEqual(base_datos_entorno(defecto), defecto)
+
+
+class DescribirConexionesTests(SimpleTestCase):
+    def describir(self, entorno, pool_disponible=False, **kwargs):
+        base_datos = configurar(entorno, pool_disponible)
+        with mock.patch.dict(os.environ, entorno, clear=True), mock.patch.object(
+            basedatos, "pool_disponible", return_value=pool_disponible
+        ):
+            return describir_conexiones(base_datos, **kwargs)
+
+    def test_persistent_connections_per_thread(self):
+        """
+        Asegurar que con conexiones persistentes se cuenta una conexión por hilo.
+        """
+        self.assertEqual(
+            self.describir({}, workers=3, hilos=4),
+            "conexiones persistentes (CONN_MAX_AGE=60s) con verificación de salud: "
+            "hasta 4 conexiones por worker, 12 en total con 3 workers",
+        )
+
+    def test_asgi(self):
+        """
+        Asegurar que bajo ASGI se describe una conexión nueva por solicitud.
+        """
+        self.assertEqual(
+            self.describir({"DJANGO_ASGI": "1"}, workers=2),
+            "una conexión nueva por solicitud (CONN_MAX_AGE=0): "
+            "hasta 1 conexiones por worker, 2 en total con 2 workers",
+        )
+
+    def test_pool(self):
+        """
+        Asegurar que con pool se cuentan max_size conexiones por worker.
+        """
+        self.assertEqual(
+            self.describir(POOL, pool_disponible=True, workers=4),
+            "pool psycopg (min 2, max 5): hasta 5 conexiones por worker, "
+            "20 en total con 4 workers",
+        )
+
+    def test_pool_ignored_is_reported(self):
+        """
+        Asegurar que se avisa cuando DB_POOL_* se ignora.
+        """
+        self.assertIn(
+            "DB_POOL_* ignorado (requiere Django 5.1+ y psycopg[pool])",
+            self.describir(POOL),
+        )
@@ -0,0 +1,96 @@
+from django.conf import settings
+from django.core import checks
+from django.test import SimpleTestCase, override_settings
+
+from project_planner.checks import comprobar_dependencias_admin
+
+MESSAGES = "django.contrib.messages.middleware.MessageMiddleware"
+CSRF = "django.middleware.csrf.CsrfViewMiddleware"
+IDS_SEGURIDAD = {"security.W002", "security.W003", "security.W016", "security.W019"}
+
+
+def ids_errores():
+    return sorted(error.id for error in comprobar_dependencias_admin())
+
+
+class DependenciasAdminTests(SimpleTestCase):
+    def test_settings_pass_admin_checks(self):
+        """
+        Asegurar que la configuración del proyecto cumple los checks del admin sin silenciarlos.
+        """
+        self.assertEqual(ids_errores(), [])
+        for id_check in ("admin.E408", "admin.E409", "admin.E410"):
+            self.assertNotIn(id_check, settings.SILENCED_SYSTEM_CHECKS)
+
+    def test_missing_middleware_outside_api_is_reported(self):
+        """
+        Asegurar que si falta un middleware del admin en MIDDLEWARE_FUERA_DE_API se reporta su error.
+        """
+        sin_mensajes = [m for m in settings.MIDDLEWARE_FUERA_DE_API if m != MESSAGES]
+        with override_settings(MIDDLEWARE_FUERA_DE_API=sin_mensajes):
+            self.assertEqual(ids_errores(), ["admin.E409"])
+
+    def test_outside_api_stack_requires_dispatcher(self):
+        """
+        Asegurar que MIDDLEWARE_FUERA_DE_API no cuenta si FueraDeAPIMiddleware no está en MIDDLEWARE.
+        """
+        middleware = [
+            m
+            for m in settings.MIDDLEWARE
+            if m != "project_planner.middleware.FueraDeAPIMiddleware"
+        ]
+        with override_settings(MIDDLEWARE=middleware):
+            self.assertEqual(ids_errores(), ["admin.E408", "admin.E409", "admin.E410"])
+
+
+def ids_seguridad():
+    """
+    Ids de los checks de despliegue sobre CSRF y X-Frame-Options que se reportan.
+    """
+    return sorted(
+        mensaje.id
+        for mensaje in checks.run_checks(
+            tags=[checks.Tags.security], include_deployment_checks=True
+        )
+        if mensaje.id in IDS_SEGURIDAD
+    )
+
+
+@override_settings(CSRF_COOKIE_SECURE=True, X_FRAME_OPTIONS="DENY")
+class MiddlewareSeguridadTests(SimpleTestCase):
+    def test_outside_api_middleware_passes_deploy_checks(self):
+        """
+        Asegurar que CSRF y X-Frame-Options en MIDDLEWARE_FUERA_DE_API cumplen
+        security.W002 y security.W003 sin silenciarlos.
+        """
+        self.assertEqual(ids_seguridad(), [])
+        for id_check in IDS_SEGURIDAD:
+            self.assertNotIn(id_check, settings.SILENCED_SYSTEM_CHECKS)
+
+    def test_missing_csrf_outside_api_is_reported(self):
+        """
+        Asegurar que si falta CsrfViewMiddleware en MIDDLEWARE_FUERA_DE_API se reporta security.W003.
+        """
+        sin_csrf = [m for m in settings.MIDDLEWARE_FUERA_DE_API if m != CSRF]
+        with override_settings(MIDDLEWARE_FUERA_DE_API=sin_csrf):
+            self.assertEqual(ids_seguridad(), ["security.W003"])
+
+    def test_outside_api_stack_requires_dispatcher(self):
+        """
+        Asegurar que sin FueraDeAPIMiddleware se reportan security.W002 y security.W003.
+        """
+        middleware = [
+            m
+            for m in settings.MIDDLEWARE
+            if m != "project_planner.middleware.FueraDeAPIMiddleware"
+        ]
+        with override_settings(MIDDLEWARE=middleware):
+            self.assertEqual(ids_seguridad(), ["security.W002", "security.W003"])
+
+    def test_settings_of_outside_api_middleware_are_checked(self):
+        """
+        Asegurar que CSRF_COOKIE_SECURE y X_FRAME_OPTIONS se verifican aunque sus middleware
+        estén solo en MIDDLEWARE_FUERA_DE_API.
+        """
+        with override_settings(CSRF_COOKIE_SECURE=False, X_FRAME_OPTIONS="SAMEORIGIN"):
+            self.assertEqual(ids_seguridad(), ["security.W016", "security.W019"])
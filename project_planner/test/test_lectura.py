@@ -0,0 +1,65 @@
+from datetime import datetime, timezone as dt_timezone
+
+from django.test import SimpleTestCase, override_settings
+from django.utils import timezone
+from rest_framework import serializers
+
+from project_planner.lectura import CampoFechaHora, CampoLectura, SerializadorLectura
+
+
+class EjemploLectura(SerializadorLectura):
+    campos = {
+        "fecha": CampoFechaHora("fecha"),
+        "nombre": CampoLectura("relacion__nombre", omitir_nulo=True),
+        "total": CampoLectura("total", str),
+    }
+
+
+class SerializadorLecturaTests(SimpleTestCase):
+    fechas = [
+        datetime(2024, 3, 1, 12, 30, 15, 123456, tzinfo=dt_timezone.utc),
+        datetime(2024, 3, 1, 12, 30, tzinfo=dt_timezone.utc),
+        None,
+    ]
+
+    def test_datetime_matches_drf(self):
+        """
+        Asegurar que CampoFechaHora produce lo mismo que DateTimeField en varias zonas.
+        """
+        campo = serializers.DateTimeField()
+        for zona in ("UTC", "America/Bogota", "Asia/Kolkata"):
+            with timezone.override(zona):
+                filas = [{"fecha": fecha} for fecha in self.fechas]
+                obtenidos = EjemploLectura(["fecha"]).serializar(filas)
+                esperados = [
+                    {"fecha": campo.to_representation(f) if f else None}
+                    for f in self.fechas
+                ]
+                self.assertEqual(obtenidos, esperados, zona)
+
+    @override_settings(REST_FRAMEWORK={"DATETIME_FORMAT": "%d/%m/%Y"})
+    def test_custom_format_delegates_to_drf(self):
+        """
+        Asegurar que un DATETIME_FORMAT distinto de ISO 8601 se respeta.
+        """
+        filas = [{"fecha": self.fechas[0]}]
+        self.assertEqual(
+            EjemploLectura(["fecha"]).serializar(filas), [{"fecha": "01/03/2024"}]
+        )
+
+    def test_selection_conversion_and_omitted_nulls(self):
+        """
+        Asegurar que se respetan la selección y su orden, la conversión y los campos
+        omitidos cuando son nulos.
+        """
+        filas = [
+            {"relacion__nombre": "A", "total": 1, "fecha": None},
+            {"relacion__nombre": None, "total": None, "fecha": None},
+        ]
+        self.assertEqual(
+            EjemploLectura(["total", "nombre"]).serializar(filas),
+            [{"total": "1", "nombre": "A"}, {"total": None}],
+        )
+        self.assertEqual(
+            EjemploLectura().columnas(), ["fecha", "relacion__nombre", "total"]
+        )
@@ -0,0 +1,345 @@
+import gzip
+import json
+import re
+import time
+
+import brotli
+from django.conf import settings
+from django.contrib.auth import get_user_model
+from django.http import HttpResponse, JsonResponse, StreamingHttpResponse
+from django.test import Client, RequestFactory, TestCase, override_settings
+from django.urls import reverse
+from rest_framework import serializers, status
+from rest_framework.test import APITestCase
+
+from configuracion.models import Linea, Proceso, Tipo
+from project_planner.compresion import elegir_codificacion
+from project_planner.middleware import (
+    MEDICION_MIDDLEWARE,
+    CompresionMiddleware,
+    PerfiladoMiddleware,
+    intercalar_medicion,
+)
+from proyectos.models import Proyecto
+from .test_settings import cargar_settings
+
+PERFILADO_MIDDLEWARE = "project_planner.middleware.PerfiladoMiddleware"
+
+User = get_user_model()
+
+
+class FueraDeAPIMiddlewareTests(TestCase):
+    def test_api_skips_session_and_frame_options(self):
+        """
+        Asegurar que las rutas de la API no cargan la sesión ni agregan X-Frame-Options.
+        """
+        response = self.client.get(reverse("lista-combinada"))
+        self.assertEqual(response.status_code, status.HTTP_401_UNAUTHORIZED)
+        self.assertFalse(hasattr(response.wsgi_request, "session"))
+        self.assertNotIn("X-Frame-Options", response)
+
+    def test_admin_runs_full_stack(self):
+        """
+        Asegurar que el admin sigue pasando por sesiones, CSRF y X-Frame-Options.
+        """
+        response = self.client.get(reverse("admin:login"))
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertTrue(hasattr(response.wsgi_request, "session"))
+        self.assertIn("csrftoken", response.cookies)
+        self.assertEqual(response["X-Frame-Options"], "DENY")
+
+    def test_admin_enforces_csrf(self):
+        """
+        Asegurar que la validación CSRF (process_view) se aplica fuera de la API.
+        """
+        client = Client(enforce_csrf_checks=True)
+        response = client.post(reverse("admin:login"), {"username": "x", "password": "y"})
+        self.assertEqual(response.status_code, status.HTTP_403_FORBIDDEN)
+
+
+@override_settings(MIDDLEWARE=intercalar_medicion(settings.MIDDLEWARE))
+class MedicionMiddlewareTests(TestCase):
+    def test_reports_each_middleware(self):
+        """
+        Asegurar que se publica en Server-Timing el tiempo de cada middleware y de la vista.
+        """
+        response = self.client.get(reverse("lista-combinada"))
+        server_timing = response["Server-Timing"]
+        medidos = [ruta for ruta in settings.MIDDLEWARE if ruta != MEDICION_MIDDLEWARE]
+        for ruta in medidos:
+            self.assertIn(f'mw;desc="{ruta.rsplit(".", 1)[-1]}"', server_timing)
+        self.assertIn('mw;desc="vista"', server_timing)
+
+    def etiquetas(self, middleware):
+        """
+        Etiquetas ``mw`` de Server-Timing, en orden, de una solicitud con ``middleware``.
+        """
+        with override_settings(MIDDLEWARE=middleware), self.assertLogs(
+            "project_planner.perfilado", "INFO"
+        ):
+            response = self.client.get(reverse("lista-combinada"))
+        return re.findall(r'mw;desc="([^"]+)"', response["Server-Timing"])
+
+    def test_labels_with_profiling_enabled(self):
+        """
+        Asegurar que con DJANGO_MEDIR_MIDDLEWARE y DJANGO_PERFILADO cada tiempo lleva el
+        nombre de su middleware, incluido PerfiladoMiddleware.
+        """
+        middleware = cargar_settings(
+            {"DJANGO_ENV": "test", "DJANGO_MEDIR_MIDDLEWARE": "1", "DJANGO_PERFILADO": "1"}
+        ).MIDDLEWARE
+        medidos = [ruta for ruta in middleware if ruta != MEDICION_MIDDLEWARE]
+        self.assertEqual(medidos[0], PERFILADO_MIDDLEWARE)
+        self.assertEqual(
+            self.etiquetas(middleware),
+            [ruta.rsplit(".", 1)[-1] for ruta in medidos] + ["vista"],
+        )
+
+    def test_labels_skip_unmeasured_outer_middleware(self):
+        """
+        Asegurar que un middleware agregado por fuera de la medición no desplaza los nombres.
+        """
+        middleware = [PERFILADO_MIDDLEWARE] + settings.MIDDLEWARE
+        medidos = [ruta for ruta in settings.MIDDLEWARE if ruta != MEDICION_MIDDLEWARE]
+        self.assertEqual(
+            self.etiquetas(middleware),
+            [ruta.rsplit(".", 1)[-1] for ruta in medidos] + ["vista"],
+        )
+
+    async def test_reports_async_requests(self):
+        """
+        Asegurar que la medición funciona con la pila asíncrona.
+        """
+        response = await self.async_client.get(reverse("lista-combinada-async"))
+        self.assertEqual(response.status_code, status.HTTP_401_UNAUTHORIZED)
+        self.assertIn('mw;desc="vista"', response["Server-Timing"])
+
+
+@override_settings(MIDDLEWARE=[PERFILADO_MIDDLEWARE] + settings.MIDDLEWARE)
+class PerfiladoMiddlewareTests(APITestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.test_user = User.objects.create_user(
+            username="testuser", email="test@example.com", password="testpassword"
+        )
+
+    def setUp(self):
+        self.client.force_authenticate(user=self.test_user)
+
+    def test_reports_view_queries_and_timings(self):
+        """
+        Asegurar que se publican la vista DRF, las consultas y los tiempos.
+        """
+        with self.assertLogs("project_planner.perfilado", "INFO") as logs:
+            response = self.client.get(reverse("proyecto-list"))
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+        datos = json.loads(logs.records[0].getMessage())
+        self.assertEqual(logs.records[0].levelname, "INFO")
+        self.assertEqual(datos["vista"], "ProyectoViewSet.list")
+        self.assertEqual(datos["estado"], 200)
+        self.assertGreaterEqual(datos["consultas"], 1)
+        self.assertGreater(datos["render_ms"], 0)
+        self.assertGreater(datos["serializacion_ms"], 0)
+        self.assertEqual(datos["n_mas_1"], [])
+
+        server_timing = response["Server-Timing"]
+        self.assertIn(f'db;desc="{datos["consultas"]} consultas"', server_timing)
+        self.assertIn('total;desc="ProyectoViewSet.list"', server_timing)
+        self.assertIn(f"serializacion;dur={datos['serializacion_ms']:.3f}", server_timing)
+        self.assertNotIn("nmas1", server_timing)
+
+    def test_measures_serializers_once(self):
+        """
+        Asegurar que se mide el tiempo de los serializers, sin sumar dos veces los anidados.
+        """
+
+        class Lento(serializers.Serializer):
+            def to_representation(self, instance):
+                time.sleep(0.02)
+                return {"valor": instance}
+
+        class Contenedor(serializers.Serializer):
+            elementos = Lento(many=True)
+
+        def vista(request):
+            return JsonResponse(Contenedor({"elementos": [1, 2, 3]}).data)
+
+        middleware = PerfiladoMiddleware(vista)
+        with self.assertLogs("project_planner.perfilado", "INFO") as logs:
+            response = middleware(RequestFactory().get("/"))
+
+        datos = logs.records[0].perfilado
+        self.assertGreaterEqual(datos["serializacion_ms"], 60)
+        self.assertLess(datos["serializacion_ms"], 120)
+        self.assertLessEqual(datos["serializacion_ms"], datos["total_ms"])
+        self.assertIn("serializacion;dur=", response["Server-Timing"])
+
+    @override_settings(PERFILADO_UMBRAL_N_MAS_1=3)
+    def test_flags_repeated_queries(self):
+        """
+        Asegurar que el mismo SQL con parámetros distintos se marca como N+1.
+        """
+
+        def vista(request):
+            for i in range(4):
+                Proyecto.objects.filter(nombre=f"Proyecto {i}").exists()
+            Proyecto.objects.count()
+            return HttpResponse()
+
+        middleware = PerfiladoMiddleware(vista)
+        with self.assertLogs("project_planner.perfilado", "WARNING") as logs:
+            response = middleware(RequestFactory().get("/"))
+
+        datos = logs.records[0].perfilado
+        self.assertEqual(datos["consultas"], 5)
+        self.assertEqual(len(datos["n_mas_1"]), 1)
+        self.assertEqual(datos["n_mas_1"][0]["repeticiones"], 4)
+        self.assertIn('nmas1;desc="1 consultas repetidas (max 4)"', response["Server-Timing"])
+
+
+class ElegirCodificacionTests(TestCase):
+    def test_negotiation(self):
+        """
+        Asegurar que se elige la codificación de mayor calidad y, a igual calidad, la
+        preferida por el servidor.
+        """
+        disponibles = ["br", "gzip"]
+        casos = {
+            "gzip, deflate, br": "br",
+            "gzip": "gzip",
+            "br;q=0.5, gzip": "gzip",
+            "BR;Q=1.0, gzip;q=0.8": "br",
+            "*": "br",
+            "*;q=0.5, br;q=0": "gzip",
+            "gzip;q=0, br;q=0": None,
+            "identity": None,
+            "": None,
+            "gzip;q=x, br": "br",
+        }
+        for cabecera, esperada in casos.items():
+            self.assertEqual(elegir_codificacion(cabecera, disponibles), esperada, cabecera)
+        self.assertEqual(elegir_codificacion("br, gzip", ["gzip"]), "gzip")
+
+
+class CompresionMiddlewareTests(APITestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.test_user = User.objects.create_user(
+            username="testuser", email="test@example.com", password="testpassword"
+        )
+        catalogos = {
+            "proceso": Proceso.objects.create(nombre="Proceso"),
+            "linea": Linea.objects.create(nombre="Linea"),
+            "tipo": Tipo.objects.create(nombre="Tipo"),
+        }
+        for i in range(10):
+            Proyecto.objects.create(
+                **catalogos,
+                nombre=f"Proyecto {i}",
+                tarea_tw="https://example.com/tarea",
+                desarrollador="Dev",
+                creador=cls.test_user,
+            )
+        cls.url = reverse("proyecto-list")
+
+    def setUp(self):
+        self.client.force_authenticate(user=self.test_user)
+
+    def test_compresses_json_with_negotiated_encoding(self):
+        """
+        Asegurar que el JSON se comprime con brotli o gzip según Accept-Encoding y que
+        el contenido es el mismo.
+        """
+        original = self.client.get(self.url)
+        self.assertNotIn("Content-Encoding", original)
+        self.assertIn("Accept-Encoding", original["Vary"])
+
+        for cabecera, codificacion, descomprimir in (
+            ("gzip, deflate, br", "br", brotli.decompress),
+            ("gzip", "gzip", gzip.decompress),
+        ):
+            response = self.client.get(self.url, HTTP_ACCEPT_ENCODING=cabecera)
+            self.assertEqual(response["Content-Encoding"], codificacion)
+            self.assertEqual(int(response["Content-Length"]), len(response.content))
+            self.assertLess(len(response.content), len(original.content))
+            self.assertEqual(descomprimir(response.content), original.content)
+            self.assertIn(f'compresion;desc="{codificacion}', response["Server-Timing"])
+
+    @override_settings(COMPRESION_NIVELES={"application/json": {"gzip": 1}})
+    def test_levels_and_encodings_per_content_type(self):
+        """
+        Asegurar que se usan solo las codificaciones configuradas para el tipo, con su
+        nivel, y que los tipos no configurados no se comprimen.
+        """
+        response = self.client.get(self.url, HTTP_ACCEPT_ENCODING="br, gzip")
+        self.assertEqual(response["Content-Encoding"], "gzip")
+        self.assertIn('desc="gzip 1:', response["Server-Timing"])
+
+        response = self.client.get(
+            reverse("proyecto-exportar"), HTTP_ACCEPT_ENCODING="gzip"
+        )
+        self.assertNotIn("Content-Encoding", response)
+
+    def test_small_responses_are_not_compressed(self):
+        """
+        Asegurar que las respuestas menores que COMPRESION_TAMANO_MINIMO no se comprimen.
+        """
+        response = self.client.get(f"{self.url}?fields=id&page_size=1")
+        self.assertLess(len(response.content), settings.COMPRESION_TAMANO_MINIMO)
+        response = self.client.get(
+            f"{self.url}?fields=id&page_size=1", HTTP_ACCEPT_ENCODING="gzip"
+        )
+        self.assertNotIn("Content-Encoding", response)
+
+    def test_streaming_export(self):
+        """
+        Asegurar que la exportación en streaming se comprime sin Content-Length y
+        produce el mismo CSV.
+        """
+        url = reverse("proyecto-exportar")
+        original = b"".join(self.client.get(url).streaming_content)
+        response = self.client.get(url, HTTP_ACCEPT_ENCODING="gzip")
+        self.assertTrue(response.streaming)
+        self.assertEqual(response["Content-Encoding"], "gzip")
+        self.assertNotIn("Content-Length", response)
+        self.assertEqual(gzip.decompress(b"".join(response.streaming_content)), original)
+
+    def test_weak_etag_keeps_conditional_requests(self):
+        """
+        Asegurar que el ETag pasa a ser débil y que un If-None-Match con él responde 304.
+        """
+        for i in range(40):
+            Linea.objects.create(nombre=f"Línea de negocio con un nombre largo {i}")
+        url = reverse("lista-combinada")
+        response = self.client.get(url, HTTP_ACCEPT_ENCODING="gzip")
+        self.assertEqual(response["Content-Encoding"], "gzip")
+        self.assertTrue(response["ETag"].startswith('W/"'))
+
+        response = self.client.get(
+            url, HTTP_ACCEPT_ENCODING="gzip", HTTP_IF_NONE_MATCH=response["ETag"]
+        )
+        self.assertEqual(response.status_code, status.HTTP_304_NOT_MODIFIED)
+
+    async def test_async_streaming(self):
+        """
+        Asegurar que una respuesta en streaming asíncrona se comprime a medida que se
+        genera.
+        """
+        bloques = [f"linea {i}\n".encode() * 200 for i in range(50)]
+
+        async def contenido():
+            for bloque in bloques:
+                yield bloque
+
+        async def vista(request):
+            return StreamingHttpResponse(contenido(), content_type="text/csv")
+
+        middleware = CompresionMiddleware(vista)
+        request = RequestFactory().get("/", HTTP_ACCEPT_ENCODING="br")
+        response = await middleware(request)
+        self.assertEqual(response["Content-Encoding"], "br")
+        comprimido = [bloque async for bloque in response.streaming_content]
+        self.assertGreater(len(comprimido), 1)
+        self.assertEqual(brotli.decompress(b"".join(comprimido)), b"".join(bloques))
+
@@ -0,0 +1,107 @@
+import io
+import uuid
+from datetime import date, datetime, time, timezone as dt_timezone
+from decimal import Decimal
+from unittest import mock
+from zoneinfo import ZoneInfo
+
+from django.test import SimpleTestCase
+from django.utils.translation import gettext_lazy
+from rest_framework.exceptions import ParseError
+from rest_framework.parsers import JSONParser
+from rest_framework.renderers import JSONRenderer
+
+from project_planner.parsers import JSONRapidoParser
+from project_planner.renderers import JSONRapidoRenderer
+
+
+class JSONRapidoRendererTests(SimpleTestCase):
+    datos = {
+        "id": uuid.UUID("12345678-1234-5678-1234-567812345678"),
+        "horas": Decimal("12.50"),
+        "utc": datetime(2024, 3, 1, 12, 30, 15, 123456, tzinfo=dt_timezone.utc),
+        "londres": datetime(2024, 1, 1, tzinfo=ZoneInfo("Europe/London")),
+        "bogota": datetime(2024, 3, 1, 7, 30, tzinfo=ZoneInfo("America/Bogota")),
+        "sin_zona": datetime(2024, 3, 1, 7, 30),
+        "fecha": date(2024, 3, 1),
+        "hora": time(7, 30, 0, 5),
+        "texto": "Diseño línea ",
+        "perezoso": gettext_lazy("Proyecto"),
+        "anidado": [{1: None, "b": [True, 1.5, -3]}, ()],
+        "vacio": {},
+    }
+
+    def test_same_bytes_as_drf(self):
+        """
+        Asegurar que se producen los mismos bytes que JSONRenderer.
+        """
+        self.assertEqual(
+            JSONRapidoRenderer().render(self.datos), JSONRenderer().render(self.datos)
+        )
+        self.assertEqual(JSONRapidoRenderer().render(None), b"")
+
+    def test_fallbacks_match_drf(self):
+        """
+        Asegurar que sin orjson, con indentación o con datos que orjson no codifica se
+        obtiene la salida de JSONRenderer.
+        """
+        with mock.patch("project_planner.renderers.orjson", None):
+            self.assertEqual(
+                JSONRapidoRenderer().render(self.datos), JSONRenderer().render(self.datos)
+            )
+        tipo = "application/json; indent=2"
+        self.assertEqual(
+            JSONRapidoRenderer().render(self.datos, tipo),
+            JSONRenderer().render(self.datos, tipo),
+        )
+        grande = {"n": 2**70}
+        self.assertEqual(JSONRapidoRenderer().render(grande), b'{"n":1180591620717411303424}')
+
+    def test_unsupported_values(self):
+        """
+        Asegurar que los objetos que JSONRenderer no admite siguen fallando, y que NaN se
+        escribe como null (la diferencia documentada).
+        """
+        with self.assertRaises(TypeError):
+            JSONRapidoRenderer().render({"x": object()})
+        self.assertEqual(JSONRapidoRenderer().render({"x": float("nan")}), b'{"x":null}')
+
+
+class JSONRapidoParserTests(SimpleTestCase):
+    def parse(self, parser, contenido):
+        return parser.parse(io.BytesIO(contenido))
+
+    def test_same_data_as_drf(self):
+        """
+        Asegurar que se obtienen los mismos datos que con JSONParser.
+        """
+        for contenido in (
+            '{"nombre": "Diseño", "horas": 1.5, "ids": [1, null, true]}'.encode(),
+            b'[-9223372036854775808, 18446744073709551615, 1e300]',
+            b'"texto"',
+        ):
+            self.assertEqual(
+                self.parse(JSONRapidoParser(), contenido),
+                self.parse(JSONParser(), contenido),
+            )
+
+    def test_invalid_json_raises_parse_error(self):
+        """
+        Asegurar que el JSON inválido, NaN e Infinity producen el mismo ParseError.
+        """
+        for contenido in (b"{", b'{"x": NaN}', b"[Infinity]", b""):
+            with self.assertRaises(ParseError) as esperado:
+                self.parse(JSONParser(), contenido)
+            with self.assertRaises(ParseError) as obtenido:
+                self.parse(JSONRapidoParser(), contenido)
+            self.assertEqual(str(obtenido.exception), str(esperado.exception))
+
+    def test_other_encodings_use_drf(self):
+        """
+        Asegurar que un cuerpo en otra codificación se decodifica con JSONParser.
+        """
+        contenido = '{"nombre": "Diseño"}'.encode("latin-1")
+        datos = JSONRapidoParser().parse(
+            io.BytesIO(contenido), parser_context={"encoding": "latin-1"}
+        )
+        self.assertEqual(datos, {"nombre": "Diseño"})
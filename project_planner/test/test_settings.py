@@ -0,0 +1,135 @@
+import importlib
+import os
+import sys
+from unittest import mock
+
+from django.core.exceptions import ImproperlyConfigured
+from django.test import SimpleTestCase
+
+import project_planner
+
+PAQUETE = "project_planner.settings"
+
+ENTORNO_PROD = {
+    "DJANGO_ENV": "prod",
+    "DJANGO_SECRET_KEY": "clave",
+    "DB_PASSWORD": "contrasena",
+    "REDIS_URL": "redis://localhost:6379/0",
+}
+
+
+def cargar_settings(entorno, argv=("manage.py", "runserver")):
+    """
+    Importa de nuevo project_planner.settings con el entorno y sys.argv indicados y
+    devuelve el módulo. Restaura después los módulos de settings ya cargados.
+    """
+    guardados = {
+        nombre: modulo
+        for nombre, modulo in sys.modules.items()
+        if nombre == PAQUETE or nombre.startswith(PAQUETE + ".")
+    }
+    for nombre in guardados:
+        del sys.modules[nombre]
+    try:
+        with mock.patch.dict(os.environ, entorno, clear=True), mock.patch.object(
+            sys, "argv", list(argv)
+        ):
+            return importlib.import_module(PAQUETE)
+    finally:
+        for nombre in [n for n in sys.modules if n == PAQUETE or n.startswith(PAQUETE + ".")]:
+            del sys.modules[nombre]
+        sys.modules.update(guardados)
+        project_planner.settings = guardados[PAQUETE]
+
+
+class SeleccionPerfilTests(SimpleTestCase):
+    def test_django_env_selects_profile(self):
+        """
+        Asegurar que DJANGO_ENV elige el perfil.
+        """
+        casos = {
+            "dev": {"DJANGO_ENV": "dev"},
+            "test": {"DJANGO_ENV": "test"},
+            "prod": ENTORNO_PROD,
+        }
+        for perfil, entorno in casos.items():
+            with self.subTest(perfil=perfil):
+                self.assertEqual(cargar_settings(entorno).PERFIL, perfil)
+
+    def test_django_env_takes_precedence(self):
+        """
+        Asegurar que DJANGO_ENV tiene prioridad sobre RENDER y sobre ``manage.py test``.
+        """
+        configuracion = cargar_settings(
+            {"DJANGO_ENV": "dev", "RENDER": "true"}, argv=("manage.py", "test")
+        )
+        self.assertEqual(configuracion.PERFIL, "dev")
+
+    def test_render_selects_prod(self):
+        """
+        Asegurar que en Render (variable RENDER) se usa producción, también al ejecutar
+        ``manage.py test``.
+        """
+        entorno = {**ENTORNO_PROD, "RENDER": "true"}
+        del entorno["DJANGO_ENV"]
+        for argv in (("manage.py", "runserver"), ("manage.py", "test")):
+            with self.subTest(argv=argv):
+                configuracion = cargar_settings(entorno, argv=argv)
+                self.assertEqual(configuracion.PERFIL, "prod")
+                self.assertFalse(configuracion.DEBUG)
+
+    def test_manage_py_test_selects_test(self):
+        """
+        Asegurar que ``manage.py test`` usa el perfil de pruebas con SQLite en memoria.
+        """
+        configuracion = cargar_settings({}, argv=("manage.py", "test"))
+        self.assertEqual(configuracion.PERFIL, "test")
+        self.assertEqual(configuracion.DATABASES["default"]["NAME"], ":memory:")
+
+    def test_defaults_to_dev(self):
+        """
+        Asegurar que sin variables se usa el perfil de desarrollo.
+        """
+        configuracion = cargar_settings({})
+        self.assertEqual(configuracion.PERFIL, "dev")
+        self.assertTrue(configuracion.DEBUG)
+
+    def test_unknown_django_env_raises(self):
+        """
+        Asegurar que un DJANGO_ENV desconocido no arranca.
+        """
+        with self.assertRaisesMessage(ImproperlyConfigured, "DJANGO_ENV desconocido"):
+            cargar_settings({"DJANGO_ENV": "staging"})
+
+
+class PerfilProdTests(SimpleTestCase):
+    def test_prod_uses_shared_cache(self):
+        """
+        Asegurar que producción usa Redis como caché compartida por los workers.
+        """
+        configuracion = cargar_settings(ENTORNO_PROD)
+        self.assertEqual(
+            configuracion.CACHES["default"],
+            {
+                "BACKEND": "django.core.cache.backends.redis.RedisCache",
+                "LOCATION": "redis://localhost:6379/0",
+            },
+        )
+
+    def test_prod_requires_redis_url(self):
+        """
+        Asegurar que producción no arranca sin REDIS_URL.
+        """
+        entorno = {k: v for k, v in ENTORNO_PROD.items() if k != "REDIS_URL"}
+        with self.assertRaisesMessage(ImproperlyConfigured, "REDIS_URL"):
+            cargar_settings(entorno)
+
+    def test_prod_requires_secrets(self):
+        """
+        Asegurar que producción no arranca sin DJANGO_SECRET_KEY ni DB_PASSWORD.
+        """
+        for variable in ("DJANGO_SECRET_KEY", "DB_PASSWORD"):
+            with self.subTest(variable=variable):
+                entorno = {k: v for k, v in ENTORNO_PROD.items() if k != variable}
+                with self.assertRaisesMessage(ImproperlyConfigured, variable):
+                    cargar_settings(entorno)
@@ -1,5 +1,5 @@
 # project_planner/urls.py
-from django.contrib import admin
+from django.conf import settings
 from django.http import JsonResponse
 from django.urls import path, include
 
@@ -9,9 +9,14 @@ def root_view(request):
 
 
 urlpatterns = [
-    path("admin/", admin.site.urls),
     path("api/", include("usuarios_app.urls")),
     path("api/", include("proyectos.urls")),
     path("api/", include("configuracion.urls")),
+    path("api/", include("trazabilidad.urls")),
     path("", root_view),  # Agrega esta línea para la ruta raíz
 ]
+
+if settings.ADMIN_HABILITADO:
+    from django.contrib import admin
+
+    urlpatterns.insert(0, path("admin/", admin.site.urls))
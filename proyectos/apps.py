@@ -4,3 +4,6 @@ from django.apps import AppConfig
 class ProyectosConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'proyectos'
+
+    def ready(self):
+        from . import signals  # noqa: F401
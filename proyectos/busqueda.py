@@ -0,0 +1,8 @@
+from project_planner.busqueda import IndiceBusqueda
+
+from .models import Proyecto
+
+# Campos donde busca /api/proyectos/buscar/ (ver project_planner.busqueda).
+CAMPOS_BUSQUEDA = ("nombre", "desarrollador")
+
+INDICE_PROYECTOS = IndiceBusqueda(Proyecto, CAMPOS_BUSQUEDA)
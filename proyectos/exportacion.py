@@ -0,0 +1,74 @@
+import csv
+import json
+
+from django.core.serializers.json import DjangoJSONEncoder
+
+from trazabilidad.consultas import anotar_horas
+from .models import Proyecto
+
+# Columnas exportadas, en orden. Las claves son las de Proyecto.objects.values().
+COLUMNAS_EXPORTACION = [
+    ("id", "id"),
+    ("nombre", "nombre"),
+    ("proceso", "proceso__nombre"),
+    ("linea", "linea__nombre"),
+    ("tipo", "tipo__nombre"),
+    ("cliente", "cliente__nombre"),
+    ("desarrollador", "desarrollador"),
+    ("fecha_creacion", "fecha_creacion"),
+    ("horas_est_dcp", "horas_est_dcp"),
+    ("horas_est_eje", "horas_est_eje"),
+    ("horas_est_total", "horas_est_total"),
+    ("horas_real_dcp", "horas_real_dcp"),
+    ("horas_real_eje", "horas_real_eje"),
+    ("horas_real_total", "horas_real_total"),
+]
+
+
+class Echo:
+    """
+    Objeto tipo archivo que devuelve lo escrito en lugar de guardarlo, para que
+    csv.writer produzca cada línea directamente hacia la respuesta.
+    """
+
+    def write(self, value):
+        return value
+
+
+def filas_exportacion(chunk_size):
+    """
+    Itera los proyectos con sus horas estimadas y reales como diccionarios.
+
+    Usa .iterator(chunk_size) (cursor del lado del servidor en PostgreSQL) para que la
+    memoria no crezca con el número de proyectos.
+    """
+    queryset = anotar_horas(Proyecto.objects.order_by("fecha_creacion", "pk")).values(
+        *(campo for _, campo in COLUMNAS_EXPORTACION)
+    )
+    for fila in queryset.iterator(chunk_size=chunk_size):
+        yield {columna: fila[campo] for columna, campo in COLUMNAS_EXPORTACION}
+
+
+def exportar_csv(chunk_size):
+    """
+    Genera la exportación en CSV, línea a línea, empezando por los encabezados.
+    """
+    writer = csv.writer(Echo())
+    yield writer.writerow([columna for columna, _ in COLUMNAS_EXPORTACION])
+    for fila in filas_exportacion(chunk_size):
+        yield writer.writerow(fila.values())
+
+
+def exportar_ndjson(chunk_size):
+    """
+    Genera la exportación en NDJSON: un objeto JSON por proyecto y por línea.
+    """
+    for fila in filas_exportacion(chunk_size):
+        yield json.dumps(fila, cls=DjangoJSONEncoder) + "\n"
+
+
+# formato -> (generador, content type, extensión del archivo)
+FORMATOS_EXPORTACION = {
+    "csv": (exportar_csv, "text/csv; charset=utf-8", "csv"),
+    "ndjson": (exportar_ndjson, "application/x-ndjson", "ndjson"),
+}
@@ -0,0 +1,27 @@
+from django.core.management.base import BaseCommand
+from django.db import transaction
+
+from project_planner.busqueda import INDICES
+
+
+class Command(BaseCommand):
+    help = (
+        "Reconstruye las tablas de búsqueda FTS (SQLite) de proyectos y usuarios. "
+        "En PostgreSQL los índices de trigramas no necesitan reconstruirse."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=2000,
+            help="Filas por lote de lectura e inserción.",
+        )
+
+    def handle(self, *args, **options):
+        for etiqueta, indice in INDICES.items():
+            with transaction.atomic():
+                filas = indice.reconstruir(batch_size=options["batch_size"])
+            self.stdout.write(
+                self.style.SUCCESS(f"Búsqueda de {etiqueta} reconstruida: {filas} filas.")
+            )
@@ -0,0 +1,31 @@
+# Generated by Django 5.0.3 on 2026-10-18 18:22
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('configuracion', '0002_rename_guid_cliente_id_rename_guid_linea_id_and_more'),
+        ('proyectos', '0001_initial'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='proyecto',
+            name='cliente',
+            field=models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.CASCADE, to='configuracion.cliente'),
+        ),
+        migrations.AlterField(
+            model_name='proyecto',
+            name='nombre',
+            field=models.CharField(max_length=100, unique=True),
+        ),
+        migrations.AddIndex(
+            model_name='proyecto',
+            index=models.Index(fields=['fecha_creacion', 'id'], name='proyecto_fecha_id_idx'),
+        ),
+    ]
@@ -0,0 +1,26 @@
+# Generated by Django 5.0.3 on 2026-10-18 18:24
+
+import django.db.models.functions.text
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('configuracion', '0003_cliente_cliente_activo_nombre_idx_and_more'),
+        ('proyectos', '0002_alter_proyecto_cliente_alter_proyecto_nombre_and_more'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='proyecto',
+            name='nombre',
+            field=models.CharField(max_length=100),
+        ),
+        migrations.AddConstraint(
+            model_name='proyecto',
+            constraint=models.UniqueConstraint(django.db.models.functions.text.Upper('nombre'), name='proyecto_nombre_upper_uniq'),
+        ),
+    ]
@@ -0,0 +1,68 @@
+# Generated by Django 5.0.3 on 2026-10-18 18:49
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('configuracion', '0003_cliente_cliente_activo_nombre_idx_and_more'),
+        ('proyectos', '0003_proyecto_nombre_upper_uniq'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    # Primero se crean los índices compuestos y después se eliminan los índices simples
+    # de las claves foráneas, que quedan cubiertos por ellos.
+    operations = [
+        migrations.AddIndex(
+            model_name='proyecto',
+            index=models.Index(fields=['linea', 'fecha_creacion', 'id'], name='proyecto_linea_fecha_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='proyecto',
+            index=models.Index(fields=['proceso', 'fecha_creacion', 'id'], name='proyecto_proceso_fecha_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='proyecto',
+            index=models.Index(fields=['cliente', 'fecha_creacion', 'id'], name='proyecto_cliente_fecha_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='proyecto',
+            index=models.Index(fields=['tipo', 'fecha_creacion', 'id'], name='proyecto_tipo_fecha_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='proyecto',
+            index=models.Index(fields=['creador', 'fecha_creacion', 'id'], name='proyecto_creador_fecha_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='proyecto',
+            index=models.Index(fields=['desarrollador', 'fecha_creacion', 'id'], name='proyecto_desarr_fecha_idx'),
+        ),
+        migrations.AlterField(
+            model_name='proyecto',
+            name='cliente',
+            field=models.ForeignKey(blank=True, db_index=False, null=True, on_delete=django.db.models.deletion.CASCADE, to='configuracion.cliente'),
+        ),
+        migrations.AlterField(
+            model_name='proyecto',
+            name='creador',
+            field=models.ForeignKey(db_index=False, on_delete=django.db.models.deletion.CASCADE, to=settings.AUTH_USER_MODEL),
+        ),
+        migrations.AlterField(
+            model_name='proyecto',
+            name='linea',
+            field=models.ForeignKey(db_index=False, on_delete=django.db.models.deletion.CASCADE, to='configuracion.linea'),
+        ),
+        migrations.AlterField(
+            model_name='proyecto',
+            name='proceso',
+            field=models.ForeignKey(db_index=False, on_delete=django.db.models.deletion.CASCADE, to='configuracion.proceso'),
+        ),
+        migrations.AlterField(
+            model_name='proyecto',
+            name='tipo',
+            field=models.ForeignKey(db_index=False, on_delete=django.db.models.deletion.CASCADE, to='configuracion.tipo'),
+        ),
+    ]
@@ -0,0 +1,33 @@
+# Generated by Django 5.0.3 on 2026-10-18 18:52
+
+from django.db import migrations
+
+from project_planner.busqueda import crear_indices_busqueda, eliminar_indices_busqueda
+
+CAMPOS = ("nombre", "desarrollador")
+
+
+def crear_busqueda(apps, schema_editor):
+    Proyecto = apps.get_model("proyectos", "Proyecto")
+    filas = Proyecto.objects.using(schema_editor.connection.alias).values_list(
+        "pk", *CAMPOS
+    )
+    crear_indices_busqueda(schema_editor, Proyecto._meta.db_table, CAMPOS, filas)
+
+
+def eliminar_busqueda(apps, schema_editor):
+    Proyecto = apps.get_model("proyectos", "Proyecto")
+    eliminar_indices_busqueda(schema_editor, Proyecto._meta.db_table, CAMPOS)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('proyectos', '0004_indices_filtros'),
+    ]
+
+    # Índices GIN de trigramas en PostgreSQL o tabla FTS5 en SQLite
+    # (ver project_planner.busqueda).
+    operations = [
+        migrations.RunPython(crear_busqueda, eliminar_busqueda),
+    ]
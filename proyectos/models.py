@@ -1,4 +1,5 @@
 from django.db import models
+from django.db.models.functions import Upper
 from django.conf import settings
 import uuid
 from configuracion.models import Proceso, Linea, Tipo, Cliente
@@ -6,19 +7,55 @@ from configuracion.models import Proceso, Linea, Tipo, Cliente
 
 class Proyecto(models.Model):
     id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
-    proceso = models.ForeignKey(Proceso, on_delete=models.CASCADE, null=False)
-    linea = models.ForeignKey(Linea, on_delete=models.CASCADE)
-    tipo = models.ForeignKey(Tipo, on_delete=models.CASCADE)
+    # Las claves foráneas no tienen índice propio: las cubren los índices compuestos de
+    # Meta.indexes, que empiezan por la misma columna.
+    proceso = models.ForeignKey(
+        Proceso, on_delete=models.CASCADE, null=False, db_index=False
+    )
+    linea = models.ForeignKey(Linea, on_delete=models.CASCADE, db_index=False)
+    tipo = models.ForeignKey(Tipo, on_delete=models.CASCADE, db_index=False)
     cliente = models.ForeignKey(
-        Cliente, on_delete=models.CASCADE, null=True, blank=True
+        Cliente, on_delete=models.CASCADE, null=True, blank=True, db_index=False
     )
-    nombre = models.CharField(max_length=100, unique=True)
+    nombre = models.CharField(max_length=100)
     tarea_tw = models.URLField()  # Si es un link URL
     desarrollador = models.CharField(max_length=100)
     fecha_creacion = models.DateTimeField(auto_now_add=True)
     creador = models.ForeignKey(
-        settings.AUTH_USER_MODEL, on_delete=models.CASCADE
+        settings.AUTH_USER_MODEL, on_delete=models.CASCADE, db_index=False
     )  # Quién creó el proyecto
 
+    class Meta:
+        constraints = [
+            # Unicidad del nombre sin distinguir mayúsculas; el índice funcional sobre
+            # UPPER(nombre) es el único punto de verificación (ver ProyectoSerializer).
+            models.UniqueConstraint(Upper("nombre"), name="proyecto_nombre_upper_uniq"),
+        ]
+        indexes = [
+            # Respalda la paginación por cursor (fecha_creacion, pk).
+            models.Index(fields=["fecha_creacion", "id"], name="proyecto_fecha_id_idx"),
+            # Un índice por filtro del listado (ver ProyectoFiltrosMixin): la página
+            # filtrada y ordenada por fecha es un recorrido de rango del índice.
+            models.Index(
+                fields=["linea", "fecha_creacion", "id"], name="proyecto_linea_fecha_idx"
+            ),
+            models.Index(
+                fields=["proceso", "fecha_creacion", "id"], name="proyecto_proceso_fecha_idx"
+            ),
+            models.Index(
+                fields=["cliente", "fecha_creacion", "id"], name="proyecto_cliente_fecha_idx"
+            ),
+            models.Index(
+                fields=["tipo", "fecha_creacion", "id"], name="proyecto_tipo_fecha_idx"
+            ),
+            models.Index(
+                fields=["creador", "fecha_creacion", "id"], name="proyecto_creador_fecha_idx"
+            ),
+            models.Index(
+                fields=["desarrollador", "fecha_creacion", "id"],
+                name="proyecto_desarr_fecha_idx",
+            ),
+        ]
+
     def __str__(self):
         return self.nombre
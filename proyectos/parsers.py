@@ -0,0 +1,37 @@
+import codecs
+import csv
+
+from django.conf import settings
+from rest_framework.exceptions import ParseError
+from rest_framework.parsers import BaseParser
+
+
+class CSVParser(BaseParser):
+    """
+    Convierte un cuerpo text/csv con fila de encabezados en una lista de diccionarios.
+
+    El flujo se decodifica y se lee línea a línea, sin cargar antes el cuerpo completo.
+    La lista sí se construye completa, porque la importación valida todas las filas antes
+    de insertar; para acotar la memoria se rechaza (ParseError) un CSV con más de
+    ``max_filas`` filas (por defecto PROYECTOS_IMPORT_MAX_FILAS) en cuanto se lee la
+    primera fila sobrante. El tamaño de cada campo lo limita csv.field_size_limit().
+    """
+
+    media_type = "text/csv"
+    max_filas = None
+
+    def parse(self, stream, media_type=None, parser_context=None):
+        if stream is None:
+            return []
+        parser_context = parser_context or {}
+        encoding = parser_context.get("encoding", settings.DEFAULT_CHARSET)
+        max_filas = self.max_filas or settings.PROYECTOS_IMPORT_MAX_FILAS
+        filas = []
+        try:
+            for fila in csv.DictReader(codecs.getreader(encoding)(stream)):
+                if len(filas) == max_filas:
+                    raise ParseError(f"El CSV supera el máximo de {max_filas} filas.")
+                filas.append(fila)
+        except (csv.Error, UnicodeDecodeError) as exc:
+            raise ParseError(f"CSV inválido: {exc}")
+        return filas
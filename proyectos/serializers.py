@@ -1,7 +1,11 @@
 from django.core.exceptions import ValidationError as DjangoValidationError
+from django.db import IntegrityError, transaction
+from django.db.models.functions import Upper
 from rest_framework import serializers
+from project_planner.lectura import CampoFechaHora, CampoLectura, SerializadorLectura
 from .models import Proyecto, Proceso, Linea, Tipo, Cliente
 from django.core.validators import URLValidator
+import uuid
 
 # Mensajes de error comunes para campos de relaciones ForeignKey en el serializador.
 COMMON_ERROR_MESSAGES = {
@@ -10,6 +14,17 @@ COMMON_ERROR_MESSAGES = {
     "invalid": "ID inválido.",
 }
 
+NOMBRE_DUPLICADO_MESSAGE = "El nombre del proyecto ya existe."
+# Restricción definida en Proyecto.Meta que garantiza la unicidad de UPPER(nombre).
+NOMBRE_UNIQUE_CONSTRAINT = "proyecto_nombre_upper_uniq"
+
+
+def es_nombre_duplicado(error):
+    """
+    Indica si un IntegrityError proviene de la restricción de unicidad del nombre.
+    """
+    return NOMBRE_UNIQUE_CONSTRAINT in str(error)
+
 
 class ProyectoSerializer(serializers.ModelSerializer):
     """
@@ -25,12 +40,16 @@ class ProyectoSerializer(serializers.ModelSerializer):
     - tipo: Relación ForeignKey con el modelo Tipo.
     - cliente: Relación ForeignKey con el modelo Cliente, opcional.
     - tarea_tw: Campo de URL, requiere una URL válida.
-    - nombre: Campo de texto que debe ser único.
+    - nombre: Campo de texto que debe ser único, sin distinguir mayúsculas.
     - desarrollador: Campo de texto, solo caracteres alfabéticos y espacios permitidos.
 
     Métodos de validación:
-    - validate_nombre: Asegura que el nombre del proyecto sea único.
+    - validate_nombre: Normaliza el nombre del proyecto.
     - validate_desarrollador: Valida que el desarrollador contenga solo letras y espacios.
+
+    La unicidad del nombre no se consulta antes de guardar: create y update confían en la
+    restricción de la base de datos y convierten su IntegrityError en el mismo error de
+    validación, evitando una consulta por escritura y la carrera entre comprobar e insertar.
     """
 
     proceso_nombre = serializers.ReadOnlyField(source="proceso.nombre")
@@ -76,21 +95,17 @@ class ProyectoSerializer(serializers.ModelSerializer):
 
     def validate_nombre(self, value):
         """
-        Valida que el nombre del proyecto sea único.
+        Normaliza el nombre del proyecto eliminando espacios al inicio y al final.
+
+        La unicidad se verifica al guardar mediante la restricción de la base de datos.
 
         Parámetros:
         - value: El nombre del proyecto a validar.
 
         Retorna:
         - El valor validado.
-
-        Excepciones:
-        - ValidationError: Si el nombre ya existe.
         """
-        value = value.strip()
-        if Proyecto.objects.filter(nombre=value).exists():
-            raise serializers.ValidationError("El nombre del proyecto ya existe.")
-        return value
+        return value.strip()
 
     def validate_desarrollador(self, value):
         """
@@ -111,6 +126,30 @@ class ProyectoSerializer(serializers.ModelSerializer):
             )
         return value
 
+    def create(self, validated_data):
+        """
+        Crea el proyecto y traduce una violación de la unicidad del nombre a un error de validación.
+        """
+        try:
+            with transaction.atomic():
+                return super().create(validated_data)
+        except IntegrityError as error:
+            if es_nombre_duplicado(error):
+                raise serializers.ValidationError({"nombre": [NOMBRE_DUPLICADO_MESSAGE]})
+            raise
+
+    def update(self, instance, validated_data):
+        """
+        Actualiza el proyecto y traduce una violación de la unicidad del nombre a un error de validación.
+        """
+        try:
+            with transaction.atomic():
+                return super().update(instance, validated_data)
+        except IntegrityError as error:
+            if es_nombre_duplicado(error):
+                raise serializers.ValidationError({"nombre": [NOMBRE_DUPLICADO_MESSAGE]})
+            raise
+
     class Meta:
         model = Proyecto
         extra_kwargs = {"creador": {"required": False}}
@@ -130,3 +169,124 @@ class ProyectoSerializer(serializers.ModelSerializer):
             "tipo_nombre",
             "cliente_nombre",
         ]
+
+
+class ProyectoLecturaSerializer(SerializadorLectura):
+    """
+    Serialización de solo lectura de los listados de proyectos (ver SerializadorLectura).
+
+    Produce la misma salida que ProyectoSerializer a partir de filas de values(): los
+    catálogos y el creador como su id, los nombres de los catálogos con un JOIN y
+    cliente_nombre omitido si el proyecto no tiene cliente.
+    """
+
+    campos = {
+        "id": CampoLectura("id", str),
+        "proceso": CampoLectura("proceso_id"),
+        "linea": CampoLectura("linea_id"),
+        "tipo": CampoLectura("tipo_id"),
+        "cliente": CampoLectura("cliente_id"),
+        "nombre": CampoLectura("nombre"),
+        "tarea_tw": CampoLectura("tarea_tw"),
+        "desarrollador": CampoLectura("desarrollador"),
+        "fecha_creacion": CampoFechaHora("fecha_creacion"),
+        "creador": CampoLectura("creador_id"),
+        "proceso_nombre": CampoLectura("proceso__nombre"),
+        "linea_nombre": CampoLectura("linea__nombre"),
+        "tipo_nombre": CampoLectura("tipo__nombre"),
+        "cliente_nombre": CampoLectura("cliente__nombre", omitir_nulo=True),
+    }
+
+
+class CatalogoEnMemoriaField(serializers.PrimaryKeyRelatedField):
+    """
+    Relación con un catálogo que se resuelve contra objetos ya cargados en memoria.
+
+    Espera en el contexto del serializador un diccionario ``catalogos`` con la forma
+    ``{Modelo: {id: instancia}}``, de modo que validar muchas filas no ejecuta una
+    consulta por fila.
+    """
+
+    def to_internal_value(self, data):
+        try:
+            pk = uuid.UUID(str(data))
+        except (TypeError, ValueError, AttributeError):
+            self.fail("invalid")
+        catalogo = self.context["catalogos"][self.queryset.model]
+        try:
+            return catalogo[pk]
+        except KeyError:
+            self.fail("does_not_exist", pk_value=data)
+
+
+class ProyectoImportSerializer(ProyectoSerializer):
+    """
+    Serializador para la importación masiva de proyectos.
+
+    Reutiliza las validaciones de ProyectoSerializer, pero resuelve proceso, linea, tipo y
+    cliente con CatalogoEnMemoriaField (ver cargar_catalogos) y no permite indicar el
+    creador, que siempre es el usuario que importa. No guarda por sí mismo: la vista
+    inserta las instancias con bulk_create.
+    """
+
+    proceso = CatalogoEnMemoriaField(
+        queryset=Proceso.objects.all(), error_messages=COMMON_ERROR_MESSAGES
+    )
+    linea = CatalogoEnMemoriaField(
+        queryset=Linea.objects.all(), error_messages=COMMON_ERROR_MESSAGES
+    )
+    tipo = CatalogoEnMemoriaField(
+        queryset=Tipo.objects.all(), error_messages=COMMON_ERROR_MESSAGES
+    )
+    cliente = CatalogoEnMemoriaField(
+        queryset=Cliente.objects.all(), error_messages=COMMON_ERROR_MESSAGES
+    )
+    creador = serializers.PrimaryKeyRelatedField(read_only=True)
+
+
+def cargar_catalogos(filas):
+    """
+    Carga los catálogos referenciados por las filas a importar con una consulta por catálogo.
+
+    Parámetros:
+    - filas: Lista de diccionarios con las claves proceso, linea, tipo y cliente.
+
+    Retorna:
+    - Diccionario ``{Modelo: {id: instancia}}`` para el contexto de ProyectoImportSerializer.
+    """
+    catalogos = {}
+    for campo, modelo in (
+        ("proceso", Proceso),
+        ("linea", Linea),
+        ("tipo", Tipo),
+        ("cliente", Cliente),
+    ):
+        ids = set()
+        for fila in filas:
+            if not isinstance(fila, dict):
+                continue
+            try:
+                ids.add(uuid.UUID(str(fila.get(campo))))
+            except (TypeError, ValueError, AttributeError):
+                continue
+        catalogos[modelo] = modelo.objects.in_bulk(ids)
+    return catalogos
+
+
+def buscar_nombres_duplicados(nombres):
+    """
+    Devuelve los índices de ``nombres`` que repiten un nombre anterior de la lista o uno
+    ya existente en la base de datos, sin distinguir mayúsculas. Usa una sola consulta.
+    """
+    existentes = set(
+        Proyecto.objects.annotate(nombre_upper=Upper("nombre"))
+        .filter(nombre_upper__in={nombre.upper() for nombre in nombres})
+        .values_list("nombre_upper", flat=True)
+    )
+    duplicados = []
+    for indice, nombre in enumerate(nombres):
+        clave = nombre.upper()
+        if clave in existentes:
+            duplicados.append(indice)
+        existentes.add(clave)
+    return duplicados
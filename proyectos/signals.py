@@ -0,0 +1,12 @@
+from django.db.models.signals import post_delete, post_save
+
+from .busqueda import INDICE_PROYECTOS
+from .models import Proyecto
+
+# La tabla de búsqueda FTS (solo SQLite) sigue cada alta, cambio y baja de proyectos.
+post_save.connect(
+    INDICE_PROYECTOS.al_guardar, sender=Proyecto, dispatch_uid="busqueda_proyecto_save"
+)
+post_delete.connect(
+    INDICE_PROYECTOS.al_eliminar, sender=Proyecto, dispatch_uid="busqueda_proyecto_delete"
+)
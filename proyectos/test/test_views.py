@@ -0,0 +1,971 @@
+import base64
+import csv
+import io
+import json
+from datetime import date, datetime
+from decimal import Decimal
+from unittest import mock
+from urllib.parse import urlencode
+from django.core.management import call_command
+from django.db import connection
+from django.utils import timezone
+from django.test import override_settings
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.test import APITestCase
+from django.contrib.auth import get_user_model
+from configuracion.models import Proceso, Linea, Tipo, Cliente
+from project_planner.pagination import FechaCreacionCursorPagination
+from proyectos.models import Proyecto
+from proyectos.serializers import ProyectoSerializer, buscar_nombres_duplicados
+from trazabilidad.models import Estimacion, DisenoCP, Ejecucion, ResumenHorasProyecto
+
+
+User = get_user_model()
+
+
+class ProyectoListQueriesTests(APITestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.test_user = User.objects.create_user(
+            username="testuser", email="test@example.com", password="testpassword"
+        )
+        cls.url = reverse("proyecto-list")
+
+    def setUp(self):
+        self.client.force_authenticate(user=self.test_user)
+
+    def crear_proyectos(self, cantidad, inicio=0):
+        # Cada proyecto usa catálogos propios para que no se reutilicen objetos en caché.
+        for i in range(inicio, inicio + cantidad):
+            Proyecto.objects.create(
+                proceso=Proceso.objects.create(nombre=f"Proceso {i}"),
+                linea=Linea.objects.create(nombre=f"Linea {i}"),
+                tipo=Tipo.objects.create(nombre=f"Tipo {i}"),
+                cliente=Cliente.objects.create(nombre=f"Cliente {i}"),
+                nombre=f"Proyecto {i}",
+                tarea_tw="https://example.com/tarea",
+                desarrollador="Dev",
+                creador=self.test_user,
+            )
+
+    def contar_consultas_listado(self):
+        with CaptureQueriesContext(connection) as contexto:
+            response = self.client.get(self.url)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        return len(contexto.captured_queries)
+
+    def test_list_query_count_is_constant(self):
+        """
+        Asegurar que el listado de proyectos ejecuta el mismo número de consultas sin
+        importar cuántos proyectos existan.
+        """
+        self.crear_proyectos(2)
+        consultas_pocos = self.contar_consultas_listado()
+
+        self.crear_proyectos(10, inicio=2)
+        consultas_muchos = self.contar_consultas_listado()
+
+        self.assertEqual(consultas_pocos, consultas_muchos)
+
+    def test_list_includes_catalog_names(self):
+        """
+        Asegurar que el listado sigue incluyendo los nombres de los catálogos relacionados.
+        """
+        self.crear_proyectos(1)
+        response = self.client.get(self.url)
+        proyecto = response.data["results"][0]
+        self.assertEqual(proyecto["proceso_nombre"], "Proceso 0")
+        self.assertEqual(proyecto["linea_nombre"], "Linea 0")
+        self.assertEqual(proyecto["tipo_nombre"], "Tipo 0")
+        self.assertEqual(proyecto["cliente_nombre"], "Cliente 0")
+
+
+class ProyectoPaginationTests(APITestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.test_user = User.objects.create_user(
+            username="testuser", email="test@example.com", password="testpassword"
+        )
+        cls.url = reverse("proyecto-list")
+        proceso = Proceso.objects.create(nombre="Proceso")
+        linea = Linea.objects.create(nombre="Linea")
+        tipo = Tipo.objects.create(nombre="Tipo")
+        for i in range(5):
+            Proyecto.objects.create(
+                proceso=proceso,
+                linea=linea,
+                tipo=tipo,
+                nombre=f"Proyecto {i}",
+                tarea_tw="https://example.com/tarea",
+                desarrollador="Dev",
+                creador=cls.test_user,
+            )
+
+    def setUp(self):
+        self.client.force_authenticate(user=self.test_user)
+
+    def test_cursor_pagination_walks_all_projects(self):
+        """
+        Asegurar que recorrer las páginas con el cursor devuelve cada proyecto una sola vez,
+        del más reciente al más antiguo.
+        """
+        nombres = []
+        url = f"{self.url}?page_size=2"
+        while url:
+            response = self.client.get(url)
+            self.assertEqual(response.status_code, status.HTTP_200_OK)
+            self.assertLessEqual(len(response.data["results"]), 2)
+            nombres.extend(p["nombre"] for p in response.data["results"])
+            url = response.data["next"]
+
+        esperados = list(
+            Proyecto.objects.order_by("-fecha_creacion", "-pk").values_list(
+                "nombre", flat=True
+            )
+        )
+        self.assertEqual(nombres, esperados)
+
+    def test_new_project_does_not_shift_next_page(self):
+        """
+        Asegurar que un proyecto creado entre páginas no desplaza los resultados siguientes.
+        """
+        primera = self.client.get(f"{self.url}?page_size=2")
+        Proyecto.objects.create(
+            proceso=Proceso.objects.first(),
+            linea=Linea.objects.first(),
+            tipo=Tipo.objects.first(),
+            nombre="Proyecto nuevo",
+            tarea_tw="https://example.com/tarea",
+            desarrollador="Dev",
+            creador=self.test_user,
+        )
+        segunda = self.client.get(primera.data["next"])
+        nombres_primera = {p["nombre"] for p in primera.data["results"]}
+        nombres_segunda = {p["nombre"] for p in segunda.data["results"]}
+        self.assertFalse(nombres_primera & nombres_segunda)
+        self.assertNotIn("Proyecto nuevo", nombres_segunda)
+
+
+class ProyectoCursorEmpatesTests(APITestCase):
+    """
+    Paginación por cursor con más filas empatadas en el campo del orden que
+    ``offset_cutoff`` de CursorPagination.
+    """
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.test_user = User.objects.create_user(
+            username="testuser", email="test@example.com", password="testpassword"
+        )
+        cls.url = reverse("proyecto-list")
+        proceso = Proceso.objects.create(nombre="Proceso")
+        linea = Linea.objects.create(nombre="Linea")
+        tipo = Tipo.objects.create(nombre="Tipo")
+        cls.total = FechaCreacionCursorPagination.offset_cutoff + 300
+        Proyecto.objects.bulk_create(
+            Proyecto(
+                proceso=proceso,
+                linea=linea,
+                tipo=tipo,
+                nombre=f"Proyecto {i}",
+                tarea_tw="https://example.com/tarea",
+                desarrollador="Dev",
+                creador=cls.test_user,
+            )
+            for i in range(cls.total)
+        )
+        # Mismo desarrollador y misma fecha: solo la clave primaria desempata.
+        Proyecto.objects.update(fecha_creacion=timezone.now())
+
+    def setUp(self):
+        self.client.force_authenticate(user=self.test_user)
+
+    def recorrer(self, url):
+        ids = []
+        paginas = 0
+        while url:
+            response = self.client.get(url)
+            self.assertEqual(response.status_code, status.HTTP_200_OK)
+            ids.extend(p["id"] for p in response.data["results"])
+            url = response.data["next"]
+            paginas += 1
+            self.assertLessEqual(paginas, 10, "El cursor no termina.")
+        return ids
+
+    def test_tied_rows_are_walked_once(self):
+        """
+        Asegurar que el cursor recorre cada proyecto una sola vez y termina aunque todos
+        empaten en el campo del orden y en la fecha.
+        """
+        for ordering in ("desarrollador", "-desarrollador", "fecha_creacion", None):
+            with self.subTest(ordering=ordering):
+                url = f"{self.url}?page_size=200"
+                if ordering:
+                    url += f"&ordering={ordering}"
+                ids = self.recorrer(url)
+                self.assertEqual(len(ids), self.total)
+                self.assertEqual(len(set(ids)), self.total)
+
+    def test_previous_link_with_tied_rows(self):
+        """
+        Asegurar que el enlace anterior vuelve a la misma página entre filas empatadas.
+        """
+        primera = self.client.get(f"{self.url}?ordering=desarrollador&page_size=300")
+        segunda = self.client.get(primera.data["next"])
+        anterior = self.client.get(segunda.data["previous"])
+        self.assertEqual(
+            [p["id"] for p in anterior.data["results"]],
+            [p["id"] for p in primera.data["results"]],
+        )
+
+    def test_invalid_cursor_returns_404(self):
+        """
+        Asegurar que un cursor con una posición inválida devuelve 404 y no un error 500.
+        """
+        for posicion in ("p=no-json", "p=%5B%22x%22%5D", "p=%5B%22x%22%2C%22y%22%2C%22z%22%5D"):
+            cursor = base64.b64encode(posicion.encode()).decode()
+            response = self.client.get(self.url, {"ordering": "desarrollador", "cursor": cursor})
+            self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+
+
+class ProyectoListadoLigeroTests(APITestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.test_user = User.objects.create_user(
+            username="testuser", email="test@example.com", password="testpassword"
+        )
+        cls.url = reverse("proyecto-list")
+        catalogos = {
+            "proceso": Proceso.objects.create(nombre="Proceso"),
+            "linea": Linea.objects.create(nombre="Linea"),
+            "tipo": Tipo.objects.create(nombre="Tipo"),
+        }
+        for i, cliente in enumerate([Cliente.objects.create(nombre="Cliente"), None]):
+            Proyecto.objects.create(
+                **catalogos,
+                cliente=cliente,
+                nombre=f"Proyecto {i}",
+                tarea_tw="https://example.com/tarea",
+                desarrollador=f"Dev {i}",
+                creador=cls.test_user,
+            )
+
+    def setUp(self):
+        self.client.force_authenticate(user=self.test_user)
+
+    def test_same_output_as_model_serializer(self):
+        """
+        Asegurar que el listado produce el mismo JSON que ProyectoSerializer, incluido un
+        proyecto sin cliente (sin cliente_nombre).
+        """
+        response = self.client.get(self.url)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        esperado = ProyectoSerializer(
+            Proyecto.objects.order_by("-fecha_creacion", "-pk"), many=True
+        ).data
+        self.assertEqual(
+            json.loads(response.content)["results"],
+            json.loads(json.dumps(esperado, default=str)),
+        )
+        self.assertNotIn("cliente_nombre", response.data["results"][0])
+
+    def test_fields_trims_output_and_columns(self):
+        """
+        Asegurar que ``?fields=`` limita los campos de la respuesta y las columnas leídas.
+        """
+        with CaptureQueriesContext(connection) as contexto:
+            response = self.client.get(self.url, {"fields": "id,nombre"})
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        for proyecto in response.data["results"]:
+            self.assertEqual(list(proyecto), ["id", "nombre"])
+        sql = contexto.captured_queries[-1]["sql"]
+        self.assertNotIn("tarea_tw", sql)
+        self.assertNotIn("configuracion_proceso", sql)
+
+    def test_fields_with_ordering_and_pagination(self):
+        """
+        Asegurar que el cursor funciona aunque el campo del orden no esté en ``?fields=``.
+        """
+        nombres = []
+        url = f"{self.url}?fields=nombre&ordering=desarrollador&page_size=1"
+        while url:
+            response = self.client.get(url)
+            self.assertEqual(response.status_code, status.HTTP_200_OK)
+            self.assertEqual([list(p) for p in response.data["results"]], [["nombre"]])
+            nombres.extend(p["nombre"] for p in response.data["results"])
+            url = response.data["next"]
+        self.assertEqual(nombres, ["Proyecto 0", "Proyecto 1"])
+
+    def test_unknown_field_is_rejected(self):
+        """
+        Asegurar que un campo desconocido devuelve 400 con los campos disponibles.
+        """
+        for valor in ("id,clave", ","):
+            response = self.client.get(self.url, {"fields": valor})
+            self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+            self.assertIn("Disponibles: id, proceso", response.data["fields"])
+
+
+class ProyectoFiltrosTests(APITestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.test_user = User.objects.create_user(
+            username="testuser", email="test@example.com", password="testpassword"
+        )
+        cls.otro_usuario = User.objects.create_user(
+            username="otro", email="otro@example.com", password="testpassword"
+        )
+        cls.url = reverse("proyecto-list")
+        cls.proceso = Proceso.objects.create(nombre="Proceso")
+        cls.tipo = Tipo.objects.create(nombre="Tipo")
+        cls.linea_a = Linea.objects.create(nombre="Linea A")
+        cls.linea_b = Linea.objects.create(nombre="Linea B")
+        datos = [
+            ("Alfa", cls.linea_a, cls.test_user, "Ana", datetime(2024, 1, 10, 12)),
+            ("Beta", cls.linea_a, cls.otro_usuario, "Bruno", datetime(2024, 2, 10, 12)),
+            ("Gamma", cls.linea_b, cls.test_user, "Ana", datetime(2024, 3, 10, 12)),
+        ]
+        for nombre, linea, creador, desarrollador, fecha in datos:
+            proyecto = Proyecto.objects.create(
+                proceso=cls.proceso,
+                linea=linea,
+                tipo=cls.tipo,
+                nombre=nombre,
+                tarea_tw="https://example.com/tarea",
+                desarrollador=desarrollador,
+                creador=creador,
+            )
+            Proyecto.objects.filter(pk=proyecto.pk).update(
+                fecha_creacion=timezone.make_aware(fecha)
+            )
+
+    def setUp(self):
+        self.client.force_authenticate(user=self.test_user)
+
+    def nombres(self, **params):
+        response = self.client.get(self.url, params)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        return [p["nombre"] for p in response.data["results"]]
+
+    def test_filters(self):
+        """
+        Asegurar que cada parámetro filtra el listado y que se pueden combinar.
+        """
+        self.assertEqual(self.nombres(linea=self.linea_a.id), ["Beta", "Alfa"])
+        self.assertEqual(self.nombres(creador=self.test_user.pk), ["Gamma", "Alfa"])
+        self.assertEqual(self.nombres(desarrollador="Ana"), ["Gamma", "Alfa"])
+        self.assertEqual(
+            self.nombres(proceso=self.proceso.id, tipo=self.tipo.id), ["Gamma", "Beta", "Alfa"]
+        )
+        self.assertEqual(
+            self.nombres(linea=self.linea_a.id, creador=self.test_user.pk), ["Alfa"]
+        )
+
+    def test_date_range(self):
+        """
+        Asegurar que desde/hasta con fecha incluyen el día completo y aceptan fecha y hora.
+        """
+        self.assertEqual(
+            self.nombres(desde="2024-02-10", hasta="2024-03-10"), ["Gamma", "Beta"]
+        )
+        self.assertEqual(self.nombres(hasta="2024-01-10"), ["Alfa"])
+        self.assertEqual(self.nombres(hasta="2024-01-10T11:00:00Z"), [])
+
+    def test_invalid_params(self):
+        """
+        Asegurar que un UUID o una fecha inválidos devuelven 400.
+        """
+        for params in ({"linea": "no-es-uuid"}, {"desde": "10/01/2024"}):
+            response = self.client.get(self.url, params)
+            self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+            self.assertIn(next(iter(params)), response.data)
+
+    def test_ordering(self):
+        """
+        Asegurar que ?ordering= ordena por desarrollador y fecha, y que el cursor lo respeta.
+        """
+        self.assertEqual(self.nombres(ordering="fecha_creacion"), ["Alfa", "Beta", "Gamma"])
+        self.assertEqual(self.nombres(ordering="-desarrollador"), ["Beta", "Gamma", "Alfa"])
+
+        nombres = []
+        url = f"{self.url}?ordering=desarrollador&page_size=1"
+        while url:
+            response = self.client.get(url)
+            nombres.extend(p["nombre"] for p in response.data["results"])
+            url = response.data["next"]
+        self.assertEqual(nombres, ["Alfa", "Gamma", "Beta"])
+
+
+class ProyectoFiltrosPlanTests(APITestCase):
+    """
+    Verifica con EXPLAIN que el listado filtrado usa los índices compuestos de Proyecto en
+    lugar de recorrer la tabla completa.
+    """
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.test_user = User.objects.create_user(
+            username="testuser", email="test@example.com", password="testpassword"
+        )
+        cls.url = reverse("proyecto-list")
+        cls.proyecto = Proyecto.objects.create(
+            proceso=Proceso.objects.create(nombre="Proceso"),
+            linea=Linea.objects.create(nombre="Linea"),
+            tipo=Tipo.objects.create(nombre="Tipo"),
+            cliente=Cliente.objects.create(nombre="Cliente"),
+            nombre="Proyecto",
+            tarea_tw="https://example.com/tarea",
+            desarrollador="Dev",
+            creador=cls.test_user,
+        )
+
+    def setUp(self):
+        self.client.force_authenticate(user=self.test_user)
+
+    def plan_listado(self, params):
+        """
+        Devuelve el plan de la consulta principal del listado (la que lee la tabla de
+        proyectos).
+        """
+        with CaptureQueriesContext(connection) as contexto:
+            response = self.client.get(self.url, params)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        tabla = Proyecto._meta.db_table
+        sql = next(
+            q["sql"] for q in contexto.captured_queries if f'FROM "{tabla}"' in q["sql"]
+        )
+        with connection.cursor() as cursor:
+            if connection.vendor == "postgresql":
+                # Con tablas pequeñas PostgreSQL prefiere el recorrido secuencial; se
+                # desalienta para comprobar que existe un índice utilizable.
+                cursor.execute("SET LOCAL enable_seqscan = off")
+                cursor.execute(f"EXPLAIN {sql}")
+            else:
+                cursor.execute(f"EXPLAIN QUERY PLAN {sql}")
+            return "\n".join(str(fila) for fila in cursor.fetchall())
+
+    def test_filtered_list_uses_indexes(self):
+        """
+        Asegurar que cada filtro, solo y combinado con el rango de fechas, se resuelve con
+        un índice y sin ordenar en memoria.
+        """
+        if connection.vendor not in ("sqlite", "postgresql"):
+            self.skipTest("EXPLAIN solo se interpreta en SQLite y PostgreSQL.")
+        tabla = Proyecto._meta.db_table
+        filtros = {
+            "linea": self.proyecto.linea_id,
+            "proceso": self.proyecto.proceso_id,
+            "cliente": self.proyecto.cliente_id,
+            "tipo": self.proyecto.tipo_id,
+            "creador": self.test_user.pk,
+            "desarrollador": "Dev",
+        }
+        casos = [{}, {"ordering": "desarrollador"}, {"desde": "2024-01-01"}]
+        casos += [{campo: valor} for campo, valor in filtros.items()]
+        casos += [{campo: valor, "desde": "2024-01-01"} for campo, valor in filtros.items()]
+        for params in casos:
+            with self.subTest(params=params):
+                plan = self.plan_listado(params)
+                if connection.vendor == "postgresql":
+                    self.assertNotIn(f"Seq Scan on {tabla}", plan)
+                    self.assertNotIn("Sort", plan)
+                else:
+                    self.assertNotRegex(plan, rf"SCAN {tabla}(?! USING)")
+                    self.assertNotIn("TEMP B-TREE", plan)
+                    if set(params) - {"ordering"}:
+                        self.assertIn(f"SEARCH {tabla} USING", plan)
+
+
+    def test_cursor_page_uses_index(self):
+        """
+        Asegurar que la página siguiente a un cursor ordenado por desarrollador recorre el
+        índice desde la posición, sin ordenar en memoria.
+        """
+        if connection.vendor not in ("sqlite", "postgresql"):
+            self.skipTest("EXPLAIN solo se interpreta en SQLite y PostgreSQL.")
+        tabla = Proyecto._meta.db_table
+        posicion = json.dumps(
+            [self.proyecto.desarrollador, str(self.proyecto.fecha_creacion), str(self.proyecto.pk)]
+        )
+        cursor = base64.b64encode(urlencode({"p": posicion}).encode()).decode()
+        plan = self.plan_listado({"ordering": "desarrollador", "cursor": cursor})
+        if connection.vendor == "postgresql":
+            self.assertNotIn(f"Seq Scan on {tabla}", plan)
+            self.assertNotIn("Sort", plan)
+        else:
+            self.assertIn(f"SEARCH {tabla} USING", plan)
+            self.assertNotIn("TEMP B-TREE", plan)
+
+
+class ProyectoNombreUnicoTests(APITestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.test_user = User.objects.create_user(
+            username="testuser", email="test@example.com", password="testpassword"
+        )
+        cls.url = reverse("proyecto-list")
+        cls.proceso = Proceso.objects.create(nombre="Proceso")
+        cls.linea = Linea.objects.create(nombre="Linea")
+        cls.tipo = Tipo.objects.create(nombre="Tipo")
+        cls.cliente = Cliente.objects.create(nombre="Cliente")
+        cls.proyecto = Proyecto.objects.create(
+            proceso=cls.proceso,
+            linea=cls.linea,
+            tipo=cls.tipo,
+            cliente=cls.cliente,
+            nombre="Proyecto Alfa",
+            tarea_tw="https://example.com/tarea",
+            desarrollador="Dev",
+            creador=cls.test_user,
+        )
+
+    def setUp(self):
+        self.client.force_authenticate(user=self.test_user)
+
+    def datos_proyecto(self, nombre):
+        return {
+            "proceso": str(self.proceso.id),
+            "linea": str(self.linea.id),
+            "tipo": str(self.tipo.id),
+            "cliente": str(self.cliente.id),
+            "nombre": nombre,
+            "tarea_tw": "https://example.com/tarea",
+            "desarrollador": "Dev",
+        }
+
+    def test_create_duplicate_name_ignores_case(self):
+        """
+        Asegurar que no se puede crear un proyecto cuyo nombre solo difiere en mayúsculas.
+        """
+        response = self.client.post(
+            self.url, self.datos_proyecto("  PROYECTO alfa "), format="json"
+        )
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertEqual(response.data["nombre"], ["El nombre del proyecto ya existe."])
+        self.assertEqual(Proyecto.objects.count(), 1)
+
+    def test_create_unique_name(self):
+        """
+        Asegurar que un nombre nuevo se crea correctamente.
+        """
+        response = self.client.post(
+            self.url, self.datos_proyecto("Proyecto Beta"), format="json"
+        )
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        self.assertEqual(response.data["nombre"], "Proyecto Beta")
+
+    def test_patch_keeps_own_name(self):
+        """
+        Asegurar que un PATCH que reenvía el nombre del propio proyecto no se considera duplicado.
+        """
+        url = reverse("proyecto-detail", args=[self.proyecto.id])
+        response = self.client.patch(
+            url, {"nombre": "Proyecto Alfa", "desarrollador": "Otro Dev"}, format="json"
+        )
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data["desarrollador"], "Otro Dev")
+
+    def test_patch_to_existing_name_is_rejected(self):
+        """
+        Asegurar que renombrar un proyecto con el nombre de otro devuelve el error de validación.
+        """
+        otro = Proyecto.objects.create(
+            proceso=self.proceso,
+            linea=self.linea,
+            tipo=self.tipo,
+            nombre="Proyecto Gamma",
+            tarea_tw="https://example.com/tarea",
+            desarrollador="Dev",
+            creador=self.test_user,
+        )
+        url = reverse("proyecto-detail", args=[otro.id])
+        response = self.client.patch(url, {"nombre": "proyecto alfa"}, format="json")
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertEqual(response.data["nombre"], ["El nombre del proyecto ya existe."])
+
+
+class ProyectoImportarTests(APITestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.test_user = User.objects.create_user(
+            username="testuser", email="test@example.com", password="testpassword"
+        )
+        cls.url = reverse("proyecto-importar")
+        cls.proceso = Proceso.objects.create(nombre="Proceso")
+        cls.linea = Linea.objects.create(nombre="Linea")
+        cls.tipo = Tipo.objects.create(nombre="Tipo")
+        cls.cliente = Cliente.objects.create(nombre="Cliente")
+
+    def setUp(self):
+        self.client.force_authenticate(user=self.test_user)
+
+    def fila(self, nombre, **cambios):
+        datos = {
+            "proceso": str(self.proceso.id),
+            "linea": str(self.linea.id),
+            "tipo": str(self.tipo.id),
+            "cliente": str(self.cliente.id),
+            "nombre": nombre,
+            "tarea_tw": "https://example.com/tarea",
+            "desarrollador": "Dev",
+        }
+        datos.update(cambios)
+        return datos
+
+    def test_import_json(self):
+        """
+        Asegurar que un arreglo JSON crea todos los proyectos con el usuario como creador.
+        """
+        filas = [self.fila(f"Proyecto {i}") for i in range(5)]
+        response = self.client.post(f"{self.url}?batch_size=2", filas, format="json")
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        self.assertEqual(response.data["creados"], 5)
+        self.assertEqual(Proyecto.objects.filter(creador=self.test_user).count(), 5)
+        self.assertEqual(
+            ResumenHorasProyecto.objects.filter(proyecto__creador=self.test_user).count(), 5
+        )
+
+    def test_import_csv(self):
+        """
+        Asegurar que un CSV con encabezados crea los proyectos.
+        """
+        campos = ["proceso", "linea", "tipo", "cliente", "nombre", "tarea_tw", "desarrollador"]
+        lineas = [",".join(campos)]
+        for i in range(3):
+            fila = self.fila(f"Proyecto CSV {i}")
+            lineas.append(",".join(fila[campo] for campo in campos))
+        response = self.client.post(
+            self.url, "\n".join(lineas).encode(), content_type="text/csv"
+        )
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        self.assertEqual(Proyecto.objects.filter(nombre__startswith="Proyecto CSV").count(), 3)
+
+    def test_import_query_count_is_constant(self):
+        """
+        Asegurar que el número de consultas no crece con el número de filas importadas.
+        """
+        with CaptureQueriesContext(connection) as pocas:
+            self.client.post(
+                self.url, [self.fila(f"A {i}") for i in range(2)], format="json"
+            )
+        with CaptureQueriesContext(connection) as muchas:
+            self.client.post(
+                self.url, [self.fila(f"B {i}") for i in range(20)], format="json"
+            )
+        self.assertEqual(len(pocas.captured_queries), len(muchas.captured_queries))
+
+    def test_import_reports_row_errors(self):
+        """
+        Asegurar que las filas inválidas se reportan por número de fila y que no se crea ningún proyecto.
+        """
+        Proyecto.objects.create(
+            proceso=self.proceso,
+            linea=self.linea,
+            tipo=self.tipo,
+            nombre="Existente",
+            tarea_tw="https://example.com/tarea",
+            desarrollador="Dev",
+            creador=self.test_user,
+        )
+        filas = [
+            self.fila("Valido"),
+            self.fila("Linea inexistente", linea="00000000-0000-0000-0000-000000000000"),
+            self.fila("EXISTENTE"),
+            self.fila("valido"),
+            self.fila("Dev invalido", desarrollador="Dev 123"),
+        ]
+        response = self.client.post(self.url, filas, format="json")
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        errores = {error["fila"]: error["errores"] for error in response.data["errores"]}
+        self.assertEqual(set(errores), {2, 3, 4, 5})
+        self.assertIn("linea", errores[2])
+        self.assertEqual(errores[3]["nombre"], ["El nombre del proyecto ya existe."])
+        self.assertEqual(errores[4]["nombre"], ["El nombre del proyecto ya existe."])
+        self.assertIn("desarrollador", errores[5])
+        self.assertEqual(Proyecto.objects.count(), 1)
+
+    def test_import_requires_list(self):
+        """
+        Asegurar que un cuerpo que no es una lista se rechaza.
+        """
+        response = self.client.post(self.url, self.fila("Solo"), format="json")
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+    def test_import_integrity_error_reports_rows(self):
+        """
+        Asegurar que un nombre creado entre la validación y la inserción se reporta en su fila.
+        """
+        Proyecto.objects.create(
+            proceso=self.proceso,
+            linea=self.linea,
+            tipo=self.tipo,
+            nombre="Concurrente",
+            tarea_tw="https://example.com/tarea",
+            desarrollador="Dev",
+            creador=self.test_user,
+        )
+        filas = [self.fila("Nuevo"), self.fila("concurrente")]
+        # La primera búsqueda no ve el proyecto, como si se hubiera creado después.
+        with mock.patch(
+            "proyectos.views.buscar_nombres_duplicados",
+            side_effect=[[], buscar_nombres_duplicados(["Nuevo", "concurrente"])],
+        ):
+            response = self.client.post(self.url, filas, format="json")
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertEqual(
+            response.data["errores"],
+            [{"fila": 2, "errores": {"nombre": ["El nombre del proyecto ya existe."]}}],
+        )
+        self.assertEqual(Proyecto.objects.count(), 1)
+
+    @override_settings(PROYECTOS_IMPORT_MAX_FILAS=2)
+    def test_import_rejects_too_many_rows(self):
+        """
+        Asegurar que un JSON o un CSV con más filas que el máximo se rechaza sin crear proyectos.
+        """
+        filas = [self.fila(f"Proyecto {i}") for i in range(3)]
+        response = self.client.post(self.url, filas, format="json")
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+        campos = list(filas[0])
+        lineas = [",".join(campos)] + [",".join(f[c] for c in campos) for f in filas]
+        response = self.client.post(
+            self.url, "\n".join(lineas).encode(), content_type="text/csv"
+        )
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertIn("máximo de 2 filas", response.data["detail"])
+        self.assertEqual(Proyecto.objects.count(), 0)
+
+
+class ProyectoExportarTests(APITestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.test_user = User.objects.create_user(
+            username="testuser", email="test@example.com", password="testpassword"
+        )
+        cls.url = reverse("proyecto-exportar")
+        proceso = Proceso.objects.create(nombre="Proceso")
+        linea = Linea.objects.create(nombre="Linea")
+        tipo = Tipo.objects.create(nombre="Tipo")
+        cls.proyecto = Proyecto.objects.create(
+            proceso=proceso,
+            linea=linea,
+            tipo=tipo,
+            nombre="Con horas",
+            tarea_tw="https://example.com/tarea",
+            desarrollador="Dev",
+            creador=cls.test_user,
+        )
+        Proyecto.objects.create(
+            proceso=proceso,
+            linea=linea,
+            tipo=tipo,
+            nombre="Sin horas",
+            tarea_tw="https://example.com/tarea",
+            desarrollador="Dev",
+            creador=cls.test_user,
+        )
+        fechas = {
+            "fecha_registro_real": date(2024, 3, 1),
+            "registrado_por": cls.test_user,
+            "proyecto": cls.proyecto,
+        }
+        Estimacion.objects.create(
+            horas_est_dcp=Decimal("4.00"),
+            horas_est_eje=Decimal("10.00"),
+            fecha_entrega_hu=date(2024, 3, 10),
+            **fechas,
+        )
+        DisenoCP.objects.create(
+            horas_real_dcp=Decimal("5.50"),
+            fecha_inicio=date(2024, 3, 2),
+            fecha_fin=date(2024, 3, 3),
+            **fechas,
+        )
+        for iteracion, horas in (("iteracion_1", "6.00"), ("iteracion_2", "3.25")):
+            Ejecucion.objects.create(
+                iteracion=iteracion,
+                horas_real_eje=Decimal(horas),
+                fecha_inicio=date(2024, 3, 4),
+                fecha_fin=date(2024, 3, 5),
+                **fechas,
+            )
+
+    def setUp(self):
+        self.client.force_authenticate(user=self.test_user)
+
+    def test_export_csv_streams_hours(self):
+        """
+        Asegurar que la exportación CSV se transmite con una fila por proyecto y sus horas.
+        """
+        response = self.client.get(self.url)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertTrue(response.streaming)
+        contenido = b"".join(response.streaming_content).decode()
+        filas = {fila["nombre"]: fila for fila in csv.DictReader(io.StringIO(contenido))}
+        self.assertEqual(set(filas), {"Con horas", "Sin horas"})
+        self.assertEqual(Decimal(filas["Con horas"]["horas_est_total"]), Decimal("14"))
+        self.assertEqual(Decimal(filas["Con horas"]["horas_real_dcp"]), Decimal("5.5"))
+        self.assertEqual(Decimal(filas["Con horas"]["horas_real_eje"]), Decimal("9.25"))
+        self.assertEqual(Decimal(filas["Con horas"]["horas_real_total"]), Decimal("14.75"))
+        self.assertEqual(Decimal(filas["Sin horas"]["horas_real_total"]), Decimal("0"))
+
+    def test_export_ndjson(self):
+        """
+        Asegurar que la exportación NDJSON entrega un objeto JSON por línea.
+        """
+        response = self.client.get(self.url, {"formato": "ndjson"})
+        self.assertEqual(response["Content-Type"], "application/x-ndjson")
+        lineas = b"".join(response.streaming_content).decode().splitlines()
+        filas = [json.loads(linea) for linea in lineas]
+        self.assertEqual(len(filas), 2)
+        con_horas = next(fila for fila in filas if fila["nombre"] == "Con horas")
+        self.assertEqual(con_horas["linea"], "Linea")
+        self.assertEqual(Decimal(con_horas["horas_est_dcp"]), Decimal("4"))
+
+    def test_export_rejects_unknown_format(self):
+        """
+        Asegurar que un formato desconocido devuelve 400.
+        """
+        response = self.client.get(self.url, {"formato": "xml"})
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+
+class ProyectoBusquedaTests(APITestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.test_user = User.objects.create_user(
+            username="testuser", email="test@example.com", password="testpassword"
+        )
+        cls.url = reverse("proyecto-buscar")
+        cls.catalogos = {
+            "proceso": Proceso.objects.create(nombre="Proceso"),
+            "linea": Linea.objects.create(nombre="Linea"),
+            "tipo": Tipo.objects.create(nombre="Tipo"),
+            "cliente": Cliente.objects.create(nombre="Cliente"),
+        }
+        cls.portal = cls.crear("Portal de pagos", "Ana Martínez")
+        cls.pagos = cls.crear("Pagos", "Luis Gómez")
+        cls.inventario = cls.crear("Inventario", "Ana Pérez")
+
+    @classmethod
+    def crear(cls, nombre, desarrollador):
+        return Proyecto.objects.create(
+            **cls.catalogos,
+            nombre=nombre,
+            tarea_tw="https://example.com/tarea",
+            desarrollador=desarrollador,
+            creador=cls.test_user,
+        )
+
+    def setUp(self):
+        self.client.force_authenticate(user=self.test_user)
+
+    def buscar(self, texto, **params):
+        response = self.client.get(self.url, {"q": texto, **params})
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        return [resultado["nombre"] for resultado in response.data]
+
+    def test_ranked_results(self):
+        """
+        Asegurar que se devuelven las coincidencias ordenadas por relevancia, con los
+        campos del autocompletado.
+        """
+        response = self.client.get(self.url, {"q": "pagos"})
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual([r["nombre"] for r in response.data], ["Pagos", "Portal de pagos"])
+        self.assertEqual(
+            set(response.data[0]), {"id", "nombre", "desarrollador", "relevancia"}
+        )
+        self.assertGreater(response.data[0]["relevancia"], response.data[1]["relevancia"])
+
+    def test_substring_and_developer(self):
+        """
+        Asegurar que se encuentran subcadenas, sin distinguir mayúsculas, también en el
+        desarrollador.
+        """
+        self.assertEqual(self.buscar("TAL DE"), ["Portal de pagos"])
+        self.assertEqual(
+            sorted(self.buscar("ana")), ["Inventario", "Portal de pagos"]
+        )
+        self.assertEqual(self.buscar("pagos", limite=1), ["Pagos"])
+
+    def test_follows_changes(self):
+        """
+        Asegurar que la búsqueda refleja las ediciones y las eliminaciones.
+        """
+        self.inventario.nombre = "Almacén"
+        self.inventario.save()
+        self.assertEqual(self.buscar("inventario"), [])
+        self.assertEqual(self.buscar("almacén"), ["Almacén"])
+
+        self.pagos.delete()
+        self.assertEqual(self.buscar("pagos"), ["Portal de pagos"])
+
+    def test_import_is_searchable(self):
+        """
+        Asegurar que los proyectos creados con bulk_create en la importación se pueden
+        buscar.
+        """
+        fila = {
+            **{campo: str(objeto.pk) for campo, objeto in self.catalogos.items()},
+            "nombre": "Facturación electrónica",
+            "tarea_tw": "https://example.com/tarea",
+            "desarrollador": "Dev",
+        }
+        response = self.client.post(reverse("proyecto-importar"), [fila], format="json")
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        self.assertEqual(self.buscar("factura"), ["Facturación electrónica"])
+
+    def test_rebuild_command(self):
+        """
+        Asegurar que un guardado que no toca los campos buscados no actualiza la búsqueda,
+        y que reconstruir_busqueda la pone al día tras un QuerySet.update().
+        """
+        Proyecto.objects.filter(pk=self.inventario.pk).update(nombre="Almacén")
+        self.inventario.refresh_from_db()
+        self.inventario.save(update_fields=["tarea_tw"])
+        self.assertEqual(self.buscar("almacén"), [])
+
+        call_command("reconstruir_busqueda", stdout=io.StringIO())
+        self.assertEqual(self.buscar("almacén"), ["Almacén"])
+
+    def test_invalid_params(self):
+        """
+        Asegurar que una búsqueda de menos de 3 caracteres o un límite inválido devuelven
+        400.
+        """
+        for params in ({"q": "pa"}, {"q": " pa "}, {}, {"q": "pagos", "limite": "x"}):
+            response = self.client.get(self.url, params)
+            self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST, params)
+
+    def test_quotes_are_literal(self):
+        """
+        Asegurar que las comillas y los operadores no rompen la consulta.
+        """
+        self.assertEqual(self.buscar('"pagos" OR'), [])
+        self.assertEqual(self.buscar("pagos*"), [])
+
+    def test_search_uses_trigram_index(self):
+        """
+        Asegurar que en PostgreSQL la búsqueda usa los índices GIN de trigramas, tanto
+        para las subcadenas (ILIKE) como para la similitud.
+        """
+        if connection.vendor != "postgresql":
+            self.skipTest("Los índices de trigramas solo existen en PostgreSQL.")
+        tabla = Proyecto._meta.db_table
+        with CaptureQueriesContext(connection) as contexto:
+            self.buscar("pagos")
+        sql = next(
+            q["sql"] for q in contexto.captured_queries if f'FROM "{tabla}"' in q["sql"]
+        )
+        self.assertIn("ILIKE", sql)
+        with connection.cursor() as cursor:
+            cursor.execute("SET LOCAL enable_seqscan = off")
+            cursor.execute(f"EXPLAIN {sql}")
+            plan = "\n".join(str(fila) for fila in cursor.fetchall())
+        self.assertNotIn(f"Seq Scan on {tabla}", plan)
+        self.assertIn(f"Bitmap Index Scan on {tabla}_nombre_trgm", plan)
+        self.assertIn(f"Bitmap Index Scan on {tabla}_desarrollador_trgm", plan)
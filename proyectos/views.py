@@ -1,16 +1,115 @@
-from rest_framework import viewsets
+import uuid
+from datetime import datetime, time, timedelta
+
+from django.conf import settings
+from django.db import IntegrityError, transaction
+from django.http import StreamingHttpResponse
+from django.utils import timezone
+from django.utils.dateparse import parse_date, parse_datetime
+from rest_framework import status, viewsets
+from rest_framework.decorators import action
+from rest_framework.exceptions import ValidationError
+from rest_framework.response import Response
+from .busqueda import INDICE_PROYECTOS
+from .exportacion import FORMATOS_EXPORTACION
 from .models import Proyecto
-from .serializers import ProyectoSerializer
+from .parsers import CSVParser
+from .serializers import (
+    NOMBRE_DUPLICADO_MESSAGE,
+    ProyectoImportSerializer,
+    ProyectoLecturaSerializer,
+    ProyectoSerializer,
+    buscar_nombres_duplicados,
+    cargar_catalogos,
+    es_nombre_duplicado,
+)
 from rest_framework.permissions import IsAuthenticated
+from project_planner.busqueda import buscar_desde_parametros
+from project_planner.lectura import ListadoLigeroMixin
+from project_planner.parsers import JSONRapidoParser
+from project_planner.pagination import FechaCreacionCursorPagination, OrdenCursorFilter
+from trazabilidad.consultas import crear_resumenes_vacios
+from usuarios_app.autenticacion import ClaimsJWTAuthentication
+
+
+def filtro_fecha_creacion(parametro, valor):
+    """
+    Devuelve el filtro sobre fecha_creacion para el parámetro ``desde`` o ``hasta``.
+
+    Acepta una fecha (AAAA-MM-DD), que abarca el día completo, o una fecha y hora ISO 8601.
+    Compara la columna directamente (sin __date) para poder usar los índices.
+    """
+    # parse_datetime también acepta una fecha sola, por eso se prueba primero parse_date.
+    try:
+        fecha = parse_date(valor)
+        fecha_hora = None if fecha else parse_datetime(valor)
+    except ValueError:
+        fecha_hora = fecha = None
+    if fecha_hora is None and fecha is None:
+        raise ValidationError({parametro: "Fecha inválida, use AAAA-MM-DD o ISO 8601."})
+
+    if fecha_hora is None:
+        if parametro == "hasta":
+            # Hasta el inicio del día siguiente, sin incluirlo.
+            fecha += timedelta(days=1)
+        fecha_hora = datetime.combine(fecha, time.min)
+        lookup = "gte" if parametro == "desde" else "lt"
+    else:
+        lookup = "gte" if parametro == "desde" else "lte"
+    if timezone.is_naive(fecha_hora):
+        fecha_hora = timezone.make_aware(fecha_hora)
+    return {f"fecha_creacion__{lookup}": fecha_hora}
+
+
+class ProyectoFiltrosMixin:
+    """
+    Filtra el listado de proyectos con parámetros de consulta.
 
+    Parámetros:
+    - linea, proceso, cliente, tipo, creador: UUID del registro relacionado.
+    - desarrollador: Nombre exacto del desarrollador.
+    - desde / hasta: Rango sobre fecha_creacion (inclusivo); fecha AAAA-MM-DD o fecha y
+      hora ISO 8601.
 
-class ProyectoViewSet(viewsets.ModelViewSet):
+    Cada filtro tiene un índice compuesto ``(campo, fecha_creacion, id)`` en Proyecto, por
+    lo que una página filtrada y ordenada por fecha es un recorrido de rango del índice.
+    """
+
+    filtros_uuid = ("linea", "proceso", "cliente", "tipo", "creador")
+
+    def get_queryset(self):
+        queryset = super().get_queryset()
+        params = self.request.query_params
+
+        for campo in self.filtros_uuid:
+            valor = params.get(campo)
+            if not valor:
+                continue
+            try:
+                queryset = queryset.filter(**{f"{campo}_id": uuid.UUID(valor)})
+            except ValueError:
+                raise ValidationError({campo: "ID inválido."})
+
+        desarrollador = params.get("desarrollador")
+        if desarrollador:
+            queryset = queryset.filter(desarrollador=desarrollador)
+
+        for parametro in ("desde", "hasta"):
+            valor = params.get(parametro)
+            if valor:
+                queryset = queryset.filter(**filtro_fecha_creacion(parametro, valor))
+
+        return queryset
+
+
+class ProyectoViewSet(ProyectoFiltrosMixin, ListadoLigeroMixin, viewsets.ModelViewSet):
     """
     Un ViewSet para ver y editar los proyectos.
 
     Este ViewSet utiliza autenticación y requiere que el usuario esté autenticado para acceder a cualquier
     funcionalidad relacionada con los proyectos. Proporciona acciones estándar para listar, crear, actualizar,
-    y eliminar proyectos.
+    y eliminar proyectos, además de la importación (acción importar) y exportación (acción exportar) masivas
+    y la búsqueda por nombre o desarrollador (acción buscar).
 
     Todos los proyectos creados a través de esta vista automáticamente asignan al usuario autenticado como el creador
     del proyecto.
@@ -19,14 +118,29 @@ class ProyectoViewSet(viewsets.ModelViewSet):
     - ModelViewSet: Proporciona la implementación por defecto para las operaciones CRUD.
 
     Atributos:
+    - authentication_classes: JWT con los datos del usuario en el token, sin consultar el usuario
+      en las lecturas. Por eso el creador se asigna con request.user.pk.
     - permission_classes: Lista de clases de permisos aplicadas a la vista.
-    - queryset: El queryset que se utiliza para recuperar los objetos Proyecto.
+    - queryset: El queryset que se utiliza para recuperar los objetos Proyecto. Incluye con
+      select_related los catálogos que el serializador muestra por nombre, evitando una
+      consulta adicional por cada proyecto listado.
     - serializer_class: El serializador que se utiliza para la entrada y salida de datos.
+    - lectura_class: Serialización del listado, que lee solo las columnas necesarias con
+      values(); ``?fields=id,nombre`` limita los campos (ver ListadoLigeroMixin).
+    - pagination_class: Paginación por cursor ordenada por fecha de creación.
+    - filter_backends / ordering_fields: ``?ordering=`` acepta fecha_creacion y desarrollador
+      (con ``-`` para orden descendente); los filtros están en ProyectoFiltrosMixin.
     """
 
+    authentication_classes = [ClaimsJWTAuthentication]
     permission_classes = [IsAuthenticated]
-    queryset = Proyecto.objects.all()
+    queryset = Proyecto.objects.select_related("proceso", "linea", "tipo", "cliente")
     serializer_class = ProyectoSerializer
+    lectura_class = ProyectoLecturaSerializer
+    pagination_class = FechaCreacionCursorPagination
+    filter_backends = [OrdenCursorFilter]
+    ordering_fields = ["fecha_creacion", "desarrollador"]
+    ordering = FechaCreacionCursorPagination.ordering
 
     def perform_create(self, serializer):
         """
@@ -35,4 +149,147 @@ class ProyectoViewSet(viewsets.ModelViewSet):
         Parámetros:
         - serializer: El serializador que contiene los datos validados del proyecto.
         """
-        serializer.save(creador=self.request.user)
+        serializer.save(creador_id=self.request.user.pk)
+
+    @action(
+        detail=False,
+        methods=["post"],
+        parser_classes=[JSONRapidoParser, CSVParser],
+        serializer_class=ProyectoImportSerializer,
+    )
+    def importar(self, request):
+        """
+        Crea muchos proyectos en una sola solicitud.
+
+        Acepta un arreglo JSON o un CSV (text/csv) con los mismos campos que la creación
+        individual y hasta PROYECTOS_IMPORT_MAX_FILAS filas. Los catálogos se resuelven con una consulta por catálogo, todas las filas
+        se validan en memoria y, si ninguna tiene errores, se insertan con bulk_create en lotes
+        de ``?batch_size=`` (por defecto PROYECTOS_IMPORT_BATCH_SIZE) dentro de una transacción.
+
+        Retorna:
+        - 201 con el número de proyectos creados.
+        - 400 con la lista de errores por fila (numeradas desde 1); no se crea ningún proyecto.
+          Si otra solicitud crea un nombre repetido entre la validación y la inserción, las
+          filas afectadas se reportan igual, con el error de nombre duplicado.
+        """
+        filas = request.data
+        if not isinstance(filas, list):
+            return Response(
+                {"error": "Se esperaba una lista de proyectos."},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+        if len(filas) > settings.PROYECTOS_IMPORT_MAX_FILAS:
+            return Response(
+                {
+                    "error": "Se admiten como máximo {} proyectos por importación.".format(
+                        settings.PROYECTOS_IMPORT_MAX_FILAS
+                    )
+                },
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+        try:
+            batch_size = int(
+                request.query_params.get(
+                    "batch_size", settings.PROYECTOS_IMPORT_BATCH_SIZE
+                )
+            )
+        except ValueError:
+            batch_size = settings.PROYECTOS_IMPORT_BATCH_SIZE
+        batch_size = max(batch_size, 1)
+
+        contexto = {
+            **self.get_serializer_context(),
+            "catalogos": cargar_catalogos(filas),
+        }
+        errores = {}
+        validas = []
+        for indice, fila in enumerate(filas):
+            serializer = self.get_serializer(data=fila, context=contexto)
+            if serializer.is_valid():
+                validas.append((indice, serializer.validated_data))
+            else:
+                errores[indice] = serializer.errors
+
+        nombres = [datos["nombre"] for _, datos in validas]
+        for posicion in buscar_nombres_duplicados(nombres):
+            errores[validas[posicion][0]] = {"nombre": [NOMBRE_DUPLICADO_MESSAGE]}
+
+        if errores:
+            return self.respuesta_errores_importacion(errores)
+
+        proyectos = [Proyecto(creador_id=request.user.pk, **datos) for _, datos in validas]
+        try:
+            with transaction.atomic():
+                Proyecto.objects.bulk_create(proyectos, batch_size=batch_size)
+                # bulk_create no envía post_save: se actualizan la búsqueda y el resumen
+                # de horas explícitamente.
+                INDICE_PROYECTOS.actualizar(proyectos)
+                crear_resumenes_vacios(proyectos)
+        except IntegrityError as error:
+            if not es_nombre_duplicado(error):
+                raise
+            # Un nombre se creó entre la validación y la inserción: se vuelven a buscar
+            # los duplicados, ya fuera de la transacción revertida, para ubicar las filas.
+            errores = {
+                validas[posicion][0]: {"nombre": [NOMBRE_DUPLICADO_MESSAGE]}
+                for posicion in buscar_nombres_duplicados(nombres)
+            }
+            if not errores:
+                return Response(
+                    {"error": NOMBRE_DUPLICADO_MESSAGE},
+                    status=status.HTTP_400_BAD_REQUEST,
+                )
+            return self.respuesta_errores_importacion(errores)
+
+        return Response({"creados": len(proyectos)}, status=status.HTTP_201_CREATED)
+
+    def respuesta_errores_importacion(self, errores):
+        """
+        Respuesta 400 de importar con los errores por fila, numeradas desde 1.
+        """
+        return Response(
+            {
+                "errores": [
+                    {"fila": indice + 1, "errores": errores[indice]}
+                    for indice in sorted(errores)
+                ]
+            },
+            status=status.HTTP_400_BAD_REQUEST,
+        )
+
+    @action(detail=False, methods=["get"])
+    def buscar(self, request):
+        """
+        Búsqueda para autocompletar: ``?q=`` (al menos 3 caracteres) sobre el nombre y el
+        desarrollador, con ``?limite=`` resultados (por defecto 20, máximo 100).
+
+        Retorna la lista de coincidencias (id, nombre, desarrollador y relevancia), de la
+        más a la menos relevante, sin paginar.
+        """
+        resultados = buscar_desde_parametros(
+            INDICE_PROYECTOS, request.query_params, ("id", "nombre", "desarrollador")
+        )
+        return Response(resultados)
+
+    @action(detail=False, methods=["get"])
+    def exportar(self, request):
+        """
+        Exporta todos los proyectos con sus horas estimadas y reales de trazabilidad.
+
+        La respuesta se transmite a medida que se leen los proyectos, en lotes de
+        PROYECTOS_EXPORT_CHUNK_SIZE filas, por lo que la memoria es constante y los primeros
+        bytes se envían de inmediato. El formato se elige con ``?formato=csv`` (por defecto)
+        o ``?formato=ndjson``.
+        """
+        formato = request.query_params.get("formato", "csv")
+        if formato not in FORMATOS_EXPORTACION:
+            return Response(
+                {"error": "Formato no soportado. Use csv o ndjson."},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+        generador, content_type, extension = FORMATOS_EXPORTACION[formato]
+        response = StreamingHttpResponse(
+            generador(settings.PROYECTOS_EXPORT_CHUNK_SIZE), content_type=content_type
+        )
+        response["Content-Disposition"] = f'attachment; filename="proyectos.{extension}"'
+        return response
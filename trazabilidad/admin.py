@@ -6,12 +6,15 @@ from .models import Planeacion, Estimacion, DisenoCP, Ejecucion
 class PlaneacionAdmin(admin.ModelAdmin):
     list_display = ("proyecto", "tipo_actividad", "fecha")
     list_filter = ("tipo_actividad",)
+    list_select_related = ("proyecto",)
     search_fields = ("proyecto__nombre",)
 
 
-admin.site.register(Estimacion)
-admin.site.register(DisenoCP)
-admin.site.register(Ejecucion)
+# El __str__ de estos modelos usa proyecto.nombre; list_select_related evita una
+# consulta por fila en el listado del admin.
+@admin.register(Estimacion, DisenoCP, Ejecucion)
+class TrazabilidadAdmin(admin.ModelAdmin):
+    list_select_related = ("proyecto",)
 
 
-# jesus alexander andrade.
\ No newline at end of file
+# jesus alexander andrade.
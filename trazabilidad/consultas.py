@@ -0,0 +1,219 @@
+from decimal import Decimal
+
+from django.db.models import Count, DecimalField, F, OuterRef, Q, Subquery, Sum, Value
+from django.db.models.functions import Coalesce
+
+from proyectos.models import Proyecto
+from .models import (
+    CAMPOS_RESUMEN_HORAS,
+    Estimacion,
+    DisenoCP,
+    Ejecucion,
+    ResumenHorasProyecto,
+)
+
+HORAS_OUTPUT_FIELD = DecimalField(max_digits=12, decimal_places=2)
+
+
+def suma_horas_por_proyecto(modelo, campo):
+    """
+    Subconsulta correlacionada con la suma de ``campo`` de ``modelo`` para cada proyecto.
+
+    Se usa una subconsulta por modelo, y no JOINs, para que las filas de un modelo no
+    multipliquen las sumas del otro. Devuelve 0 si el proyecto no tiene registros.
+    """
+    total = (
+        modelo.objects.filter(proyecto=OuterRef("pk"))
+        .order_by()
+        .values("proyecto")
+        .annotate(total=Sum(campo))
+        .values("total")
+    )
+    return Coalesce(
+        Subquery(total, output_field=HORAS_OUTPUT_FIELD),
+        Value(Decimal("0")),
+        output_field=HORAS_OUTPUT_FIELD,
+    )
+
+
+def anotar_horas(queryset):
+    """
+    Anota un queryset de Proyecto con las horas estimadas y reales registradas en trazabilidad.
+
+    Anotaciones:
+    - horas_est_dcp, horas_est_eje: Suma de Estimacion.
+    - horas_real_dcp: Suma de DisenoCP.
+    - horas_real_eje: Suma de Ejecucion en todas las iteraciones.
+    - horas_est_total, horas_real_total: Totales estimado y real.
+    """
+    return queryset.annotate(
+        horas_est_dcp=suma_horas_por_proyecto(Estimacion, "horas_est_dcp"),
+        horas_est_eje=suma_horas_por_proyecto(Estimacion, "horas_est_eje"),
+        horas_real_dcp=suma_horas_por_proyecto(DisenoCP, "horas_real_dcp"),
+        horas_real_eje=suma_horas_por_proyecto(Ejecucion, "horas_real_eje"),
+    ).annotate(
+        horas_est_total=F("horas_est_dcp") + F("horas_est_eje"),
+        horas_real_total=F("horas_real_dcp") + F("horas_real_eje"),
+    )
+
+
+# FK de catálogo de Proyecto que se copian a ResumenHorasProyecto.
+CAMPOS_CATALOGO = ["proceso_id", "linea_id", "tipo_id", "cliente_id"]
+
+
+def actualizar_resumen_horas(proyecto_id):
+    """
+    Recalcula la fila de ResumenHorasProyecto de un proyecto.
+
+    Si el proyecto ya no existe (por ejemplo, se eliminó en cascada) no se crea ninguna fila.
+    """
+    totales = (
+        anotar_horas(Proyecto.objects.filter(pk=proyecto_id))
+        .values(*CAMPOS_RESUMEN_HORAS, *CAMPOS_CATALOGO)
+        .first()
+    )
+    if totales is None:
+        return
+    ResumenHorasProyecto.objects.update_or_create(
+        proyecto_id=proyecto_id, defaults=totales
+    )
+
+
+def crear_resumenes_vacios(proyectos):
+    """
+    Crea en cero la fila de ResumenHorasProyecto de proyectos recién creados, que aún no
+    tienen registros de trazabilidad, para que el detalle del resumen no responda 404.
+    Ignora los proyectos que ya tienen resumen.
+    """
+    ResumenHorasProyecto.objects.bulk_create(
+        [
+            ResumenHorasProyecto(
+                proyecto_id=proyecto.pk,
+                **{campo: getattr(proyecto, campo) for campo in CAMPOS_CATALOGO},
+            )
+            for proyecto in proyectos
+        ],
+        ignore_conflicts=True,
+    )
+
+
+def actualizar_catalogos_resumen(proyecto):
+    """
+    Copia las FK de catálogo de un proyecto a su fila de ResumenHorasProyecto.
+
+    Las actualizaciones masivas de Proyecto (queryset.update) no envían post_save: después
+    de una hay que ejecutar ``manage.py reconstruir_resumen_horas``.
+    """
+    ResumenHorasProyecto.objects.filter(proyecto_id=proyecto.pk).update(
+        **{campo: getattr(proyecto, campo) for campo in CAMPOS_CATALOGO}
+    )
+
+
+def reconstruir_resumen_horas(batch_size=1000):
+    """
+    Elimina y vuelve a calcular ResumenHorasProyecto para todos los proyectos.
+
+    Retorna:
+    - El número de filas creadas.
+    """
+    ResumenHorasProyecto.objects.all().delete()
+    queryset = anotar_horas(Proyecto.objects.order_by()).values(
+        "pk", *CAMPOS_RESUMEN_HORAS, *CAMPOS_CATALOGO
+    )
+    lote = []
+    creadas = 0
+    for fila in queryset.iterator(chunk_size=batch_size):
+        proyecto_id = fila.pop("pk")
+        lote.append(ResumenHorasProyecto(proyecto_id=proyecto_id, **fila))
+        if len(lote) >= batch_size:
+            ResumenHorasProyecto.objects.bulk_create(lote)
+            creadas += len(lote)
+            lote = []
+    ResumenHorasProyecto.objects.bulk_create(lote)
+    return creadas + len(lote)
+
+
+# Agrupaciones del dashboard de portafolio: clave de respuesta -> campo FK de catálogo.
+DIMENSIONES_PORTAFOLIO = {
+    "lineas": "linea",
+    "procesos": "proceso",
+    "clientes": "cliente",
+    "tipos": "tipo",
+}
+
+
+def agrupacion_portafolio(clave):
+    """
+    Queryset que agrega ResumenHorasProyecto por una dimensión del portafolio.
+
+    Solo lee columnas del índice de la dimensión (ver ResumenHorasProyecto.Meta.indexes),
+    que se recorre en orden sin leer la tabla: por eso se cuenta con COUNT(*) y con una
+    columna de horas, no con la clave primaria. El nombre del catálogo se anota al final,
+    después de las expresiones sobre los agregados: así es una subconsulta por grupo y
+    Django no la agrega al GROUP BY.
+    """
+    dimension = DIMENSIONES_PORTAFOLIO[clave]
+    catalogo = ResumenHorasProyecto._meta.get_field(dimension).related_model
+    return (
+        ResumenHorasProyecto.objects.order_by()
+        .values(dimension=Value(clave), catalogo_id=F(dimension))
+        .annotate(
+            proyectos=Count("*"),
+            proyectos_con_horas_reales=Count(
+                "horas_real_dcp", filter=Q(horas_real_dcp__gt=0) | Q(horas_real_eje__gt=0)
+            ),
+            horas_estimadas=Sum("horas_est_dcp") + Sum("horas_est_eje"),
+            horas_reales=Sum("horas_real_dcp") + Sum("horas_real_eje"),
+        )
+        .annotate(desviacion=F("horas_reales") - F("horas_estimadas"))
+        .annotate(
+            catalogo_nombre=Subquery(
+                catalogo.objects.filter(pk=OuterRef(dimension)).values("nombre")
+            )
+        )
+    )
+
+
+def consulta_portafolio(claves):
+    """
+    Queryset con las agrupaciones del portafolio pedidas, unidas con UNION ALL en una sola
+    consulta.
+
+    Parámetros:
+    - claves: Claves de DIMENSIONES_PORTAFOLIO (lineas, procesos, clientes o tipos).
+
+    Retorna:
+    - Queryset de diccionarios con dimension, catalogo_id, catalogo_nombre, proyectos,
+      proyectos_con_horas_reales, horas_estimadas, horas_reales y desviacion (reales -
+      estimadas), ordenado por dimensión y nombre.
+    """
+    primera, *resto = [agrupacion_portafolio(clave) for clave in claves]
+    if resto:
+        primera = primera.union(*resto, all=True)
+    return primera.order_by("dimension", "catalogo_nombre")
+
+
+def agrupar_por_dimension(claves, filas):
+    """
+    Reparte las filas de consulta_portafolio en un diccionario clave -> filas.
+    """
+    grupos = {clave: [] for clave in claves}
+    for fila in filas:
+        grupos[fila["dimension"]].append(fila)
+    return grupos
+
+
+def resumen_portafolio(claves):
+    """
+    Filas agregadas del portafolio por dimensión (ver consulta_portafolio).
+    """
+    return agrupar_por_dimension(claves, consulta_portafolio(claves))
+
+
+async def aresumen_portafolio(claves):
+    """
+    Versión async de resumen_portafolio.
+    """
+    return agrupar_por_dimension(
+        claves, [fila async for fila in consulta_portafolio(claves)]
+    )
@@ -0,0 +1,23 @@
+from django.core.management.base import BaseCommand
+from django.db import transaction
+
+from trazabilidad.consultas import reconstruir_resumen_horas
+
+
+class Command(BaseCommand):
+    help = "Reconstruye desde cero la tabla de resumen de horas por proyecto."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=1000,
+            help="Filas por lote de lectura e inserción.",
+        )
+
+    def handle(self, *args, **options):
+        with transaction.atomic():
+            creadas = reconstruir_resumen_horas(batch_size=options["batch_size"])
+        self.stdout.write(
+            self.style.SUCCESS(f"Resumen de horas reconstruido para {creadas} proyectos.")
+        )
@@ -0,0 +1,26 @@
+# Generated by Django 5.0.3 on 2026-10-18 18:29
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('proyectos', '0003_proyecto_nombre_upper_uniq'),
+        ('trazabilidad', '0003_disenocp_ejecucion_estimacion'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ResumenHorasProyecto',
+            fields=[
+                ('proyecto', models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, primary_key=True, related_name='resumen_horas', serialize=False, to='proyectos.proyecto')),
+                ('horas_est_dcp', models.DecimalField(decimal_places=2, default=0, max_digits=12)),
+                ('horas_est_eje', models.DecimalField(decimal_places=2, default=0, max_digits=12)),
+                ('horas_real_dcp', models.DecimalField(decimal_places=2, default=0, max_digits=12)),
+                ('horas_real_eje', models.DecimalField(decimal_places=2, default=0, max_digits=12)),
+                ('actualizado', models.DateTimeField(auto_now=True)),
+            ],
+        ),
+    ]
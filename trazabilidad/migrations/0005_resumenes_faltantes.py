@@ -0,0 +1,61 @@
+from decimal import Decimal
+
+from django.db import migrations
+from django.db.models import Sum
+
+CAMPOS = {
+    "Estimacion": ("horas_est_dcp", "horas_est_eje"),
+    "DisenoCP": ("horas_real_dcp",),
+    "Ejecucion": ("horas_real_eje",),
+}
+
+
+def crear_resumenes_faltantes(apps, schema_editor):
+    """
+    Crea el resumen de horas de los proyectos que aún no lo tienen, con sus totales.
+    """
+    alias = schema_editor.connection.alias
+    Proyecto = apps.get_model("proyectos", "Proyecto")
+    ResumenHorasProyecto = apps.get_model("trazabilidad", "ResumenHorasProyecto")
+
+    faltantes = list(
+        Proyecto.objects.using(alias)
+        .filter(resumen_horas__isnull=True)
+        .values_list("pk", flat=True)
+    )
+    totales = {proyecto_id: {} for proyecto_id in faltantes}
+    for nombre, campos in CAMPOS.items():
+        modelo = apps.get_model("trazabilidad", nombre)
+        sumas = (
+            modelo.objects.using(alias)
+            .filter(proyecto_id__in=faltantes)
+            .order_by()
+            .values("proyecto_id")
+            .annotate(**{campo: Sum(campo) for campo in campos})
+        )
+        for fila in sumas:
+            totales[fila.pop("proyecto_id")].update(fila)
+
+    ResumenHorasProyecto.objects.using(alias).bulk_create(
+        [
+            ResumenHorasProyecto(
+                proyecto_id=proyecto_id,
+                **{campo: valor or Decimal("0") for campo, valor in valores.items()},
+            )
+            for proyecto_id, valores in totales.items()
+        ],
+        batch_size=1000,
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('trazabilidad', '0004_resumenhorasproyecto'),
+    ]
+
+    # El resumen de un proyecto se crea con el proyecto; los proyectos anteriores que no
+    # tienen registros de trazabilidad (o no se reconstruyeron) no tenían fila.
+    operations = [
+        migrations.RunPython(crear_resumenes_faltantes, migrations.RunPython.noop),
+    ]
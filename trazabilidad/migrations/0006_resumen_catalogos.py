@@ -0,0 +1,57 @@
+import django.db.models.deletion
+from django.db import migrations, models
+from django.db.models import OuterRef, Subquery
+
+CATALOGOS = ("proceso", "linea", "tipo", "cliente")
+
+
+def copiar_catalogos(apps, schema_editor):
+    """
+    Copia las FK de catálogo de cada proyecto a su fila de resumen.
+    """
+    alias = schema_editor.connection.alias
+    Proyecto = apps.get_model("proyectos", "Proyecto")
+    ResumenHorasProyecto = apps.get_model("trazabilidad", "ResumenHorasProyecto")
+    proyecto = Proyecto.objects.using(alias).filter(pk=OuterRef("proyecto_id"))
+    ResumenHorasProyecto.objects.using(alias).update(
+        **{
+            f"{campo}_id": Subquery(proyecto.values(f"{campo}_id")[:1])
+            for campo in CATALOGOS
+        }
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('configuracion', '0003_cliente_cliente_activo_nombre_idx_and_more'),
+        ('proyectos', '0005_busqueda'),
+        ('trazabilidad', '0005_resumenes_faltantes'),
+    ]
+
+    # Los campos se agregan nulos y se copian desde Proyecto; 0007 los vuelve obligatorios
+    # en otra transacción (PostgreSQL no altera una tabla con restricciones diferidas
+    # pendientes de la actualización).
+    operations = [
+        migrations.AddField(
+            model_name='resumenhorasproyecto',
+            name='proceso',
+            field=models.ForeignKey(db_index=False, null=True, on_delete=django.db.models.deletion.CASCADE, related_name='+', to='configuracion.proceso'),
+        ),
+        migrations.AddField(
+            model_name='resumenhorasproyecto',
+            name='linea',
+            field=models.ForeignKey(db_index=False, null=True, on_delete=django.db.models.deletion.CASCADE, related_name='+', to='configuracion.linea'),
+        ),
+        migrations.AddField(
+            model_name='resumenhorasproyecto',
+            name='tipo',
+            field=models.ForeignKey(db_index=False, null=True, on_delete=django.db.models.deletion.CASCADE, related_name='+', to='configuracion.tipo'),
+        ),
+        migrations.AddField(
+            model_name='resumenhorasproyecto',
+            name='cliente',
+            field=models.ForeignKey(db_index=False, null=True, on_delete=django.db.models.deletion.CASCADE, related_name='+', to='configuracion.cliente'),
+        ),
+        migrations.RunPython(copiar_catalogos, migrations.RunPython.noop),
+    ]
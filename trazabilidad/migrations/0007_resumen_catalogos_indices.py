@@ -0,0 +1,45 @@
+import django.db.models.deletion
+from django.db import migrations, models
+
+HORAS = ["horas_est_dcp", "horas_est_eje", "horas_real_dcp", "horas_real_eje"]
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('trazabilidad', '0006_resumen_catalogos'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='resumenhorasproyecto',
+            name='proceso',
+            field=models.ForeignKey(db_index=False, on_delete=django.db.models.deletion.CASCADE, related_name='+', to='configuracion.proceso'),
+        ),
+        migrations.AlterField(
+            model_name='resumenhorasproyecto',
+            name='linea',
+            field=models.ForeignKey(db_index=False, on_delete=django.db.models.deletion.CASCADE, related_name='+', to='configuracion.linea'),
+        ),
+        migrations.AlterField(
+            model_name='resumenhorasproyecto',
+            name='tipo',
+            field=models.ForeignKey(db_index=False, on_delete=django.db.models.deletion.CASCADE, related_name='+', to='configuracion.tipo'),
+        ),
+        migrations.AddIndex(
+            model_name='resumenhorasproyecto',
+            index=models.Index(fields=['proceso', *HORAS], name='resumen_proceso_horas_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='resumenhorasproyecto',
+            index=models.Index(fields=['linea', *HORAS], name='resumen_linea_horas_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='resumenhorasproyecto',
+            index=models.Index(fields=['tipo', *HORAS], name='resumen_tipo_horas_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='resumenhorasproyecto',
+            index=models.Index(fields=['cliente', *HORAS], name='resumen_cliente_horas_idx'),
+        ),
+    ]
@@ -1,4 +1,5 @@
 from django.db import models
+from configuracion.models import Cliente, Linea, Proceso, Tipo
 from proyectos.models import Proyecto
 from django.conf import settings
 
@@ -75,3 +76,77 @@ class Ejecucion(models.Model):
 
     def __str__(self):
         return f"Ejecución para {self.proyecto.nombre} - {self.get_iteracion_display()}"
+
+
+## Resúmenes
+
+CAMPOS_RESUMEN_HORAS = ["horas_est_dcp", "horas_est_eje", "horas_real_dcp", "horas_real_eje"]
+
+
+class ResumenHorasProyecto(models.Model):
+    """
+    Totales de horas estimadas y reales por proyecto, precalculados.
+
+    Se mantiene al día con las señales de Estimacion, DisenoCP y Ejecucion (ver
+    trazabilidad.signals) y se reconstruye con ``manage.py reconstruir_resumen_horas``.
+    Leer los totales de un proyecto es una búsqueda por clave primaria en lugar de
+    agregar las tres tablas.
+
+    Guarda además una copia de las FK de catálogo del proyecto, sincronizada por la señal
+    post_save de Proyecto, para que el dashboard de portafolio agrupe esta tabla sola con
+    los índices de Meta.indexes, sin JOIN a Proyecto.
+    """
+
+    proyecto = models.OneToOneField(
+        Proyecto,
+        on_delete=models.CASCADE,
+        primary_key=True,
+        related_name="resumen_horas",
+    )
+    horas_est_dcp = models.DecimalField(max_digits=12, decimal_places=2, default=0)
+    horas_est_eje = models.DecimalField(max_digits=12, decimal_places=2, default=0)
+    horas_real_dcp = models.DecimalField(max_digits=12, decimal_places=2, default=0)
+    horas_real_eje = models.DecimalField(max_digits=12, decimal_places=2, default=0)
+    actualizado = models.DateTimeField(auto_now=True)
+    # Las FK no tienen índice propio: las cubren los índices de Meta.indexes.
+    proceso = models.ForeignKey(
+        Proceso, on_delete=models.CASCADE, related_name="+", db_index=False
+    )
+    linea = models.ForeignKey(
+        Linea, on_delete=models.CASCADE, related_name="+", db_index=False
+    )
+    tipo = models.ForeignKey(
+        Tipo, on_delete=models.CASCADE, related_name="+", db_index=False
+    )
+    cliente = models.ForeignKey(
+        Cliente, on_delete=models.CASCADE, null=True, related_name="+", db_index=False
+    )
+
+    class Meta:
+        # Un índice por dimensión del portafolio con las horas incluidas: cada agrupación
+        # se resuelve recorriendo el índice en orden, sin leer la tabla ni ordenar.
+        indexes = [
+            models.Index(
+                fields=["proceso", *CAMPOS_RESUMEN_HORAS], name="resumen_proceso_horas_idx"
+            ),
+            models.Index(
+                fields=["linea", *CAMPOS_RESUMEN_HORAS], name="resumen_linea_horas_idx"
+            ),
+            models.Index(
+                fields=["tipo", *CAMPOS_RESUMEN_HORAS], name="resumen_tipo_horas_idx"
+            ),
+            models.Index(
+                fields=["cliente", *CAMPOS_RESUMEN_HORAS], name="resumen_cliente_horas_idx"
+            ),
+        ]
+
+    @property
+    def horas_est_total(self):
+        return self.horas_est_dcp + self.horas_est_eje
+
+    @property
+    def horas_real_total(self):
+        return self.horas_real_dcp + self.horas_real_eje
+
+    def __str__(self):
+        return f"Resumen de horas para {self.proyecto_id}"
@@ -0,0 +1,132 @@
+from rest_framework import serializers
+from .models import Planeacion, Estimacion, DisenoCP, Ejecucion, ResumenHorasProyecto
+
+
+class PlaneacionSerializer(serializers.ModelSerializer):
+    proyecto_nombre = serializers.ReadOnlyField(source="proyecto.nombre")
+
+    class Meta:
+        model = Planeacion
+        fields = ["id", "proyecto", "proyecto_nombre", "tipo_actividad", "fecha"]
+
+
+class EstimacionSerializer(serializers.ModelSerializer):
+    proyecto_nombre = serializers.ReadOnlyField(source="proyecto.nombre")
+    registrado_por_username = serializers.ReadOnlyField(source="registrado_por.username")
+
+    class Meta:
+        model = Estimacion
+        fields = [
+            "id",
+            "proyecto",
+            "proyecto_nombre",
+            "fecha_registro_real",
+            "horas_est_dcp",
+            "horas_est_eje",
+            "fecha_entrega_hu",
+            "registrado_por",
+            "registrado_por_username",
+        ]
+        read_only_fields = ["registrado_por"]
+
+
+class DisenoCPSerializer(serializers.ModelSerializer):
+    proyecto_nombre = serializers.ReadOnlyField(source="proyecto.nombre")
+    registrado_por_username = serializers.ReadOnlyField(source="registrado_por.username")
+
+    class Meta:
+        model = DisenoCP
+        fields = [
+            "id",
+            "proyecto",
+            "proyecto_nombre",
+            "fecha_registro_real",
+            "horas_real_dcp",
+            "fecha_inicio",
+            "fecha_fin",
+            "registrado_por",
+            "registrado_por_username",
+        ]
+        read_only_fields = ["registrado_por"]
+
+
+class EjecucionSerializer(serializers.ModelSerializer):
+    proyecto_nombre = serializers.ReadOnlyField(source="proyecto.nombre")
+    registrado_por_username = serializers.ReadOnlyField(source="registrado_por.username")
+
+    class Meta:
+        model = Ejecucion
+        fields = [
+            "id",
+            "proyecto",
+            "proyecto_nombre",
+            "fecha_registro_real",
+            "iteracion",
+            "horas_real_eje",
+            "fecha_inicio",
+            "fecha_fin",
+            "registrado_por",
+            "registrado_por_username",
+        ]
+        read_only_fields = ["registrado_por"]
+
+
+class ResumenHorasProyectoSerializer(serializers.ModelSerializer):
+    horas_est_total = serializers.DecimalField(
+        max_digits=13, decimal_places=2, read_only=True
+    )
+    horas_real_total = serializers.DecimalField(
+        max_digits=13, decimal_places=2, read_only=True
+    )
+
+    class Meta:
+        model = ResumenHorasProyecto
+        fields = [
+            "proyecto",
+            "horas_est_dcp",
+            "horas_est_eje",
+            "horas_est_total",
+            "horas_real_dcp",
+            "horas_real_eje",
+            "horas_real_total",
+            "actualizado",
+        ]
+
+
+class PortafolioGrupoSerializer(serializers.Serializer):
+    """
+    Fila agregada del dashboard de portafolio (ver trazabilidad.consultas.resumen_portafolio).
+    """
+
+    id = serializers.UUIDField(source="catalogo_id", allow_null=True)
+    nombre = serializers.CharField(source="catalogo_nombre", allow_null=True)
+    proyectos = serializers.IntegerField()
+    proyectos_con_horas_reales = serializers.IntegerField()
+    horas_estimadas = serializers.DecimalField(max_digits=14, decimal_places=2)
+    horas_reales = serializers.DecimalField(max_digits=14, decimal_places=2)
+    desviacion = serializers.DecimalField(max_digits=14, decimal_places=2)
+    desviacion_pct = serializers.SerializerMethodField()
+
+    def get_desviacion_pct(self, grupo):
+        """
+        Desviación como porcentaje de las horas estimadas, o None si no hay estimación.
+        """
+        if not grupo["horas_estimadas"]:
+            return None
+        return round(float(grupo["desviacion"] / grupo["horas_estimadas"] * 100), 2)
+
+
+class TrazabilidadProyectoSerializer(serializers.Serializer):
+    """
+    Serializador de solo lectura con la trazabilidad completa de un proyecto.
+
+    Espera un Proyecto con los registros de trazabilidad ya precargados (ver
+    TrazabilidadProyectoAPIView).
+    """
+
+    id = serializers.UUIDField()
+    nombre = serializers.CharField()
+    planeaciones = PlaneacionSerializer(many=True)
+    estimaciones = EstimacionSerializer(many=True, source="estimacion_set")
+    disenos_cp = DisenoCPSerializer(many=True, source="disenocp_set")
+    ejecuciones = EjecucionSerializer(many=True, source="ejecucion_set")
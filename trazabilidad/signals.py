@@ -0,0 +1,82 @@
+from functools import partial
+
+from django.db import transaction
+from django.db.models.signals import post_delete, post_save, pre_save
+
+from proyectos.models import Proyecto
+from .consultas import (
+    actualizar_catalogos_resumen,
+    actualizar_resumen_horas,
+    crear_resumenes_vacios,
+)
+from .models import Estimacion, DisenoCP, Ejecucion
+
+
+def programar_actualizacion(proyecto_id):
+    """
+    Recalcula el resumen del proyecto cuando la transacción actual se confirme.
+
+    Esperar al commit evita recrear el resumen de un proyecto que se está eliminando en
+    cascada y no hace trabajo si la transacción se revierte.
+    """
+    transaction.on_commit(partial(actualizar_resumen_horas, proyecto_id))
+
+
+def recordar_proyecto_anterior(sender, instance, raw=False, **kwargs):
+    """
+    Guarda el proyecto original de un registro existente para actualizar también su
+    resumen si el registro se mueve a otro proyecto.
+    """
+    if raw or instance.pk is None:
+        return
+    instance._proyecto_anterior_id = (
+        sender.objects.filter(pk=instance.pk).values_list("proyecto_id", flat=True).first()
+    )
+
+
+def registro_guardado(sender, instance, raw=False, **kwargs):
+    if raw:
+        return
+    programar_actualizacion(instance.proyecto_id)
+    anterior = getattr(instance, "_proyecto_anterior_id", None)
+    if anterior is not None and anterior != instance.proyecto_id:
+        programar_actualizacion(anterior)
+
+
+def registro_eliminado(sender, instance, **kwargs):
+    programar_actualizacion(instance.proyecto_id)
+
+
+def proyecto_guardado(sender, instance, created, raw=False, **kwargs):
+    """
+    Crea el resumen en cero de un proyecto nuevo o copia a su resumen los catálogos de un
+    proyecto editado, en la misma transacción que el proyecto.
+    """
+    if raw:
+        return
+    if created:
+        crear_resumenes_vacios([instance])
+    else:
+        actualizar_catalogos_resumen(instance)
+
+
+post_save.connect(
+    proyecto_guardado, sender=Proyecto, dispatch_uid="resumen_horas_proyecto_creado"
+)
+
+for modelo in (Estimacion, DisenoCP, Ejecucion):
+    pre_save.connect(
+        recordar_proyecto_anterior,
+        sender=modelo,
+        dispatch_uid=f"resumen_horas_pre_save_{modelo.__name__}",
+    )
+    post_save.connect(
+        registro_guardado,
+        sender=modelo,
+        dispatch_uid=f"resumen_horas_save_{modelo.__name__}",
+    )
+    post_delete.connect(
+        registro_eliminado,
+        sender=modelo,
+        dispatch_uid=f"resumen_horas_delete_{modelo.__name__}",
+    )
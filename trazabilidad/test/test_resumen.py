@@ -0,0 +1,292 @@
+from datetime import date
+from decimal import Decimal
+from io import StringIO
+from django.core.management import call_command
+from django.db import connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.test import APITestCase
+from rest_framework_simplejwt.tokens import RefreshToken
+from django.contrib.auth import get_user_model
+from configuracion.models import Linea
+from usuarios_app.autenticacion import agregar_claims_usuario
+from trazabilidad.consultas import DIMENSIONES_PORTAFOLIO, agrupacion_portafolio
+from trazabilidad.models import Estimacion, DisenoCP, ResumenHorasProyecto
+from .test_views import crear_ejecucion, crear_proyecto
+
+
+User = get_user_model()
+FECHA = date(2024, 1, 10)
+
+
+class ResumenHorasSignalsTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.test_user = User.objects.create_user(
+            username="testuser", email="test@example.com", password="testpassword"
+        )
+        cls.proyecto = crear_proyecto("Proyecto A", cls.test_user)
+        cls.otro = crear_proyecto("Proyecto B", cls.test_user)
+
+    def resumen(self, proyecto):
+        return ResumenHorasProyecto.objects.get(proyecto=proyecto)
+
+    def test_records_update_rollup(self):
+        """
+        Asegurar que crear registros de trazabilidad actualiza el resumen del proyecto.
+        """
+        with self.captureOnCommitCallbacks(execute=True):
+            Estimacion.objects.create(
+                proyecto=self.proyecto,
+                fecha_registro_real=FECHA,
+                horas_est_dcp=Decimal("4.00"),
+                horas_est_eje=Decimal("10.00"),
+                fecha_entrega_hu=FECHA,
+                registrado_por=self.test_user,
+            )
+            DisenoCP.objects.create(
+                proyecto=self.proyecto,
+                fecha_registro_real=FECHA,
+                horas_real_dcp=Decimal("5.00"),
+                fecha_inicio=FECHA,
+                fecha_fin=FECHA,
+                registrado_por=self.test_user,
+            )
+            crear_ejecucion(self.proyecto, self.test_user, FECHA, "2.50")
+            crear_ejecucion(self.proyecto, self.test_user, FECHA, "1.50")
+
+        resumen = self.resumen(self.proyecto)
+        self.assertEqual(resumen.horas_est_total, Decimal("14"))
+        self.assertEqual(resumen.horas_real_dcp, Decimal("5"))
+        self.assertEqual(resumen.horas_real_eje, Decimal("4"))
+
+    def test_update_and_delete_refresh_rollup(self):
+        """
+        Asegurar que modificar, mover o eliminar un registro recalcula los resúmenes afectados.
+        """
+        with self.captureOnCommitCallbacks(execute=True):
+            ejecucion = crear_ejecucion(self.proyecto, self.test_user, FECHA, "2.00")
+        with self.captureOnCommitCallbacks(execute=True):
+            ejecucion.horas_real_eje = Decimal("3.00")
+            ejecucion.save()
+        self.assertEqual(self.resumen(self.proyecto).horas_real_eje, Decimal("3"))
+
+        with self.captureOnCommitCallbacks(execute=True):
+            ejecucion.proyecto = self.otro
+            ejecucion.save()
+        self.assertEqual(self.resumen(self.proyecto).horas_real_eje, Decimal("0"))
+        self.assertEqual(self.resumen(self.otro).horas_real_eje, Decimal("3"))
+
+        with self.captureOnCommitCallbacks(execute=True):
+            ejecucion.delete()
+        self.assertEqual(self.resumen(self.otro).horas_real_eje, Decimal("0"))
+
+    def test_project_catalog_change_updates_rollup(self):
+        """
+        Asegurar que cambiar los catálogos de un proyecto los copia a su resumen.
+        """
+        linea = Linea.objects.create(nombre="Otra línea")
+        self.proyecto.linea = linea
+        self.proyecto.save()
+        self.assertEqual(self.resumen(self.proyecto).linea_id, linea.pk)
+        self.assertEqual(self.resumen(self.proyecto).proceso_id, self.proyecto.proceso_id)
+
+    def test_cascade_delete_does_not_recreate_rollup(self):
+        """
+        Asegurar que eliminar un proyecto en cascada no deja resúmenes huérfanos.
+        """
+        with self.captureOnCommitCallbacks(execute=True):
+            crear_ejecucion(self.proyecto, self.test_user, FECHA)
+        with self.captureOnCommitCallbacks(execute=True):
+            Linea.objects.filter(proyecto=self.proyecto).delete()
+        self.assertFalse(
+            ResumenHorasProyecto.objects.filter(proyecto_id=self.proyecto.pk).exists()
+        )
+
+    def test_rebuild_command(self):
+        """
+        Asegurar que el comando reconstruye el resumen de todos los proyectos.
+        """
+        crear_ejecucion(self.proyecto, self.test_user, FECHA, "2.00")
+        ResumenHorasProyecto.objects.all().delete()
+
+        salida = StringIO()
+        call_command("reconstruir_resumen_horas", "--batch-size", "1", stdout=salida)
+
+        self.assertIn("2 proyectos", salida.getvalue())
+        self.assertEqual(self.resumen(self.proyecto).horas_real_eje, Decimal("2"))
+        self.assertEqual(self.resumen(self.otro).horas_real_total, Decimal("0"))
+
+
+class ResumenHorasAPITests(APITestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.test_user = User.objects.create_user(
+            username="testuser", email="test@example.com", password="testpassword"
+        )
+        cls.proyecto = crear_proyecto("Proyecto A", cls.test_user)
+        cls.sin_registros = crear_proyecto("Proyecto sin registros", cls.test_user)
+        ResumenHorasProyecto.objects.filter(proyecto=cls.proyecto).update(
+            horas_est_dcp=Decimal("1.00"),
+            horas_est_eje=Decimal("2.00"),
+            horas_real_dcp=Decimal("3.00"),
+            horas_real_eje=Decimal("4.00"),
+        )
+
+    def test_detail_by_proyecto(self):
+        """
+        Asegurar que el resumen se consulta por el UUID del proyecto con sus totales.
+        """
+        self.client.force_authenticate(user=self.test_user)
+        url = reverse("resumenhorasproyecto-detail", args=[self.proyecto.pk])
+        response = self.client.get(url)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(Decimal(response.data["horas_est_total"]), Decimal("3"))
+        self.assertEqual(Decimal(response.data["horas_real_total"]), Decimal("7"))
+
+    def test_detail_without_records_returns_zero(self):
+        """
+        Asegurar que un proyecto sin registros de trazabilidad tiene su resumen en cero.
+        """
+        self.client.force_authenticate(user=self.test_user)
+        url = reverse("resumenhorasproyecto-detail", args=[self.sin_registros.pk])
+        response = self.client.get(url)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(Decimal(response.data["horas_est_total"]), Decimal("0"))
+        self.assertEqual(Decimal(response.data["horas_real_total"]), Decimal("0"))
+
+
+class PortafolioAPITests(APITestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.test_user = User.objects.create_user(
+            username="testuser", email="test@example.com", password="testpassword"
+        )
+        cls.url = reverse("trazabilidad-portafolio")
+        cls.proyecto_a = crear_proyecto("Proyecto A", cls.test_user)
+        cls.proyecto_b = crear_proyecto("Proyecto B", cls.test_user)
+        # Ambos proyectos en la misma línea; el proyecto B no tiene horas registradas.
+        cls.proyecto_b.linea = cls.proyecto_a.linea
+        cls.proyecto_b.save()
+        ResumenHorasProyecto.objects.filter(proyecto=cls.proyecto_a).update(
+            horas_est_dcp=Decimal("4.00"),
+            horas_est_eje=Decimal("6.00"),
+            horas_real_dcp=Decimal("5.00"),
+            horas_real_eje=Decimal("7.00"),
+        )
+
+    def setUp(self):
+        self.client.force_authenticate(user=self.test_user)
+
+    def test_groups_by_linea(self):
+        """
+        Asegurar que el dashboard agrega proyectos y horas por línea, incluyendo proyectos sin horas.
+        """
+        response = self.client.get(self.url)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(
+            set(response.data), {"lineas", "procesos", "clientes", "tipos"}
+        )
+        linea = next(
+            grupo
+            for grupo in response.data["lineas"]
+            if grupo["id"] == str(self.proyecto_a.linea_id)
+        )
+        self.assertEqual(linea["proyectos"], 2)
+        self.assertEqual(linea["proyectos_con_horas_reales"], 1)
+        self.assertEqual(Decimal(linea["horas_estimadas"]), Decimal("10"))
+        self.assertEqual(Decimal(linea["horas_reales"]), Decimal("12"))
+        self.assertEqual(Decimal(linea["desviacion"]), Decimal("2"))
+        self.assertEqual(linea["desviacion_pct"], 20.0)
+
+    def test_desviacion_pct_without_estimate_is_null(self):
+        """
+        Asegurar que la desviación porcentual es nula cuando no hay horas estimadas.
+        """
+        response = self.client.get(self.url, {"dimension": "tipos"})
+        tipo_b = next(
+            grupo
+            for grupo in response.data["tipos"]
+            if grupo["id"] == str(self.proyecto_b.tipo_id)
+        )
+        self.assertIsNone(tipo_b["desviacion_pct"])
+
+    def test_single_dimension_is_one_query(self):
+        """
+        Asegurar que pedir una sola dimensión ejecuta una única consulta de agregación.
+        """
+        with CaptureQueriesContext(connection) as contexto:
+            response = self.client.get(self.url, {"dimension": "clientes"})
+        self.assertEqual(list(response.data), ["clientes"])
+        self.assertEqual(len(contexto.captured_queries), 1)
+        # Los proyectos sin cliente se agrupan con id nulo.
+        self.assertIsNone(response.data["clientes"][0]["id"])
+        self.assertEqual(response.data["clientes"][0]["proyectos"], 2)
+
+    def test_all_dimensions_are_one_query(self):
+        """
+        Asegurar que las cuatro dimensiones se agregan en una sola consulta.
+        """
+        with CaptureQueriesContext(connection) as contexto:
+            response = self.client.get(self.url)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(len(contexto.captured_queries), 1)
+        self.assertIn("UNION ALL", contexto.captured_queries[0]["sql"])
+        self.assertEqual(
+            [(grupo["id"], grupo["nombre"]) for grupo in response.data["lineas"]],
+            [(str(self.proyecto_a.linea_id), self.proyecto_a.linea.nombre)],
+        )
+
+    def test_groups_by_catalog_column_only(self):
+        """
+        Asegurar que cada agrupación solo agrupa por la FK del catálogo, que cubre su índice,
+        y no por la subconsulta del nombre.
+        """
+        for clave in DIMENSIONES_PORTAFOLIO:
+            with self.subTest(clave=clave):
+                sql = str(agrupacion_portafolio(clave).query)
+                self.assertNotIn(",", sql.split("GROUP BY")[1])
+
+    def test_unknown_dimension_returns_400(self):
+        """
+        Asegurar que una dimensión desconocida devuelve 400.
+        """
+        response = self.client.get(self.url, {"dimension": "usuarios"})
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+
+class PortafolioAsyncTests(APITestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.test_user = User.objects.create_user(
+            username="testuser", email="test@example.com", password="testpassword"
+        )
+        cls.url = reverse("trazabilidad-portafolio-async")
+        proyecto = crear_proyecto("Proyecto A", cls.test_user)
+        ResumenHorasProyecto.objects.filter(proyecto=proyecto).update(
+            horas_est_dcp=Decimal("4.00"), horas_real_eje=Decimal("5.00")
+        )
+
+    def setUp(self):
+        token = agregar_claims_usuario(
+            RefreshToken.for_user(self.test_user), self.test_user
+        ).access_token
+        self.client.credentials(HTTP_AUTHORIZATION=f"Bearer {token}")
+
+    def test_matches_sync_view(self):
+        """
+        Asegurar que la vista async devuelve los mismos datos que la vista síncrona.
+        """
+        asincrona = self.client.get(self.url)
+        sincrona = self.client.get(reverse("trazabilidad-portafolio"))
+        self.assertEqual(asincrona.status_code, status.HTTP_200_OK)
+        self.assertEqual(asincrona.json(), sincrona.json())
+
+    def test_unknown_dimension_returns_400(self):
+        """
+        Asegurar que una dimensión desconocida devuelve 400 también en la vista async.
+        """
+        response = self.client.get(self.url, {"dimension": "usuarios"})
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
@@ -0,0 +1,185 @@
+from datetime import date
+from decimal import Decimal
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.test import APITestCase
+from django.contrib.auth import get_user_model
+from configuracion.models import Proceso, Linea, Tipo
+from proyectos.models import Proyecto
+from trazabilidad.models import Planeacion, Estimacion, DisenoCP, Ejecucion
+
+
+User = get_user_model()
+
+
+def crear_proyecto(nombre, creador):
+    return Proyecto.objects.create(
+        proceso=Proceso.objects.create(nombre="Proceso"),
+        linea=Linea.objects.create(nombre="Linea"),
+        tipo=Tipo.objects.create(nombre="Tipo"),
+        nombre=nombre,
+        tarea_tw="https://example.com/tarea",
+        desarrollador="Dev",
+        creador=creador,
+    )
+
+
+def crear_ejecucion(proyecto, usuario, fecha, horas="1.00"):
+    return Ejecucion.objects.create(
+        proyecto=proyecto,
+        fecha_registro_real=fecha,
+        iteracion="iteracion_1",
+        horas_real_eje=Decimal(horas),
+        fecha_inicio=fecha,
+        fecha_fin=fecha,
+        registrado_por=usuario,
+    )
+
+
+class TrazabilidadViewSetTests(APITestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.test_user = User.objects.create_user(
+            username="testuser", email="test@example.com", password="testpassword"
+        )
+        cls.proyecto = crear_proyecto("Proyecto A", cls.test_user)
+        cls.otro = crear_proyecto("Proyecto B", cls.test_user)
+        cls.url = reverse("ejecucion-list")
+
+    def setUp(self):
+        self.client.force_authenticate(user=self.test_user)
+
+    def test_filter_by_proyecto_and_dates(self):
+        """
+        Asegurar que las ejecuciones se filtran por proyecto y rango de fechas.
+        """
+        crear_ejecucion(self.proyecto, self.test_user, date(2024, 1, 10))
+        crear_ejecucion(self.proyecto, self.test_user, date(2024, 2, 10))
+        crear_ejecucion(self.otro, self.test_user, date(2024, 2, 10))
+
+        response = self.client.get(
+            self.url,
+            {"proyecto": str(self.proyecto.id), "desde": "2024-02-01", "hasta": "2024-02-28"},
+        )
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(len(response.data), 1)
+        self.assertEqual(response.data[0]["proyecto_nombre"], "Proyecto A")
+        self.assertEqual(response.data[0]["registrado_por_username"], "testuser")
+
+    def test_invalid_filters_return_400(self):
+        """
+        Asegurar que un proyecto o una fecha inválidos devuelven 400.
+        """
+        self.assertEqual(
+            self.client.get(self.url, {"proyecto": "abc"}).status_code,
+            status.HTTP_400_BAD_REQUEST,
+        )
+        self.assertEqual(
+            self.client.get(self.url, {"desde": "2024-13-01"}).status_code,
+            status.HTTP_400_BAD_REQUEST,
+        )
+
+    def test_list_query_count_is_constant(self):
+        """
+        Asegurar que listar ejecuciones no ejecuta una consulta por registro.
+        """
+        crear_ejecucion(self.proyecto, self.test_user, date(2024, 1, 10))
+        with CaptureQueriesContext(connection) as pocas:
+            self.client.get(self.url)
+        for dia in range(1, 11):
+            crear_ejecucion(self.otro, self.test_user, date(2024, 3, dia))
+        with CaptureQueriesContext(connection) as muchas:
+            self.client.get(self.url)
+        self.assertEqual(len(pocas.captured_queries), len(muchas.captured_queries))
+
+    def test_create_sets_registrado_por(self):
+        """
+        Asegurar que al crear una estimación se registra el usuario autenticado.
+        """
+        response = self.client.post(
+            reverse("estimacion-list"),
+            {
+                "proyecto": str(self.proyecto.id),
+                "fecha_registro_real": "2024-03-01",
+                "horas_est_dcp": "4.00",
+                "horas_est_eje": "8.00",
+                "fecha_entrega_hu": "2024-03-15",
+            },
+            format="json",
+        )
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        self.assertEqual(Estimacion.objects.get().registrado_por, self.test_user)
+
+
+class TrazabilidadProyectoAPITests(APITestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.test_user = User.objects.create_user(
+            username="testuser", email="test@example.com", password="testpassword"
+        )
+        cls.proyecto = crear_proyecto("Proyecto A", cls.test_user)
+        cls.url = reverse("trazabilidad-proyecto", args=[cls.proyecto.id])
+
+    def setUp(self):
+        self.client.force_authenticate(user=self.test_user)
+
+    def crear_registros(self, cantidad):
+        for dia in range(1, cantidad + 1):
+            fecha = date(2024, 1, dia)
+            Estimacion.objects.create(
+                proyecto=self.proyecto,
+                fecha_registro_real=fecha,
+                horas_est_dcp=Decimal("1.00"),
+                horas_est_eje=Decimal("1.00"),
+                fecha_entrega_hu=fecha,
+                registrado_por=self.test_user,
+            )
+            DisenoCP.objects.create(
+                proyecto=self.proyecto,
+                fecha_registro_real=fecha,
+                horas_real_dcp=Decimal("1.00"),
+                fecha_inicio=fecha,
+                fecha_fin=fecha,
+                registrado_por=self.test_user,
+            )
+            crear_ejecucion(self.proyecto, self.test_user, fecha)
+
+    def test_full_traceability(self):
+        """
+        Asegurar que el endpoint anidado devuelve todos los registros del proyecto.
+        """
+        Planeacion.objects.create(
+            proyecto=self.proyecto, tipo_actividad="estimacion", fecha=date(2024, 1, 1)
+        )
+        self.crear_registros(2)
+        response = self.client.get(self.url)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data["nombre"], "Proyecto A")
+        self.assertEqual(len(response.data["planeaciones"]), 1)
+        self.assertEqual(len(response.data["estimaciones"]), 2)
+        self.assertEqual(len(response.data["disenos_cp"]), 2)
+        self.assertEqual(len(response.data["ejecuciones"]), 2)
+
+    def test_full_traceability_query_count_is_fixed(self):
+        """
+        Asegurar que la trazabilidad completa usa el mismo número de consultas sin importar
+        cuántos registros tenga el proyecto.
+        """
+        self.crear_registros(1)
+        with CaptureQueriesContext(connection) as pocas:
+            self.client.get(self.url)
+        self.crear_registros(8)
+        with CaptureQueriesContext(connection) as muchas:
+            self.client.get(self.url)
+        self.assertEqual(len(pocas.captured_queries), len(muchas.captured_queries))
+
+    def test_unknown_project_returns_404(self):
+        """
+        Asegurar que un proyecto inexistente devuelve 404.
+        """
+        url = reverse(
+            "trazabilidad-proyecto", args=["00000000-0000-0000-0000-000000000000"]
+        )
+        self.assertEqual(self.client.get(url).status_code, status.HTTP_404_NOT_FOUND)
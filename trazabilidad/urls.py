@@ -0,0 +1,38 @@
+from django.urls import path, include
+from rest_framework.routers import DefaultRouter
+from .views import (
+    PlaneacionViewSet,
+    EstimacionViewSet,
+    DisenoCPViewSet,
+    EjecucionViewSet,
+    PortafolioAPIView,
+    ResumenHorasProyectoViewSet,
+    TrazabilidadProyectoAPIView,
+    portafolio_async,
+)
+
+router = DefaultRouter()
+router.register(r"trazabilidad/planeaciones", PlaneacionViewSet)
+router.register(r"trazabilidad/estimaciones", EstimacionViewSet)
+router.register(r"trazabilidad/disenos-cp", DisenoCPViewSet)
+router.register(r"trazabilidad/ejecuciones", EjecucionViewSet)
+router.register(r"trazabilidad/resumen-horas", ResumenHorasProyectoViewSet)
+
+urlpatterns = [
+    path(
+        "trazabilidad/portafolio/",
+        PortafolioAPIView.as_view(),
+        name="trazabilidad-portafolio",
+    ),
+    path(
+        "trazabilidad/portafolio/async/",
+        portafolio_async,
+        name="trazabilidad-portafolio-async",
+    ),
+    path(
+        "trazabilidad/proyectos/<uuid:pk>/",
+        TrazabilidadProyectoAPIView.as_view(),
+        name="trazabilidad-proyecto",
+    ),
+    path("", include(router.urls)),
+]
@@ -1,3 +1,213 @@
-from django.shortcuts import render
+import uuid
 
-# Create your views here.
+from django.db.models import Prefetch
+from django.http import JsonResponse
+from django.shortcuts import get_object_or_404
+from django.utils.dateparse import parse_date
+from django.views.decorators.http import require_GET
+from rest_framework import viewsets
+from rest_framework.exceptions import ValidationError
+from rest_framework.permissions import IsAuthenticated
+from rest_framework.response import Response
+from rest_framework.views import APIView
+from proyectos.models import Proyecto
+from usuarios_app.autenticacion import ClaimsJWTAuthentication, autenticacion_async
+from .consultas import DIMENSIONES_PORTAFOLIO, aresumen_portafolio, resumen_portafolio
+from .models import Planeacion, Estimacion, DisenoCP, Ejecucion, ResumenHorasProyecto
+from .serializers import (
+    PlaneacionSerializer,
+    EstimacionSerializer,
+    DisenoCPSerializer,
+    EjecucionSerializer,
+    PortafolioGrupoSerializer,
+    ResumenHorasProyectoSerializer,
+    TrazabilidadProyectoSerializer,
+)
+
+
+# Todas las vistas de trazabilidad autentican con ClaimsJWTAuthentication, que no consulta
+# el usuario en las lecturas; request.user puede no ser una instancia de Usuario.
+
+
+class TrazabilidadFiltrosMixin:
+    """
+    Filtra el queryset con los parámetros de consulta comunes de trazabilidad.
+
+    Parámetros:
+    - proyecto: UUID del proyecto.
+    - desde / hasta: Rango de fechas (AAAA-MM-DD, inclusivo) sobre ``campo_fecha``.
+    """
+
+    campo_fecha = "fecha_registro_real"
+
+    def get_queryset(self):
+        queryset = super().get_queryset()
+        params = self.request.query_params
+
+        proyecto = params.get("proyecto")
+        if proyecto:
+            try:
+                queryset = queryset.filter(proyecto=uuid.UUID(proyecto))
+            except ValueError:
+                raise ValidationError({"proyecto": "ID inválido."})
+
+        for parametro, lookup in (("desde", "gte"), ("hasta", "lte")):
+            valor = params.get(parametro)
+            if not valor:
+                continue
+            try:
+                fecha = parse_date(valor)
+            except ValueError:
+                fecha = None
+            if fecha is None:
+                raise ValidationError(
+                    {parametro: "Fecha inválida, use el formato AAAA-MM-DD."}
+                )
+            queryset = queryset.filter(**{f"{self.campo_fecha}__{lookup}": fecha})
+
+        return queryset
+
+
+class RegistradoPorMixin:
+    """
+    Asigna el usuario autenticado como ``registrado_por`` al crear un registro.
+    """
+
+    def perform_create(self, serializer):
+        serializer.save(registrado_por_id=self.request.user.pk)
+
+
+class PlaneacionViewSet(TrazabilidadFiltrosMixin, viewsets.ModelViewSet):
+    authentication_classes = [ClaimsJWTAuthentication]
+    permission_classes = [IsAuthenticated]
+    queryset = Planeacion.objects.select_related("proyecto")
+    serializer_class = PlaneacionSerializer
+    campo_fecha = "fecha"
+
+
+class EstimacionViewSet(
+    TrazabilidadFiltrosMixin, RegistradoPorMixin, viewsets.ModelViewSet
+):
+    authentication_classes = [ClaimsJWTAuthentication]
+    permission_classes = [IsAuthenticated]
+    queryset = Estimacion.objects.select_related("proyecto", "registrado_por")
+    serializer_class = EstimacionSerializer
+
+
+class DisenoCPViewSet(TrazabilidadFiltrosMixin, RegistradoPorMixin, viewsets.ModelViewSet):
+    authentication_classes = [ClaimsJWTAuthentication]
+    permission_classes = [IsAuthenticated]
+    queryset = DisenoCP.objects.select_related("proyecto", "registrado_por")
+    serializer_class = DisenoCPSerializer
+
+
+class EjecucionViewSet(
+    TrazabilidadFiltrosMixin, RegistradoPorMixin, viewsets.ModelViewSet
+):
+    authentication_classes = [ClaimsJWTAuthentication]
+    permission_classes = [IsAuthenticated]
+    queryset = Ejecucion.objects.select_related("proyecto", "registrado_por")
+    serializer_class = EjecucionSerializer
+
+
+class ResumenHorasProyectoViewSet(viewsets.ReadOnlyModelViewSet):
+    """
+    Totales de horas por proyecto leídos de la tabla precalculada ResumenHorasProyecto.
+
+    El detalle se consulta por el UUID del proyecto y es una búsqueda por clave primaria.
+    """
+
+    authentication_classes = [ClaimsJWTAuthentication]
+    permission_classes = [IsAuthenticated]
+    queryset = ResumenHorasProyecto.objects.all()
+    serializer_class = ResumenHorasProyectoSerializer
+
+
+class TrazabilidadProyectoAPIView(APIView):
+    """
+    Devuelve la trazabilidad completa de un proyecto: planeaciones, estimaciones, diseños
+    CP y ejecuciones.
+
+    Se resuelve siempre en cinco consultas (el proyecto y una por cada modelo de
+    trazabilidad), sin importar cuántos registros tenga el proyecto.
+    """
+
+    authentication_classes = [ClaimsJWTAuthentication]
+    permission_classes = [IsAuthenticated]
+
+    def get(self, request, pk, *args, **kwargs):
+        queryset = Proyecto.objects.only("id", "nombre").prefetch_related(
+            Prefetch("planeaciones", queryset=Planeacion.objects.order_by("fecha")),
+            *(
+                Prefetch(
+                    relacion,
+                    queryset=modelo.objects.select_related("registrado_por").order_by(
+                        "fecha_registro_real", "id"
+                    ),
+                )
+                for relacion, modelo in (
+                    ("estimacion_set", Estimacion),
+                    ("disenocp_set", DisenoCP),
+                    ("ejecucion_set", Ejecucion),
+                )
+            ),
+        )
+        proyecto = get_object_or_404(queryset, pk=pk)
+        return Response(TrazabilidadProyectoSerializer(proyecto).data)
+
+
+class PortafolioAPIView(APIView):
+    """
+    Dashboard de portafolio: por cada Linea, Proceso, Cliente y Tipo devuelve el número de
+    proyectos, las horas estimadas y reales y su desviación.
+
+    Todas las agrupaciones salen de una sola consulta (UNION ALL) sobre ResumenHorasProyecto,
+    que guarda los catálogos del proyecto; no se cargan proyectos en Python. Con
+    ``?dimension=`` se puede pedir una sola agrupación (lineas, procesos, clientes o tipos).
+    """
+
+    authentication_classes = [ClaimsJWTAuthentication]
+    permission_classes = [IsAuthenticated]
+
+    def get(self, request, *args, **kwargs):
+        grupos = resumen_portafolio(dimensiones_solicitadas(request))
+        return Response(
+            {
+                clave: PortafolioGrupoSerializer(filas, many=True).data
+                for clave, filas in grupos.items()
+            }
+        )
+
+
+def dimensiones_solicitadas(request):
+    """
+    Devuelve las claves de DIMENSIONES_PORTAFOLIO pedidas con ``?dimension=`` (todas por defecto).
+    """
+    dimension = request.GET.get("dimension")
+    if dimension is not None and dimension not in DIMENSIONES_PORTAFOLIO:
+        raise ValidationError(
+            {"dimension": f"Use una de: {', '.join(DIMENSIONES_PORTAFOLIO)}."}
+        )
+    return [dimension] if dimension else list(DIMENSIONES_PORTAFOLIO)
+
+
+@require_GET
+@autenticacion_async
+async def portafolio_async(request):
+    """
+    Versión async de PortafolioAPIView para servir bajo ASGI (uvicorn).
+
+    La consulta única del portafolio se espera con el ORM async; la vista no bloquea el
+    event loop mientras tanto.
+    """
+    try:
+        claves = dimensiones_solicitadas(request)
+    except ValidationError as exc:
+        return JsonResponse(exc.detail, status=exc.status_code)
+    grupos = await aresumen_portafolio(claves)
+    return JsonResponse(
+        {
+            clave: PortafolioGrupoSerializer(filas, many=True).data
+            for clave, filas in grupos.items()
+        }
+    )
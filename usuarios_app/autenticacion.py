@@ -0,0 +1,235 @@
+import functools
+import logging
+import time
+import uuid
+
+from asgiref.sync import sync_to_async
+from django.conf import settings
+from django.core.cache import cache
+from django.http import JsonResponse
+from django.utils.functional import cached_property
+from rest_framework.exceptions import AuthenticationFailed
+from rest_framework.permissions import SAFE_METHODS
+from rest_framework_simplejwt.authentication import JWTAuthentication
+from rest_framework_simplejwt.models import TokenUser
+from rest_framework_simplejwt.settings import api_settings
+
+logger = logging.getLogger(__name__)
+
+# Claims del usuario que LoginView agrega a los tokens (ver agregar_claims_usuario).
+CLAIMS_USUARIO = ("username", "rol", "is_staff")
+
+USUARIO_AUTH_CACHE_KEY = "usuarios_app:auth:{}"
+
+
+def usuario_auth_cache_key(user_id):
+    """
+    Clave de caché de los datos de un usuario autenticado con un token sin claims.
+    """
+    return USUARIO_AUTH_CACHE_KEY.format(user_id)
+
+
+def invalidar_usuario_auth(user_id):
+    """
+    Elimina de la caché los datos del usuario usados por ClaimsJWTAuthentication.
+    """
+    cache.delete(usuario_auth_cache_key(user_id))
+
+
+def agregar_claims_usuario(token, user):
+    """
+    Agrega al token los datos del usuario necesarios para autenticar sin consultar la base
+    de datos. Los tokens de acceso derivados de un refresh heredan estos claims.
+    """
+    token["username"] = user.username
+    token["rol"] = user.rol
+    token["is_staff"] = user.is_staff
+    return token
+
+
+def registrar_autenticacion(request, autenticador, duracion, resultado):
+    """
+    Guarda en la solicitud de Django qué autenticador se ejecutó, cuánto tardó (segundos) y
+    su resultado (``usuario``, ``anonimo`` o ``fallido``). AutenticacionTimingMiddleware lo
+    publica en la cabecera Server-Timing.
+    """
+    request = getattr(request, "_request", request)
+    request.autenticacion = {
+        "autenticador": autenticador,
+        "duracion": duracion,
+        "resultado": resultado,
+    }
+    logger.debug(
+        "Autenticación %s: %s en %.3f ms", autenticador, resultado, duracion * 1000
+    )
+
+
+class AutenticacionMedidaMixin:
+    """
+    Mide la ejecución de authenticate() en una clase de autenticación de DRF y la registra
+    con registrar_autenticacion.
+    """
+
+    def authenticate(self, request):
+        inicio = time.perf_counter()
+        resultado = "fallido"
+        try:
+            autenticado = super().authenticate(request)
+            resultado = "anonimo" if autenticado is None else "usuario"
+            return autenticado
+        finally:
+            registrar_autenticacion(
+                request, type(self).__name__, time.perf_counter() - inicio, resultado
+            )
+
+
+class MedidaJWTAuthentication(AutenticacionMedidaMixin, JWTAuthentication):
+    """
+    JWTAuthentication estándar (consulta el Usuario en cada solicitud) con medición.
+    """
+
+
+class UsuarioToken(TokenUser):
+    """
+    Usuario ligero construido a partir de los claims de un token JWT.
+
+    Expone uuid, pk, username, rol e is_staff sin instanciar el modelo Usuario. Los datos
+    son los del momento del login y no reflejan cambios hasta que se emita un token nuevo.
+    """
+
+    @cached_property
+    def uuid(self):
+        return uuid.UUID(str(self.token[api_settings.USER_ID_CLAIM]))
+
+    @cached_property
+    def pk(self):
+        return self.uuid
+
+    @cached_property
+    def rol(self):
+        return self.token.get("rol", "")
+
+
+class ClaimsJWTAuthentication(AutenticacionMedidaMixin, JWTAuthentication):
+    """
+    Autenticación JWT que no consulta el usuario en las solicitudes de lectura.
+
+    En GET, HEAD y OPTIONS, si el token trae los claims agregados en el login devuelve un
+    UsuarioToken. Para tokens emitidos sin esos claims busca el Usuario en la base de datos
+    y guarda en la caché, durante USUARIO_AUTH_CACHE_TTL segundos, solo sus datos públicos
+    (username, rol, is_staff, is_active); la entrada se elimina al guardar o borrar el
+    usuario (ver usuarios_app.signals).
+
+    En los métodos que modifican datos se consulta siempre el Usuario, como en
+    JWTAuthentication, para que un usuario eliminado o desactivado no pueda seguir
+    escribiendo con un token vigente.
+
+    request.user puede no ser una instancia del modelo, por lo que las vistas deben usar
+    request.user.pk para asignar relaciones.
+    """
+
+    # DRF crea una instancia de cada autenticador por solicitud; authenticate() guarda aquí
+    # si el método de la solicitud es de solo lectura.
+    metodo_seguro = True
+
+    def authenticate(self, request):
+        self.metodo_seguro = request.method in SAFE_METHODS
+        return super().authenticate(request)
+
+    def usuario_desde_claims(self, validated_token):
+        """
+        Devuelve un UsuarioToken si el token trae todos los claims del usuario, o None.
+        """
+        claims = (api_settings.USER_ID_CLAIM, *CLAIMS_USUARIO)
+        if all(claim in validated_token for claim in claims):
+            return UsuarioToken(validated_token)
+        return None
+
+    def get_user(self, validated_token):
+        return self.obtener_usuario(validated_token, self.metodo_seguro)
+
+    def obtener_usuario(self, validated_token, metodo_seguro):
+        """
+        Devuelve el Usuario de la base de datos si ``metodo_seguro`` es False; si no, un
+        UsuarioToken construido desde los claims o desde los datos en caché.
+        """
+        if not metodo_seguro:
+            return super().get_user(validated_token)
+        usuario = self.usuario_desde_claims(validated_token)
+        if usuario is not None:
+            return usuario
+
+        cache_key = usuario_auth_cache_key(validated_token.get(api_settings.USER_ID_CLAIM))
+        datos = cache.get(cache_key)
+        if datos is None:
+            user = super().get_user(validated_token)
+            datos = {
+                "username": user.username,
+                "rol": user.rol,
+                "is_staff": user.is_staff,
+                "is_active": user.is_active,
+            }
+            cache.set(cache_key, datos, settings.USUARIO_AUTH_CACHE_TTL)
+        if not datos["is_active"]:
+            raise AuthenticationFailed("User is inactive", code="user_inactive")
+        return UsuarioToken({**validated_token.payload, **datos})
+
+    async def aauthenticate(self, request):
+        """
+        Versión de authenticate() para vistas async.
+
+        Los tokens con claims se resuelven en el mismo hilo del event loop; solo el
+        respaldo que consulta la caché o la base de datos se ejecuta con sync_to_async. No
+        usa metodo_seguro, porque autenticacion_async comparte la instancia entre
+        solicitudes.
+        """
+        inicio = time.perf_counter()
+        resultado = "fallido"
+        try:
+            header = self.get_header(request)
+            raw_token = None if header is None else self.get_raw_token(header)
+            if raw_token is None:
+                resultado = "anonimo"
+                return None
+            validated_token = self.get_validated_token(raw_token)
+            metodo_seguro = request.method in SAFE_METHODS
+            usuario = self.usuario_desde_claims(validated_token) if metodo_seguro else None
+            if usuario is None:
+                usuario = await sync_to_async(self.obtener_usuario)(
+                    validated_token, metodo_seguro
+                )
+            resultado = "usuario"
+            return usuario, validated_token
+        finally:
+            registrar_autenticacion(
+                request, type(self).__name__, time.perf_counter() - inicio, resultado
+            )
+
+
+def autenticacion_async(vista):
+    """
+    Decorador para vistas async de Django que exige un JWT válido.
+
+    Autentica con ClaimsJWTAuthentication.aauthenticate, asigna request.user y responde
+    401 con el mismo formato que DRF si no hay credenciales o no son válidas.
+    """
+    autenticador = ClaimsJWTAuthentication()
+
+    @functools.wraps(vista)
+    async def envoltura(request, *args, **kwargs):
+        try:
+            autenticado = await autenticador.aauthenticate(request)
+            if autenticado is None:
+                raise AuthenticationFailed(
+                    "Las credenciales de autenticación no se proveyeron."
+                )
+        except AuthenticationFailed as exc:
+            return JsonResponse(
+                {"detail": str(exc.detail) if isinstance(exc.detail, str) else exc.detail},
+                status=exc.status_code,
+                headers={"WWW-Authenticate": autenticador.authenticate_header(request)},
+            )
+        request.user = autenticado[0]
+        return await vista(request, *args, **kwargs)
+
+    return envoltura
@@ -0,0 +1,8 @@
+from project_planner.busqueda import IndiceBusqueda
+
+from .models import Usuario
+
+# Campos donde busca /api/usuarios/buscar/ (ver project_planner.busqueda).
+CAMPOS_BUSQUEDA = ("nombre", "apellido", "email")
+
+INDICE_USUARIOS = IndiceBusqueda(Usuario, CAMPOS_BUSQUEDA)
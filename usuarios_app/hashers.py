@@ -0,0 +1,71 @@
+"""
+Hashers de contraseña cuyos parámetros de costo se leen de los settings.
+
+PASSWORD_HASHER elige el algoritmo preferido (ver project_planner/settings/base.py).
+Como los parámetros se consultan en cada uso, cambiarlos no invalida las contraseñas
+existentes: Django vuelve a calcular el hash con los parámetros nuevos en el siguiente
+login exitoso (must_update), y lo mismo ocurre al cambiar de algoritmo.
+"""
+
+from django.conf import settings
+from django.contrib.auth.hashers import (
+    Argon2PasswordHasher,
+    PBKDF2PasswordHasher,
+    ScryptPasswordHasher,
+)
+
+
+def parametro(nombre, por_defecto):
+    """
+    Devuelve el setting ``nombre`` o ``por_defecto`` si no está definido o es None.
+    """
+    valor = getattr(settings, nombre, None)
+    return por_defecto if valor is None else valor
+
+
+class ConfigurablePBKDF2PasswordHasher(PBKDF2PasswordHasher):
+    """
+    PBKDF2-SHA256 con iteraciones tomadas de PBKDF2_ITERATIONS.
+    """
+
+    @property
+    def iterations(self):
+        return parametro("PBKDF2_ITERATIONS", PBKDF2PasswordHasher.iterations)
+
+
+class ConfigurableScryptPasswordHasher(ScryptPasswordHasher):
+    """
+    scrypt con SCRYPT_WORK_FACTOR, SCRYPT_BLOCK_SIZE y SCRYPT_PARALLELISM.
+    """
+
+    @property
+    def work_factor(self):
+        return parametro("SCRYPT_WORK_FACTOR", ScryptPasswordHasher.work_factor)
+
+    @property
+    def block_size(self):
+        return parametro("SCRYPT_BLOCK_SIZE", ScryptPasswordHasher.block_size)
+
+    @property
+    def parallelism(self):
+        return parametro("SCRYPT_PARALLELISM", ScryptPasswordHasher.parallelism)
+
+
+class ConfigurableArgon2PasswordHasher(Argon2PasswordHasher):
+    """
+    Argon2id con ARGON2_TIME_COST, ARGON2_MEMORY_COST (KiB) y ARGON2_PARALLELISM.
+
+    Requiere el paquete argon2-cffi.
+    """
+
+    @property
+    def time_cost(self):
+        return parametro("ARGON2_TIME_COST", Argon2PasswordHasher.time_cost)
+
+    @property
+    def memory_cost(self):
+        return parametro("ARGON2_MEMORY_COST", Argon2PasswordHasher.memory_cost)
+
+    @property
+    def parallelism(self):
+        return parametro("ARGON2_PARALLELISM", Argon2PasswordHasher.parallelism)
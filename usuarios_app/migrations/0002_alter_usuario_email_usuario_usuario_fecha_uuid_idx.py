@@ -0,0 +1,23 @@
+# Generated by Django 5.0.3 on 2026-10-18 18:22
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('auth', '0012_alter_user_first_name_max_length'),
+        ('usuarios_app', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='usuario',
+            name='email',
+            field=models.EmailField(max_length=254, unique=True, verbose_name='email address'),
+        ),
+        migrations.AddIndex(
+            model_name='usuario',
+            index=models.Index(fields=['fecha_creacion', 'uuid'], name='usuario_fecha_uuid_idx'),
+        ),
+    ]
@@ -3,15 +3,19 @@ from django.contrib.auth.models import (
     BaseUserManager,
     PermissionsMixin,
 )
+from django.contrib.auth.hashers import make_password
 from django.utils.translation import gettext_lazy as _
 from django.db import models
 import uuid
 
 
 class UsuarioManager(BaseUserManager):
-    def create_user(self, email, username, password=None, **extra_fields):
+    def create_user(self, email, username, password=None, hasher=None, **extra_fields):
         """
         Crea y devuelve un usuario con un email, nombre de usuario y contraseña.
+
+        ``hasher`` permite indicar el algoritmo del hash (p. ej. "md5" para datos de prueba
+        masivos); debe estar en PASSWORD_HASHERS. Por defecto se usa el preferido.
         """
         if not email:
             raise ValueError(_("El email es obligatorio"))
@@ -21,7 +25,10 @@ class UsuarioManager(BaseUserManager):
         email = self.normalize_email(email)
         username = self.model.normalize_username(username)
         user = self.model(email=email, username=username, **extra_fields)
-        user.set_password(password)  # Asegura que la contraseña se maneje correctamente
+        if hasher is None:
+            user.set_password(password)  # Asegura que la contraseña se maneje correctamente
+        else:
+            user.password = make_password(password, hasher=hasher)
         user.save(using=self._db)
         return user
 
@@ -76,6 +83,12 @@ class Usuario(AbstractBaseUser, PermissionsMixin):
     USERNAME_FIELD = "username"
     REQUIRED_FIELDS = ["email"]
 
+    class Meta:
+        indexes = [
+            # Respalda la paginación por cursor (fecha_creacion, pk).
+            models.Index(fields=["fecha_creacion", "uuid"], name="usuario_fecha_uuid_idx"),
+        ]
+
     def __str__(self):
         return self.email
 
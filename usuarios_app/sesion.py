@@ -2,20 +2,44 @@ from rest_framework_simplejwt.tokens import RefreshToken
 from rest_framework.response import Response
 from rest_framework.views import APIView
 from rest_framework import status
-from rest_framework.permissions import AllowAny
+from rest_framework.permissions import AllowAny, IsAdminUser
+from django.conf import settings
 from django.contrib.auth import authenticate
+from .autenticacion import MedidaJWTAuthentication, agregar_claims_usuario
+from .throttling import (
+    FallosLogin,
+    LoginIPThrottle,
+    contadores_rechazos,
+    registrar_rechazo,
+)
 
 
 class LoginView(APIView):
+    # El login no usa credenciales previas: sin autenticadores no se procesa ninguna cabecera.
+    authentication_classes = []
     permission_classes = [AllowAny]
+    throttle_classes = [LoginIPThrottle]
 
     def post(self, request):
         username = request.data.get("username")
         password = request.data.get("password")
+
+        # Los usuarios o IPs con demasiados fallos recientes se rechazan sin calcular el hash.
+        fallos = FallosLogin(request, username)
+        motivo = fallos.motivo_bloqueo()
+        if motivo:
+            registrar_rechazo(motivo)
+            return Response(
+                {"error": "Demasiados intentos fallidos. Intente más tarde."},
+                status=status.HTTP_429_TOO_MANY_REQUESTS,
+                headers={"Retry-After": str(settings.LOGIN_BLOQUEO_SEGUNDOS)},
+            )
+
         user = authenticate(username=username, password=password)
 
         if user:
-            refresh = RefreshToken.for_user(user)
+            fallos.reiniciar()
+            refresh = agregar_claims_usuario(RefreshToken.for_user(user), user)
             return Response(
                 {
                     "refresh": str(refresh),
@@ -23,7 +47,20 @@ class LoginView(APIView):
                 }
             )
         else:
+            fallos.registrar_fallo()
             return Response(
                 {"error": "Credenciales incorrectas"},
                 status=status.HTTP_400_BAD_REQUEST,
             )
+
+
+class LoginRechazosView(APIView):
+    """
+    Devuelve los contadores de intentos de login rechazados por motivo (solo staff).
+    """
+
+    authentication_classes = [MedidaJWTAuthentication]
+    permission_classes = [IsAdminUser]
+
+    def get(self, request):
+        return Response(contadores_rechazos())
@@ -0,0 +1,29 @@
+from functools import partial
+
+from django.db import transaction
+from django.db.models.signals import post_delete, post_save
+from rest_framework_simplejwt.settings import api_settings
+
+from .autenticacion import invalidar_usuario_auth
+from .busqueda import INDICE_USUARIOS
+from .models import Usuario
+
+
+def usuario_modificado(sender, instance, **kwargs):
+    """
+    Elimina los datos del usuario en caché de ClaimsJWTAuthentication cuando la
+    transacción se confirme, para que un usuario desactivado deje de autenticarse.
+    """
+    user_id = getattr(instance, api_settings.USER_ID_FIELD)
+    transaction.on_commit(partial(invalidar_usuario_auth, user_id))
+
+
+# La tabla de búsqueda FTS (solo SQLite) sigue cada alta, cambio y baja de usuarios.
+post_save.connect(
+    INDICE_USUARIOS.al_guardar, sender=Usuario, dispatch_uid="busqueda_usuario_save"
+)
+post_delete.connect(
+    INDICE_USUARIOS.al_eliminar, sender=Usuario, dispatch_uid="busqueda_usuario_delete"
+)
+post_save.connect(usuario_modificado, sender=Usuario, dispatch_uid="auth_usuario_save")
+post_delete.connect(usuario_modificado, sender=Usuario, dispatch_uid="auth_usuario_delete")
@@ -0,0 +1,207 @@
+from django.core.cache import cache
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.test import APITestCase
+from rest_framework_simplejwt.tokens import AccessToken, RefreshToken
+from django.contrib.auth import get_user_model
+from configuracion.models import Proceso, Linea, Tipo, Cliente
+from proyectos.models import Proyecto
+from usuarios_app.autenticacion import UsuarioToken, usuario_auth_cache_key
+
+
+User = get_user_model()
+
+
+def consultas_a_usuarios(contexto):
+    tabla = User._meta.db_table
+    return [q["sql"] for q in contexto.captured_queries if tabla in q["sql"]]
+
+
+class ClaimsJWTAuthenticationTests(APITestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.test_user = User.objects.create_user(
+            username="testuser",
+            email="test@example.com",
+            password="testpassword",
+            rol="Administrador",
+        )
+        cls.url = reverse("proyecto-list")
+
+    def setUp(self):
+        cache.clear()
+
+    def login(self):
+        response = self.client.post(
+            reverse("api-login"),
+            {"username": "testuser", "password": "testpassword"},
+            format="json",
+        )
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        return response.data["access"]
+
+    def test_login_embeds_user_claims(self):
+        """
+        Asegurar que el token de acceso emitido en el login incluye los claims del usuario.
+        """
+        token = AccessToken(self.login())
+        self.assertEqual(token["username"], "testuser")
+        self.assertEqual(token["rol"], "Administrador")
+        self.assertFalse(token["is_staff"])
+
+    def test_claims_token_skips_user_query(self):
+        """
+        Asegurar que con un token con claims no se consulta la tabla de usuarios.
+        """
+        self.client.credentials(HTTP_AUTHORIZATION=f"Bearer {self.login()}")
+        with CaptureQueriesContext(connection) as contexto:
+            response = self.client.get(self.url)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(consultas_a_usuarios(contexto), [])
+
+    def test_claims_user_can_create_projects(self):
+        """
+        Asegurar que el usuario construido desde los claims puede crear proyectos como creador.
+        """
+        self.client.credentials(HTTP_AUTHORIZATION=f"Bearer {self.login()}")
+        response = self.client.post(
+            self.url,
+            {
+                "proceso": str(Proceso.objects.create(nombre="Proceso").id),
+                "linea": str(Linea.objects.create(nombre="Linea").id),
+                "tipo": str(Tipo.objects.create(nombre="Tipo").id),
+                "cliente": str(Cliente.objects.create(nombre="Cliente").id),
+                "nombre": "Proyecto",
+                "tarea_tw": "https://example.com/tarea",
+                "desarrollador": "Dev",
+            },
+            format="json",
+        )
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        self.assertEqual(Proyecto.objects.get().creador, self.test_user)
+
+    def test_token_without_claims_uses_cached_lookup(self):
+        """
+        Asegurar que un token sin claims consulta el usuario una vez y luego usa la caché.
+        """
+        token = RefreshToken.for_user(self.test_user).access_token
+        self.client.credentials(HTTP_AUTHORIZATION=f"Bearer {token}")
+
+        with CaptureQueriesContext(connection) as primera:
+            self.assertEqual(self.client.get(self.url).status_code, status.HTTP_200_OK)
+        with CaptureQueriesContext(connection) as segunda:
+            self.assertEqual(self.client.get(self.url).status_code, status.HTTP_200_OK)
+
+        self.assertEqual(len(consultas_a_usuarios(primera)), 1)
+        self.assertEqual(consultas_a_usuarios(segunda), [])
+
+    def test_cached_lookup_stores_only_public_fields(self):
+        """
+        Asegurar que la caché del respaldo guarda solo datos públicos y se invalida al modificar el usuario.
+        """
+        token = RefreshToken.for_user(self.test_user).access_token
+        self.client.credentials(HTTP_AUTHORIZATION=f"Bearer {token}")
+        self.client.get(self.url)
+
+        cache_key = usuario_auth_cache_key(self.test_user.uuid)
+        self.assertEqual(
+            cache.get(cache_key),
+            {
+                "username": "testuser",
+                "rol": "Administrador",
+                "is_staff": False,
+                "is_active": True,
+            },
+        )
+
+        self.test_user.rol = "Consulta"
+        with self.captureOnCommitCallbacks(execute=True):
+            self.test_user.save()
+        self.assertIsNone(cache.get(cache_key))
+        self.client.get(self.url)
+        self.assertEqual(cache.get(cache_key)["rol"], "Consulta")
+
+        with self.captureOnCommitCallbacks(execute=True):
+            User.objects.get(pk=self.test_user.pk).delete()
+        self.assertIsNone(cache.get(cache_key))
+        response = self.client.get(self.url)
+        self.assertEqual(response.status_code, status.HTTP_401_UNAUTHORIZED)
+
+    def test_write_checks_user_in_database(self):
+        """
+        Asegurar que un usuario eliminado puede seguir leyendo con su token con claims, pero no escribir.
+        """
+        self.client.credentials(HTTP_AUTHORIZATION=f"Bearer {self.login()}")
+        User.objects.filter(pk=self.test_user.pk).delete()
+
+        self.assertEqual(self.client.get(self.url).status_code, status.HTTP_200_OK)
+        with CaptureQueriesContext(connection) as contexto:
+            response = self.client.post(self.url, {}, format="json")
+        self.assertEqual(response.status_code, status.HTTP_401_UNAUTHORIZED)
+        self.assertEqual(len(consultas_a_usuarios(contexto)), 1)
+
+    def test_usuario_token_attributes(self):
+        """
+        Asegurar que UsuarioToken expone uuid, pk, username y rol desde el token.
+        """
+        token = RefreshToken.for_user(self.test_user).access_token
+        token["username"] = "testuser"
+        token["rol"] = "Administrador"
+        token["is_staff"] = False
+        usuario = UsuarioToken(token)
+        self.assertEqual(usuario.pk, self.test_user.uuid)
+        self.assertEqual(usuario.username, "testuser")
+        self.assertEqual(usuario.rol, "Administrador")
+        self.assertTrue(usuario.is_authenticated)
+
+
+class AutenticacionPorEndpointTests(APITestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.test_user = User.objects.create_user(
+            username="testuser", email="test@example.com", password="testpassword"
+        )
+
+    def test_server_timing_reports_authenticator(self):
+        """
+        Asegurar que la respuesta indica en Server-Timing qué autenticador se ejecutó.
+        """
+        token = RefreshToken.for_user(self.test_user).access_token
+        self.client.credentials(HTTP_AUTHORIZATION=f"Bearer {token}")
+        response = self.client.get(reverse("usuario-list"))
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertIn('auth;desc="MedidaJWTAuthentication (usuario)"', response["Server-Timing"])
+
+    def test_anonymous_request_runs_single_authenticator(self):
+        """
+        Asegurar que una solicitud sin credenciales solo ejecuta el autenticador del endpoint.
+        """
+        response = self.client.get(reverse("proyecto-list"))
+        self.assertEqual(response.status_code, status.HTTP_401_UNAUTHORIZED)
+        self.assertIn(
+            'auth;desc="ClaimsJWTAuthentication (anonimo)"', response["Server-Timing"]
+        )
+
+    def test_invalid_token_is_reported_as_failed(self):
+        """
+        Asegurar que un token inválido se rechaza y se reporta como autenticación fallida.
+        """
+        self.client.credentials(HTTP_AUTHORIZATION="Bearer invalido")
+        response = self.client.get(reverse("usuario-list"))
+        self.assertEqual(response.status_code, status.HTTP_401_UNAUTHORIZED)
+        self.assertIn("(fallido)", response["Server-Timing"])
+
+    def test_login_runs_no_authenticator(self):
+        """
+        Asegurar que el login no procesa cabeceras de autenticación.
+        """
+        self.client.credentials(HTTP_AUTHORIZATION="Bearer invalido")
+        response = self.client.post(
+            reverse("api-login"),
+            {"username": "testuser", "password": "testpassword"},
+            format="json",
+        )
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertNotIn("Server-Timing", response)
@@ -0,0 +1,83 @@
+from django.contrib.auth import authenticate
+from django.contrib.auth.hashers import identify_hasher, make_password
+from django.test import TestCase, override_settings
+from project_planner.settings.base import PASSWORD_HASHERS
+from usuarios_app.models import Usuario
+
+
+PBKDF2 = "usuarios_app.hashers.ConfigurablePBKDF2PasswordHasher"
+SCRYPT = "usuarios_app.hashers.ConfigurableScryptPasswordHasher"
+MD5 = "django.contrib.auth.hashers.MD5PasswordHasher"
+
+
+@override_settings(PBKDF2_ITERATIONS=1000, SCRYPT_WORK_FACTOR=2**10)
+class HasherPolicyTests(TestCase):
+    def crear_usuario(self, **kwargs):
+        return Usuario.objects.create_user(
+            email="test@test.com", username="testuser", password="securepassword", **kwargs
+        )
+
+    def test_configured_iterations_are_used(self):
+        """
+        Prueba que el hasher PBKDF2 usa las iteraciones definidas en los settings.
+        """
+        with self.settings(PASSWORD_HASHERS=[PBKDF2]):
+            usuario = self.crear_usuario()
+        self.assertTrue(usuario.password.startswith("pbkdf2_sha256$1000$"))
+
+    def test_login_upgrades_algorithm(self):
+        """
+        Prueba que un login exitoso vuelve a calcular el hash con el algoritmo preferido.
+        """
+        with self.settings(PASSWORD_HASHERS=[PBKDF2, SCRYPT]):
+            self.crear_usuario()
+        with self.settings(PASSWORD_HASHERS=[SCRYPT, PBKDF2]):
+            self.assertIsNotNone(authenticate(username="testuser", password="securepassword"))
+            usuario = Usuario.objects.get(username="testuser")
+            self.assertTrue(usuario.password.startswith("scrypt$"))
+            self.assertTrue(usuario.check_password("securepassword"))
+
+    def test_login_upgrades_cost(self):
+        """
+        Prueba que cambiar las iteraciones actualiza el hash en el siguiente login.
+        """
+        with self.settings(PASSWORD_HASHERS=[PBKDF2]):
+            self.crear_usuario()
+            with self.settings(PBKDF2_ITERATIONS=2000):
+                authenticate(username="testuser", password="securepassword")
+        usuario = Usuario.objects.get(username="testuser")
+        self.assertTrue(usuario.password.startswith("pbkdf2_sha256$2000$"))
+
+    def test_failed_login_keeps_hash(self):
+        """
+        Prueba que un login fallido no modifica el hash almacenado.
+        """
+        with self.settings(PASSWORD_HASHERS=[PBKDF2, SCRYPT]):
+            original = self.crear_usuario().password
+        with self.settings(PASSWORD_HASHERS=[SCRYPT, PBKDF2]):
+            self.assertIsNone(authenticate(username="testuser", password="incorrecta"))
+        self.assertEqual(Usuario.objects.get(username="testuser").password, original)
+
+    def test_create_user_with_fast_hasher(self):
+        """
+        Prueba que create_user permite elegir un hasher rápido para datos de prueba.
+        """
+        with self.settings(PASSWORD_HASHERS=[PBKDF2, MD5]):
+            usuario = self.crear_usuario(hasher="md5")
+            self.assertTrue(usuario.password.startswith("md5$"))
+            self.assertTrue(usuario.check_password("securepassword"))
+
+    def test_legacy_django_hash_is_upgraded(self):
+        """
+        Prueba que los hashers por defecto de Django siguen verificando hashes antiguos y
+        que el login los migra al algoritmo preferido.
+        """
+        with self.settings(PASSWORD_HASHERS=PASSWORD_HASHERS):
+            usuario = self.crear_usuario()
+            usuario.password = make_password("securepassword", hasher="pbkdf2_sha1")
+            usuario.save()
+            self.assertIsNotNone(authenticate(username="testuser", password="securepassword"))
+            usuario.refresh_from_db()
+            self.assertEqual(
+                type(identify_hasher(usuario.password)).__module__, "usuarios_app.hashers"
+            )
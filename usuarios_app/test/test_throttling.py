@@ -0,0 +1,181 @@
+from unittest import mock
+from django.conf import settings
+from django.core.cache import caches
+from django.test import override_settings
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.test import APITestCase
+from django.contrib.auth import get_user_model
+from usuarios_app.throttling import LoginIPThrottle
+
+
+User = get_user_model()
+
+CACHES_PRUEBA = {
+    "default": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache"},
+    "login": {
+        "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
+        "LOCATION": "login-throttling-tests",
+    },
+}
+
+
+@override_settings(
+    CACHES=CACHES_PRUEBA,
+    LOGIN_THROTTLE_CACHE="login",
+    LOGIN_MAX_FALLOS_USUARIO=3,
+    LOGIN_MAX_FALLOS_IP=5,
+)
+class LoginThrottlingTests(APITestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.test_user = User.objects.create_user(
+            username="testuser", email="test@example.com", password="testpassword"
+        )
+        cls.url = reverse("api-login")
+
+    def setUp(self):
+        caches["login"].clear()
+
+    def login(self, username="testuser", password="incorrecta", ip="10.0.0.1"):
+        return self.client.post(
+            self.url,
+            {"username": username, "password": password},
+            format="json",
+            REMOTE_ADDR=ip,
+        )
+
+    def test_repeated_failures_block_before_authenticate(self):
+        """
+        Asegurar que tras varios fallos el usuario se bloquea sin ejecutar authenticate().
+        """
+        for _ in range(3):
+            self.assertEqual(self.login().status_code, status.HTTP_400_BAD_REQUEST)
+
+        with mock.patch("usuarios_app.sesion.authenticate") as authenticate:
+            response = self.login(password="testpassword")
+        self.assertEqual(response.status_code, status.HTTP_429_TOO_MANY_REQUESTS)
+        self.assertIn("Retry-After", response)
+        authenticate.assert_not_called()
+
+    def test_user_lockout_does_not_affect_other_ips(self):
+        """
+        Asegurar que los fallos con un usuario desde una IP no bloquean su login desde otra.
+        """
+        for _ in range(3):
+            self.login()
+        self.assertEqual(
+            self.login(password="testpassword").status_code,
+            status.HTTP_429_TOO_MANY_REQUESTS,
+        )
+        self.assertEqual(
+            self.login(password="testpassword", ip="10.0.0.2").status_code,
+            status.HTTP_200_OK,
+        )
+
+    def test_spoofed_forwarded_for_is_ignored(self):
+        """
+        Asegurar que un X-Forwarded-For enviado por el cliente no cambia la IP contada.
+        """
+        for indice in range(5):
+            self.client.post(
+                self.url,
+                {"username": f"usuario{indice}", "password": "incorrecta"},
+                format="json",
+                REMOTE_ADDR="10.0.0.1",
+                HTTP_X_FORWARDED_FOR=f"192.0.2.{indice}",
+            )
+        response = self.client.post(
+            self.url,
+            {"username": "testuser", "password": "testpassword"},
+            format="json",
+            REMOTE_ADDR="10.0.0.1",
+            HTTP_X_FORWARDED_FOR="192.0.2.99",
+        )
+        self.assertEqual(response.status_code, status.HTTP_429_TOO_MANY_REQUESTS)
+
+    def test_proxy_address_is_taken_from_the_end(self):
+        """
+        Asegurar que detrás de un proxy se usa la IP que agregó el proxy y no las anteriores.
+        """
+        rest_framework = {**settings.REST_FRAMEWORK, "NUM_PROXIES": 1}
+        with override_settings(REST_FRAMEWORK=rest_framework):
+            for indice in range(3):
+                self.client.post(
+                    self.url,
+                    {"username": "testuser", "password": "incorrecta"},
+                    format="json",
+                    REMOTE_ADDR="10.0.0.254",
+                    HTTP_X_FORWARDED_FOR=f"192.0.2.{indice}, 203.0.113.7",
+                )
+            bloqueado = self.client.post(
+                self.url,
+                {"username": "testuser", "password": "testpassword"},
+                format="json",
+                REMOTE_ADDR="10.0.0.254",
+                HTTP_X_FORWARDED_FOR="192.0.2.50, 203.0.113.7",
+            )
+            otra_ip = self.client.post(
+                self.url,
+                {"username": "testuser", "password": "testpassword"},
+                format="json",
+                REMOTE_ADDR="10.0.0.254",
+                HTTP_X_FORWARDED_FOR="203.0.113.8",
+            )
+        self.assertEqual(bloqueado.status_code, status.HTTP_429_TOO_MANY_REQUESTS)
+        self.assertEqual(otra_ip.status_code, status.HTTP_200_OK)
+
+    def test_failures_from_one_ip_block_other_users(self):
+        """
+        Asegurar que muchos fallos desde una IP bloquean esa IP para cualquier usuario.
+        """
+        for indice in range(5):
+            self.login(username=f"usuario{indice}")
+        response = self.login(password="testpassword")
+        self.assertEqual(response.status_code, status.HTTP_429_TOO_MANY_REQUESTS)
+        self.assertEqual(
+            self.login(password="testpassword", ip="10.0.0.9").status_code,
+            status.HTTP_200_OK,
+        )
+
+    def test_successful_login_resets_user_failures(self):
+        """
+        Asegurar que un login exitoso reinicia los fallos del usuario.
+        """
+        self.login()
+        self.login()
+        self.assertEqual(self.login(password="testpassword").status_code, status.HTTP_200_OK)
+        self.login()
+        self.login()
+        self.assertEqual(self.login(password="testpassword").status_code, status.HTTP_200_OK)
+
+    def test_ip_rate_limit(self):
+        """
+        Asegurar que se limita el número de intentos por IP.
+        """
+        with mock.patch.object(LoginIPThrottle, "rate", "2/min", create=True):
+            self.login(password="testpassword")
+            self.login(password="testpassword")
+            response = self.login(password="testpassword")
+        self.assertEqual(response.status_code, status.HTTP_429_TOO_MANY_REQUESTS)
+
+    def test_rejection_counters(self):
+        """
+        Asegurar que los rechazos se cuentan por motivo y que solo staff puede consultarlos.
+        """
+        for _ in range(4):
+            self.login()
+
+        url = reverse("api-login-rechazos")
+        self.client.force_authenticate(user=self.test_user)
+        self.assertEqual(self.client.get(url).status_code, status.HTTP_403_FORBIDDEN)
+
+        staff = User.objects.create_user(
+            username="staff", email="staff@example.com", password="x", is_staff=True
+        )
+        self.client.force_authenticate(user=staff)
+        response = self.client.get(url)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(
+            response.data, {"limite_ip": 0, "usuario_bloqueado": 1, "ip_bloqueada": 0}
+        )
@@ -92,3 +92,77 @@ class UsuarioAPITests(APITestCase):
         self.assertTrue(
             (now - fecha_creacion).seconds < 60, "La fecha de creación no es reciente."
         )
+
+    def test_list_usuarios_is_paginated(self):
+        """
+        Asegurar que el listado de usuarios se entrega paginado por cursor.
+        """
+        for i in range(3):
+            User.objects.create_user(
+                username=f"usuario{i}", email=f"usuario{i}@example.com", password="x"
+            )
+        self.login()
+        response = self.client.get(self.url, {"page_size": 2})
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(len(response.data["results"]), 2)
+        self.assertIsNotNone(response.data["next"])
+
+
+class UsuarioBusquedaTests(APITestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.test_user = User.objects.create_user(
+            username="testuser",
+            email="test@example.com",
+            password="testpassword",
+            nombre="Laura",
+            apellido="Restrepo",
+        )
+        cls.otro = User.objects.create_user(
+            username="otro",
+            email="carlos.ruiz@empresa.co",
+            password="testpassword",
+            nombre="Carlos",
+            apellido="Ruiz",
+        )
+        cls.url = reverse("usuario-buscar")
+
+    def setUp(self):
+        self.client.force_authenticate(user=self.test_user)
+
+    def buscar(self, texto):
+        response = self.client.get(self.url, {"q": texto})
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        return [resultado["email"] for resultado in response.data]
+
+    def test_search_name_and_email(self):
+        """
+        Asegurar que se busca en el nombre, el apellido y el email.
+        """
+        self.assertEqual(self.buscar("laura"), ["test@example.com"])
+        self.assertEqual(self.buscar("strep"), ["test@example.com"])
+        self.assertEqual(self.buscar("empresa.co"), ["carlos.ruiz@empresa.co"])
+
+        response = self.client.get(self.url, {"q": "carlos"})
+        self.assertEqual(
+            set(response.data[0]), {"uuid", "nombre", "apellido", "email", "relevancia"}
+        )
+
+    def test_follows_changes(self):
+        """
+        Asegurar que la búsqueda refleja las ediciones y las eliminaciones de usuarios.
+        """
+        self.otro.apellido = "Ospina"
+        self.otro.save()
+        self.assertEqual(self.buscar("ruiz@"), ["carlos.ruiz@empresa.co"])
+        self.assertEqual(self.buscar("ospina"), ["carlos.ruiz@empresa.co"])
+
+        self.otro.delete()
+        self.assertEqual(self.buscar("carlos"), [])
+
+    def test_short_query_is_rejected(self):
+        """
+        Asegurar que una búsqueda de menos de 3 caracteres devuelve 400.
+        """
+        response = self.client.get(self.url, {"q": "la"})
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
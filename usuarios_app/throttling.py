@@ -0,0 +1,108 @@
+"""
+Protección del login contra ráfagas de intentos (p. ej. credential stuffing).
+
+Se aplican dos mecanismos, ambos sobre la caché indicada en LOGIN_THROTTLE_CACHE:
+
+- LoginIPThrottle: límite de intentos por IP (tasa "login_ip" de DEFAULT_THROTTLE_RATES).
+- FallosLogin: cuenta credenciales incorrectas por usuario e IP y por IP, y bloquea
+  nuevos intentos antes de ejecutar authenticate(), de modo que los intentos repetidos no
+  consumen tiempo de CPU calculando hashes.
+
+La IP es la que devuelve get_ident() de DRF según NUM_PROXIES (ver settings): sin proxies
+de confianza se usa REMOTE_ADDR, de modo que un X-Forwarded-For falso no cambia la IP.
+
+Cada rechazo incrementa un contador por motivo (ver contadores_rechazos).
+"""
+
+from django.conf import settings
+from django.core.cache import caches
+from rest_framework.throttling import SimpleRateThrottle
+
+MOTIVOS_RECHAZO = ("limite_ip", "usuario_bloqueado", "ip_bloqueada")
+
+
+def cache_login():
+    return caches[settings.LOGIN_THROTTLE_CACHE]
+
+
+def incrementar(clave, timeout=None):
+    """
+    Incrementa un contador de la caché de forma atómica, creándolo si no existe.
+    """
+    cache = cache_login()
+    cache.add(clave, 0, timeout)
+    try:
+        return cache.incr(clave)
+    except ValueError:
+        # La clave expiró entre add() e incr().
+        cache.set(clave, 1, timeout)
+        return 1
+
+
+def registrar_rechazo(motivo):
+    incrementar(f"login:rechazos:{motivo}")
+
+
+def contadores_rechazos():
+    """
+    Devuelve el número de intentos de login rechazados por cada motivo.
+    """
+    valores = cache_login().get_many([f"login:rechazos:{m}" for m in MOTIVOS_RECHAZO])
+    return {m: valores.get(f"login:rechazos:{m}", 0) for m in MOTIVOS_RECHAZO}
+
+
+class LoginIPThrottle(SimpleRateThrottle):
+    """
+    Limita los intentos de login por dirección IP.
+    """
+
+    scope = "login_ip"
+
+    @property
+    def cache(self):
+        return cache_login()
+
+    def get_cache_key(self, request, view):
+        return self.cache_format % {"scope": self.scope, "ident": self.get_ident(request)}
+
+    def throttle_failure(self):
+        registrar_rechazo("limite_ip")
+        return False
+
+
+class FallosLogin:
+    """
+    Registro de credenciales incorrectas por usuario e IP y por IP.
+
+    Tras LOGIN_MAX_FALLOS_USUARIO fallos para un usuario desde una IP, se rechazan los
+    intentos de ese usuario desde esa IP; tras LOGIN_MAX_FALLOS_IP fallos desde una IP, los
+    de cualquier usuario desde ella. El bloqueo dura LOGIN_BLOQUEO_SEGUNDOS contados desde
+    el primer fallo. El bloqueo del usuario no se aplica a otras IPs, para que nadie pueda
+    impedir el acceso de otro usuario fallando a propósito con su nombre. Un login exitoso
+    reinicia el contador del usuario en esa IP.
+    """
+
+    def __init__(self, request, username):
+        self.ip = LoginIPThrottle().get_ident(request)
+        self.clave_usuario = (
+            f"login:fallos:usuario:{str(username or '').lower()}:ip:{self.ip}"
+        )
+        self.clave_ip = f"login:fallos:ip:{self.ip}"
+
+    def motivo_bloqueo(self):
+        """
+        Devuelve el motivo por el que el intento debe rechazarse, o None si puede continuar.
+        """
+        fallos = cache_login().get_many([self.clave_usuario, self.clave_ip])
+        if fallos.get(self.clave_usuario, 0) >= settings.LOGIN_MAX_FALLOS_USUARIO:
+            return "usuario_bloqueado"
+        if fallos.get(self.clave_ip, 0) >= settings.LOGIN_MAX_FALLOS_IP:
+            return "ip_bloqueada"
+        return None
+
+    def registrar_fallo(self):
+        incrementar(self.clave_usuario, settings.LOGIN_BLOQUEO_SEGUNDOS)
+        incrementar(self.clave_ip, settings.LOGIN_BLOQUEO_SEGUNDOS)
+
+    def reiniciar(self):
+        cache_login().delete(self.clave_usuario)
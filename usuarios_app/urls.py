@@ -1,7 +1,7 @@
 # usuarios_app/urls.py
 from django.urls import path, include
 from rest_framework.routers import DefaultRouter
-from .sesion import LoginView
+from .sesion import LoginView, LoginRechazosView
 from .views import UsuarioViewSet
 
 router = DefaultRouter()
@@ -9,5 +9,6 @@ router.register(r"usuarios", UsuarioViewSet, basename="usuario")
 
 urlpatterns = [
     path("login/", LoginView.as_view(), name="api-login"),
+    path("login/rechazos/", LoginRechazosView.as_view(), name="api-login-rechazos"),
     path("", include(router.urls)),
 ]
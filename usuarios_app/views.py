@@ -2,17 +2,34 @@ from django.shortcuts import render
 
 # usuarios_app/views.py
 from rest_framework import viewsets
+from rest_framework.decorators import action
+from rest_framework.response import Response
+from .busqueda import INDICE_USUARIOS
 from .models import Usuario
 from .serializers import UsuarioSerializer
 
-from rest_framework.decorators import authentication_classes, permission_classes
-from rest_framework_simplejwt.authentication import JWTAuthentication
 from rest_framework.permissions import IsAuthenticated
-
-@authentication_classes([JWTAuthentication])
-@permission_classes([IsAuthenticated])
+from project_planner.busqueda import buscar_desde_parametros
+from project_planner.pagination import FechaCreacionCursorPagination
+from .autenticacion import MedidaJWTAuthentication
 
 
 class UsuarioViewSet(viewsets.ModelViewSet):
+    authentication_classes = [MedidaJWTAuthentication]
+    permission_classes = [IsAuthenticated]
     queryset = Usuario.objects.all()
     serializer_class = UsuarioSerializer
+    pagination_class = FechaCreacionCursorPagination
+
+    @action(detail=False, methods=["get"])
+    def buscar(self, request):
+        """
+        Búsqueda para autocompletar: ``?q=`` (al menos 3 caracteres) sobre el nombre, el
+        apellido y el email, con ``?limite=`` resultados (por defecto 20, máximo 100).
+        """
+        resultados = buscar_desde_parametros(
+            INDICE_USUARIOS,
+            request.query_params,
+            ("uuid", "nombre", "apellido", "email"),
+        )
+        return Response(resultados)